@@ -0,0 +1,82 @@
+"""add unique natural key to congressional_trades for bulk upserts
+
+Revision ID: 3c7e1a9d2b40
+Revises: f095fc199c74
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c7e1a9d2b40'
+down_revision = 'f095fc199c74'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Remove existing duplicates (keeping the earliest row by created_at, id)
+    # so the unique constraint can be created; ingestion previously
+    # de-duplicated with a per-row SELECT which could race between concurrent
+    # imports. Rows referencing a duplicate are moved to the kept row first.
+    op.execute("""
+        CREATE TEMPORARY TABLE congressional_trade_duplicates AS
+        SELECT id AS duplicate_id, keep_id
+        FROM (
+            SELECT id, first_value(id) OVER (
+                PARTITION BY doc_id, member_id, transaction_date, raw_asset_description
+                ORDER BY created_at, id
+            ) AS keep_id
+            FROM congressional_trades
+            WHERE doc_id IS NOT NULL AND member_id IS NOT NULL
+              AND transaction_date IS NOT NULL AND raw_asset_description IS NOT NULL
+        ) ranked
+        WHERE id <> keep_id
+    """)
+    # trade_discussions allows one discussion per trade: within each group keep
+    # the kept trade's own discussion, else the earliest, and drop the rest
+    op.execute("""
+        DELETE FROM trade_discussions td
+        USING (
+            SELECT d.id, row_number() OVER (
+                PARTITION BY COALESCE(m.keep_id, d.trade_id)
+                ORDER BY m.keep_id IS NOT NULL, d.created_at, d.id
+            ) AS rn
+            FROM trade_discussions d
+            LEFT JOIN congressional_trade_duplicates m ON m.duplicate_id = d.trade_id
+            WHERE d.trade_id IN (
+                SELECT duplicate_id FROM congressional_trade_duplicates
+                UNION SELECT keep_id FROM congressional_trade_duplicates
+            )
+        ) ranked
+        WHERE td.id = ranked.id AND ranked.rn > 1
+    """)
+    op.execute("""
+        UPDATE trade_discussions td
+        SET trade_id = m.keep_id
+        FROM congressional_trade_duplicates m
+        WHERE td.trade_id = m.duplicate_id
+    """)
+    op.execute("""
+        UPDATE notification_deliveries n
+        SET trade_id = m.keep_id
+        FROM congressional_trade_duplicates m
+        WHERE n.trade_id = m.duplicate_id
+    """)
+    op.execute("""
+        DELETE FROM congressional_trades t
+        USING congressional_trade_duplicates m
+        WHERE t.id = m.duplicate_id
+    """)
+    op.execute("DROP TABLE congressional_trade_duplicates")
+    op.create_unique_constraint(
+        'unique_congressional_trade_natural_key',
+        'congressional_trades',
+        ['doc_id', 'member_id', 'transaction_date', 'raw_asset_description']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('unique_congressional_trade_natural_key', 'congressional_trades', type_='unique')
@@ -0,0 +1,39 @@
+"""add congressional_import_progress table for resumable CSV imports
+
+Revision ID: 7d2e5b8c1f63
+Revises: 3c7e1a9d2b40
+Create Date: 2026-10-16 11:04:27.905113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2e5b8c1f63'
+down_revision = '3c7e1a9d2b40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('congressional_import_progress',
+    sa.Column('file_hash', sa.String(length=64), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=False),
+    sa.Column('file_size', sa.BigInteger(), nullable=False),
+    sa.Column('byte_offset', sa.BigInteger(), nullable=False),
+    sa.Column('records_read', sa.Integer(), nullable=False),
+    sa.Column('last_batch', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('file_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('congressional_import_progress')
@@ -0,0 +1,47 @@
+"""add congressional_filing_manifest table for incremental PTR sync
+
+Revision ID: 9b4f2e6a8d15
+Revises: 7d2e5b8c1f63
+Create Date: 2026-10-16 14:22:51.318406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4f2e6a8d15'
+down_revision = '7d2e5b8c1f63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('congressional_filing_manifest',
+    sa.Column('doc_id', sa.String(length=50), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('filing_type', sa.String(length=5), nullable=True),
+    sa.Column('filing_date', sa.Date(), nullable=True),
+    sa.Column('prefix', sa.String(length=20), nullable=True),
+    sa.Column('first_name', sa.String(length=100), nullable=True),
+    sa.Column('last_name', sa.String(length=100), nullable=True),
+    sa.Column('suffix', sa.String(length=20), nullable=True),
+    sa.Column('state_district', sa.String(length=10), nullable=True),
+    sa.Column('entry_hash', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('trades_found', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('doc_id')
+    )
+    op.create_index('idx_filing_manifest_year_status', 'congressional_filing_manifest', ['year', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_filing_manifest_year_status', table_name='congressional_filing_manifest')
+    op.drop_table('congressional_filing_manifest')
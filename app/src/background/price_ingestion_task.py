@@ -101,20 +101,24 @@ class PriceIngestionTask:
                 securities = await self._get_active_securities(session)
                 logger.info(f"Found {len(securities)} active securities")
                 
-                # Fetch prices in batches
+                # Fetch all prices up front: grouped provider requests, per-ticker fallback
+                all_price_data = await self.fetcher.fetch_batch_prices(
+                    [sec.ticker for sec in securities], target_date, max_concurrent=10
+                )
+                
+                # Store prices in batches
                 batch_size = 50
                 total_records = 0
                 errors = 0
                 
                 for i in range(0, len(securities), batch_size):
                     batch = securities[i:i + batch_size]
-                    tickers = [sec.ticker for sec in batch]
                     
                     try:
-                        # Fetch batch prices
-                        price_data_dict = await self.fetcher.fetch_batch_prices(
-                            tickers, target_date, max_concurrent=10
-                        )
+                        price_data_dict = {
+                            sec.ticker: all_price_data[sec.ticker]
+                            for sec in batch if sec.ticker in all_price_data
+                        }
                         
                         # Create price records
                         for ticker, price_data in price_data_dict.items():
@@ -191,7 +195,9 @@ class PriceIngestionTask:
         
         async with await self._get_session() as session:
             try:
-                backfiller = HistoricalDataBackfiller(session)
+                backfiller = HistoricalDataBackfiller(
+                    session, fetcher=self.fetcher, session_factory=self.session_factory
+                )
                 result = await backfiller.backfill_all_securities(
                     start_date, end_date, batch_size
                 )
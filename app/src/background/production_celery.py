@@ -37,6 +37,7 @@ celery_app.conf.update(
     # Task routing
     task_routes={
         'background.tasks.process_new_trade_notifications': {'queue': 'notifications'},
+        'background.tasks.process_new_trade_notifications_batch': {'queue': 'notifications'},
         'background.tasks.sync_congressional_trades': {'queue': 'data_ingestion'},
         'background.tasks.sync_congressional_members': {'queue': 'data_ingestion'},
         'background.tasks.comprehensive_data_ingestion': {'queue': 'data_ingestion'},
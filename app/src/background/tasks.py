@@ -19,6 +19,8 @@ from domains.congressional.crud import (
     MemberPortfolioRepository, MemberPortfolioPerformanceRepository
 )
 from domains.congressional.ingestion import CongressionalDataIngestion
+from domains.congressional.house_sync import sync_house_ptrs
+from domains.congressional.senate_sync import sync_senate_ptrs
 from domains.securities.ingestion import (
     populate_securities_from_major_indices,
     ingest_price_data_for_all_securities
@@ -364,8 +366,13 @@ def sync_congressional_trades(self, date_from: Optional[str] = None):
     """
     Sync congressional trading data from external sources.
     
+    Diffs each House yearly FD index and the Senate eFD search against the
+    stored filing manifest and downloads/parses only new or amended PTRs.
+    
     Args:
-        date_from: ISO date string to sync from (defaults to yesterday)
+        date_from: ISO date string to sync from (defaults to yesterday); every
+            House filing year from date_from's year to the current year is
+            synced, and Senate reports filed since date_from
     """
     try:
         logger.info(f"Starting congressional trades synchronization: date_from={date_from}")
@@ -374,15 +381,15 @@ def sync_congressional_trades(self, date_from: Optional[str] = None):
             date_from = (datetime.utcnow() - timedelta(days=1)).isoformat()
             logger.debug(f"No date_from specified, using yesterday: date_from={date_from}")
         
-        # TODO: Implement actual data synchronization logic
-        # This would typically involve:
-        # 1. Fetching data from external APIs (House/Senate disclosure sites)
-        # 2. Parsing PDF files or structured data
-        # 3. Normalizing and validating the data
-        # 4. Storing in database with proper conflict resolution
+        first_year = datetime.fromisoformat(date_from).year
+        years = list(range(first_year, datetime.utcnow().year + 1))
+        house_results = sync_house_ptrs(years)
+        senate_results = sync_senate_ptrs(datetime.fromisoformat(date_from).date())
+        records_processed = sum(result['trades_found'] for result in house_results.values()) + senate_results['trades_found']
+        results = {"house": house_results, "senate": senate_results}
         
-        logger.info(f"Congressional trades sync completed: date_from={date_from}, records_processed=0")
-        return {"status": "success", "date_from": date_from, "records_processed": 0}
+        logger.info(f"Congressional trades sync completed: date_from={date_from}, records_processed={records_processed}, results={results}")
+        return {"status": "success", "date_from": date_from, "records_processed": records_processed, "results": results}
         
     except Exception as exc:
         logger.error(f"Congressional trades sync failed: date_from={date_from}, error={str(exc)}", exc_info=True)
@@ -583,6 +590,64 @@ def process_new_trade_notifications(self, doc_id: str, member_id: str, transacti
         raise self.retry(exc=exc, countdown=300, max_retries=3)
 
 
+@celery_app.task(base=DatabaseTask, bind=True)
+def process_new_trade_notifications_batch(self, trade_ids: List[str]):
+    """
+    Process notifications for a set of newly inserted trades in one pass.
+    
+    Queued once per ingestion commit instead of once per trade: the trades are
+    loaded with a single query by primary key and alert rules are evaluated for
+    the whole set together.
+    
+    Args:
+        trade_ids: IDs (UUID strings) of the inserted trades
+    """
+    try:
+        logger.info(f"Processing notifications for {len(trade_ids)} new trades")
+        
+        from uuid import UUID
+        from domains.congressional.models import CongressionalTrade
+        from domains.congressional.schemas import CongressionalTradeDetail
+        from domains.notifications.trade_detection import TradeDetectionService
+        
+        trade_uuids = [UUID(trade_id) if isinstance(trade_id, str) else trade_id for trade_id in trade_ids]
+        
+        # Use sync session for Celery tasks
+        with get_sync_db_session() as session:
+            trades = session.query(CongressionalTrade).filter(
+                CongressionalTrade.id.in_(trade_uuids)
+            ).all()
+            trade_details = [CongressionalTradeDetail.from_orm(trade) for trade in trades]
+        
+        missing = len(trade_uuids) - len(trade_details)
+        if missing:
+            logger.warning(f"{missing} of {len(trade_uuids)} trades not found for notification processing")
+        if not trade_details:
+            return {"status": "error", "message": "Trades not found"}
+        
+        async def process_notifications():
+            """Process notifications asynchronously."""
+            db_manager_instance = DatabaseManager()
+            await db_manager_instance.initialize()
+            
+            try:
+                async with db_manager_instance.session_factory() as async_session:
+                    detection_service = TradeDetectionService(async_session)
+                    return await detection_service.batch_process_trades(trade_details)
+            finally:
+                await db_manager_instance.close()
+        
+        result = run_async_task(process_notifications())
+        
+        logger.info(f"Notifications processed for {len(trade_details)} trades: "
+                    f"{result['total_notifications']} sent, {len(result['errors'])} errors")
+        return {"status": "success", "result": result}
+        
+    except Exception as exc:
+        logger.error(f"Error processing notifications for {len(trade_ids)} trades: {exc}", exc_info=True)
+        raise self.retry(exc=exc, countdown=300, max_retries=3)
+
+
 @celery_app.task(base=DatabaseTask, bind=True)
 def generate_analytics_report(self, report_type: str = "daily"):
     """
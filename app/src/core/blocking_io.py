@@ -0,0 +1,169 @@
+"""
+Thread pool for blocking provider I/O called from async code.
+
+Client libraries without an async API (yfinance) block the calling thread for
+the whole HTTP round trip. Awaiting them directly inside a coroutine stalls the
+event loop, so "concurrent" fetches actually run one at a time. BlockingCallPool
+runs such calls on a dedicated, fixed-size thread pool and awaits the result,
+keeping the loop free and bounding provider parallelism to the pool size.
+
+The pool tracks its own saturation (calls that had to queue for a worker and how
+long they waited) and exports it as Prometheus metrics when prometheus_client is
+installed.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import logging
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+DEFAULT_POOL_SIZE = 16
+
+if PROMETHEUS_AVAILABLE:
+    _POOL_ACTIVE = Gauge(
+        'capitolscope_blocking_pool_active_threads', 'Blocking calls running on the pool', ['pool']
+    )
+    _POOL_QUEUED = Gauge(
+        'capitolscope_blocking_pool_queued_calls', 'Blocking calls waiting for a pool thread', ['pool']
+    )
+    _POOL_SATURATED = Counter(
+        'capitolscope_blocking_pool_saturated_total', 'Calls submitted while every pool thread was busy', ['pool']
+    )
+    _POOL_WAIT = Histogram(
+        'capitolscope_blocking_pool_wait_seconds', 'Time calls waited for a pool thread', ['pool']
+    )
+
+
+class BlockingCallPool:
+    """
+    Fixed-size thread pool for blocking calls, awaited from coroutines.
+
+    await pool.run(func, *args, **kwargs) runs func on a pool thread. At most
+    max_workers calls run at once; further calls queue, and are counted as
+    saturated submissions.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_POOL_SIZE, name: str = "provider"):
+        self.max_workers = max_workers
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-io")
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.peak_active = 0
+        self.submitted = 0
+        self.completed = 0
+        self.saturated = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable on the pool and return its result (or raise its exception)."""
+        loop = asyncio.get_running_loop()
+        submitted_at = time.monotonic()
+        with self._lock:
+            self.submitted += 1
+            saturated = self.active + self.queued >= self.max_workers
+            self.queued += 1
+            if saturated:
+                self.saturated += 1
+        if PROMETHEUS_AVAILABLE:
+            _POOL_QUEUED.labels(self.name).inc()
+            if saturated:
+                _POOL_SATURATED.labels(self.name).inc()
+
+        # Set once the call leaves the queue: when a thread picks it up, or when
+        # the awaiting task is cancelled before that (the call then never runs)
+        dequeued = [False]
+        call = functools.partial(func, *args, **kwargs)
+        try:
+            return await loop.run_in_executor(self._executor, self._tracked, call, submitted_at, dequeued)
+        finally:
+            self._dequeue(dequeued)
+
+    def _dequeue(self, dequeued: list) -> bool:
+        """Take a call off the queued count exactly once; False if it was already taken off."""
+        with self._lock:
+            if dequeued[0]:
+                return False
+            dequeued[0] = True
+            self.queued -= 1
+        if PROMETHEUS_AVAILABLE:
+            _POOL_QUEUED.labels(self.name).dec()
+        return True
+
+    def _tracked(self, call: Callable[[], Any], submitted_at: float, dequeued: list) -> Any:
+        """Runs on a pool thread: update counters around the call."""
+        wait = time.monotonic() - submitted_at
+        self._dequeue(dequeued)
+        with self._lock:
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        if PROMETHEUS_AVAILABLE:
+            _POOL_ACTIVE.labels(self.name).inc()
+            _POOL_WAIT.labels(self.name).observe(wait)
+        try:
+            return call()
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+            if PROMETHEUS_AVAILABLE:
+                _POOL_ACTIVE.labels(self.name).dec()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool usage and saturation."""
+        with self._lock:
+            started = self.completed + self.active
+            return {
+                'pool': self.name,
+                'max_workers': self.max_workers,
+                'active': self.active,
+                'queued': self.queued,
+                'peak_active': self.peak_active,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'saturated': self.saturated,
+                'saturation_ratio': self.saturated / self.submitted if self.submitted else 0.0,
+                'avg_wait_seconds': self.total_wait / started if started else 0.0,
+                'max_wait_seconds': self.max_wait,
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+
+_provider_pool: Optional[BlockingCallPool] = None
+_provider_pool_lock = threading.Lock()
+
+
+def get_provider_pool() -> BlockingCallPool:
+    """Process-wide pool for blocking market data provider calls, sized from settings."""
+    global _provider_pool
+    if _provider_pool is None:
+        with _provider_pool_lock:
+            if _provider_pool is None:
+                from core.config import settings
+
+                _provider_pool = BlockingCallPool(settings.PROVIDER_THREAD_POOL_SIZE, name="provider")
+                logger.info(f"Provider thread pool started with {_provider_pool.max_workers} threads")
+    return _provider_pool
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking provider call on the shared provider pool."""
+    return await get_provider_pool().run(func, *args, **kwargs)
@@ -117,6 +117,12 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = Field(True, description="Enable rate limiting")
     RATE_LIMIT_REQUESTS: int = Field(100, description="Rate limit requests per minute")
     RATE_LIMIT_WINDOW: int = Field(60, description="Rate limit window in seconds")
+    DOWNLOAD_RATE_LIMIT_SHARED: bool = Field(True, description="Share adaptive download rate limits across workers via Redis")
+    DOWNLOAD_RATE_INITIAL: float = Field(0.5, description="Starting request rate per host for adaptive download limiting (req/s)")
+    DOWNLOAD_RATE_MIN: float = Field(0.05, description="Floor of the adaptive download rate per host (req/s)")
+    DOWNLOAD_RATE_MAX: float = Field(5.0, description="Ceiling of the adaptive download rate per host (req/s)")
+    PRICE_RATE_LIMIT_SHARED: bool = Field(True, description="Share price source request budgets across workers via Redis")
+    PROVIDER_THREAD_POOL_SIZE: int = Field(16, description="Threads for blocking market data provider calls (yfinance)")
     
     # Caching
     CACHE_TTL: int = Field(300, description="Cache TTL in seconds")
@@ -101,6 +101,32 @@ class DatabaseManager:
             logger.error(f"Failed to initialize database connection: {e}")
             raise
     
+    def initialize_sync(self) -> None:
+        """
+        Initialize only the synchronous engine and session factory.
+
+        Used by worker processes (e.g. parallel CSV import) that never touch the
+        async engine and must not inherit connections from a parent process.
+        """
+        if self.sync_session_factory is not None:
+            return
+
+        sync_url = settings.database_url.replace("+asyncpg://", "://")
+        self.sync_engine = create_engine(
+            sync_url,
+            echo=settings.DATABASE_ECHO,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+        )
+        self.sync_session_factory = sessionmaker(
+            bind=self.sync_engine,
+            class_=Session,
+            expire_on_commit=False,
+            autoflush=True,
+            autocommit=False,
+        )
+        logger.info("Synchronous database engine initialized")
+
     async def close(self) -> None:
         """Close database engine and all connections."""
         if self.engine:
@@ -0,0 +1,392 @@
+"""
+Adaptive (AIMD) token-bucket rate limiting for outbound downloads.
+
+Each host gets a token bucket refilled at a request rate that adapts to the
+server's responses: every success raises the rate additively, and a 403/429
+cuts it multiplicatively (at most once per backoff window, so a burst of
+throttled in-flight requests counts as one signal) and empties the bucket.
+The rate settles just below what the host tolerates.
+
+Bucket state can live in process memory or in Redis (the Celery broker), so
+concurrent tasks and worker processes draw from one budget per host.
+
+Fixed request budgets (N requests per window, e.g. a provider's API quota) use
+GCRA: a single theoretical arrival time per key, so admission is O(1) in
+memory or one Lua call in Redis, and the wait until the next free slot is
+exact.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import logging
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+# HTTP statuses a host uses to say "slow down"
+THROTTLE_STATUS_CODES = frozenset({403, 429})
+
+# Idle per-host state expires from Redis after this many seconds
+STATE_TTL_SECONDS = 24 * 60 * 60
+
+REDIS_KEY_PREFIX = "capitolscope:ratelimit:"
+
+
+@dataclass
+class AIMDConfig:
+    """Rate adaptation parameters (rates in requests per second)."""
+    initial_rate: float = 0.5
+    min_rate: float = 0.05
+    max_rate: float = 5.0
+    additive_increase: float = 0.02
+    multiplicative_decrease: float = 0.5
+    burst: float = 1.0
+    backoff_window: float = 5.0
+
+
+class LocalRateLimitBackend:
+    """Per-host bucket state in process memory, shared by the threads and tasks of one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, float]] = {}
+
+    def _host_state(self, host: str, config: AIMDConfig, now: float) -> Dict[str, float]:
+        state = self._state.get(host)
+        if state is None:
+            state = {'tokens': config.burst, 'ts': now, 'rate': config.initial_rate, 'backoff_ts': 0.0}
+            self._state[host] = state
+        return state
+
+    def acquire(self, host: str, config: AIMDConfig) -> float:
+        """Take a token if one is available; returns 0, or the seconds to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._host_state(host, config, now)
+            tokens = min(config.burst, state['tokens'] + max(0.0, now - state['ts']) * state['rate'])
+            state['ts'] = now
+            if tokens >= 1:
+                state['tokens'] = tokens - 1
+                return 0.0
+            state['tokens'] = tokens
+            return (1 - tokens) / state['rate']
+
+    def feedback(self, host: str, config: AIMDConfig, throttled: bool, retry_after: float = 0.0) -> float:
+        """Apply a response outcome to the host's rate; returns the new rate."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._host_state(host, config, now)
+            if throttled:
+                if now - state['backoff_ts'] >= config.backoff_window:
+                    state['rate'] = max(config.min_rate, state['rate'] * config.multiplicative_decrease)
+                    state['backoff_ts'] = now
+                    # Empty the bucket (and go into debt for Retry-After) so every caller pauses
+                    state['tokens'] = -retry_after * state['rate']
+                    state['ts'] = now
+            else:
+                state['rate'] = min(config.max_rate, state['rate'] + config.additive_increase)
+            return state['rate']
+
+    def rate(self, host: str, config: AIMDConfig) -> float:
+        with self._lock:
+            state = self._state.get(host)
+            return state['rate'] if state else config.initial_rate
+
+
+# Both scripts use the Redis server clock so every worker sees the same time.
+# legacy/ingestion/rate_limiter.py loads this module by path and runs the same
+# scripts (with redis.asyncio), so these are the only copies.
+REDIS_ACQUIRE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local initial_rate, burst, ttl = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'rate')
+local rate = tonumber(state[3]) or initial_rate
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now, 'rate', rate)
+redis.call('EXPIRE', KEYS[1], ttl)
+return tostring(wait)
+"""
+
+REDIS_FEEDBACK_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local throttled = ARGV[1] == '1'
+local initial_rate, min_rate, max_rate = tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+local increase, decrease, window = tonumber(ARGV[5]), tonumber(ARGV[6]), tonumber(ARGV[7])
+local retry_after, ttl = tonumber(ARGV[8]), tonumber(ARGV[9])
+local state = redis.call('HMGET', KEYS[1], 'rate', 'backoff_ts')
+local rate = tonumber(state[1]) or initial_rate
+if throttled then
+    local backoff_ts = tonumber(state[2]) or 0
+    if now - backoff_ts >= window then
+        rate = math.max(min_rate, rate * decrease)
+        redis.call('HSET', KEYS[1], 'rate', rate, 'backoff_ts', now, 'tokens', -retry_after * rate, 'ts', now)
+    end
+else
+    rate = math.min(max_rate, rate + increase)
+    redis.call('HSET', KEYS[1], 'rate', rate)
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+return tostring(rate)
+"""
+
+
+def acquire_script_args(config: AIMDConfig) -> list:
+    """ARGV of REDIS_ACQUIRE_SCRIPT."""
+    return [config.initial_rate, config.burst, STATE_TTL_SECONDS]
+
+
+def feedback_script_args(config: AIMDConfig, throttled: bool, retry_after: float = 0.0) -> list:
+    """ARGV of REDIS_FEEDBACK_SCRIPT."""
+    return [
+        1 if throttled else 0, config.initial_rate, config.min_rate, config.max_rate,
+        config.additive_increase, config.multiplicative_decrease, config.backoff_window,
+        retry_after, STATE_TTL_SECONDS,
+    ]
+
+
+class RedisRateLimitBackend:
+    """Per-host bucket state in Redis hashes, updated atomically by Lua scripts."""
+
+    def __init__(self, client, key_prefix: str = REDIS_KEY_PREFIX):
+        self.client = client
+        self.key_prefix = key_prefix
+        self._acquire = client.register_script(REDIS_ACQUIRE_SCRIPT)
+        self._feedback = client.register_script(REDIS_FEEDBACK_SCRIPT)
+
+    def _key(self, host: str) -> str:
+        return f"{self.key_prefix}{host}"
+
+    def acquire(self, host: str, config: AIMDConfig) -> float:
+        return float(self._acquire(keys=[self._key(host)], args=acquire_script_args(config)))
+
+    def feedback(self, host: str, config: AIMDConfig, throttled: bool, retry_after: float = 0.0) -> float:
+        return float(self._feedback(keys=[self._key(host)], args=feedback_script_args(config, throttled, retry_after)))
+
+    def rate(self, host: str, config: AIMDConfig) -> float:
+        value = self.client.hget(self._key(host), 'rate')
+        return float(value) if value is not None else config.initial_rate
+
+
+class LocalGCRABackend:
+    """GCRA theoretical arrival times in process memory."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tat: Dict[str, float] = {}
+
+    async def admit(self, key: str, interval: float, window: float, consume: bool = True) -> float:
+        """
+        Admit one request if the budget allows; returns 0, or the seconds until
+        a slot frees up. With consume=False nothing is recorded (a peek).
+        """
+        with self._lock:
+            now = time.monotonic()
+            new_tat = max(self._tat.get(key, now), now) + interval
+            if new_tat - now > window:
+                return new_tat - window - now
+            if consume:
+                self._tat[key] = new_tat
+            return 0.0
+
+
+_REDIS_GCRA_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local interval, window, consume = tonumber(ARGV[1]), tonumber(ARGV[2]), ARGV[3] == '1'
+local tat = math.max(tonumber(redis.call('GET', KEYS[1])) or now, now)
+local new_tat = tat + interval
+if new_tat - now > window then
+    return tostring(new_tat - window - now)
+end
+if consume then
+    -- Once now passes the arrival time the key carries no state
+    redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000) + 1)
+end
+return '0'
+"""
+
+
+class RedisGCRABackend:
+    """
+    GCRA theoretical arrival times in Redis, updated atomically by a Lua script
+    run through an asyncio client.
+
+    An asyncio client is bound to the event loop it was first used on, and each
+    Celery task runs its own loop (asyncio.run), so client_factory is called
+    once per running loop and the client is dropped with its loop.
+    """
+
+    def __init__(self, client_factory: Callable[[], "redis_asyncio.Redis"], key_prefix: str = "capitolscope:gcra:"):
+        self.client_factory = client_factory
+        self.key_prefix = key_prefix
+        self._lock = threading.Lock()
+        self._scripts: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, object]" = weakref.WeakKeyDictionary()
+
+    def _script(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            script = self._scripts.get(loop)
+            if script is None:
+                script = self.client_factory().register_script(_REDIS_GCRA_SCRIPT)
+                self._scripts[loop] = script
+            return script
+
+    async def admit(self, key: str, interval: float, window: float, consume: bool = True) -> float:
+        script = self._script()
+        return float(await script(keys=[f"{self.key_prefix}{key}"], args=[interval, window, 1 if consume else 0]))
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD token-bucket limiter keyed by host.
+
+    Call acquire() (or acquire_async()) before each request, then
+    record_response() with the HTTP status. If the shared backend fails, the
+    limiter falls back to in-process state rather than stopping downloads.
+    """
+
+    def __init__(self, config: Optional[AIMDConfig] = None, backend=None):
+        self.config = config or AIMDConfig()
+        self.backend = backend or LocalRateLimitBackend()
+        self._fallback_backend: Optional[LocalRateLimitBackend] = None
+
+    def _call(self, method: str, *args):
+        if self._fallback_backend is None:
+            try:
+                return getattr(self.backend, method)(*args)
+            except Exception as e:
+                logger.warning(f"Shared rate limit backend unavailable, using per-process limits: {e}")
+                self._fallback_backend = LocalRateLimitBackend()
+        return getattr(self._fallback_backend, method)(*args)
+
+    def acquire(self, host: str) -> float:
+        """Block until a request to host may be sent; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            wait = self._call('acquire', host, self.config)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, host: str) -> float:
+        """acquire() for event loop callers."""
+        waited = 0.0
+        while True:
+            wait = self._call('acquire', host, self.config)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def record_response(self, host: str, status_code: int, retry_after: Optional[float] = None) -> float:
+        """Adapt the host's rate to a response status; returns the new rate."""
+        if status_code in THROTTLE_STATUS_CODES:
+            rate = self._call('feedback', host, self.config, True, retry_after or 0.0)
+            logger.warning(f"{host} throttled request (HTTP {status_code}), rate now {rate:.3f} req/s")
+            return rate
+        if status_code < 400:
+            return self._call('feedback', host, self.config, False, 0.0)
+        return self.current_rate(host)
+
+    def current_rate(self, host: str) -> float:
+        return self._call('rate', host, self.config)
+
+
+def host_of(url: str) -> str:
+    """Rate limiting key for a URL."""
+    return urlparse(url).netloc.lower()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header given in delta-seconds form."""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+def create_download_rate_limiter(shared: Optional[bool] = None) -> AdaptiveRateLimiter:
+    """
+    Download rate limiter configured from settings; shared through the Celery
+    broker's Redis when enabled and reachable, otherwise per process.
+    """
+    from core.config import settings
+
+    config = AIMDConfig(
+        initial_rate=settings.DOWNLOAD_RATE_INITIAL,
+        min_rate=settings.DOWNLOAD_RATE_MIN,
+        max_rate=settings.DOWNLOAD_RATE_MAX,
+    )
+    if shared is None:
+        shared = settings.DOWNLOAD_RATE_LIMIT_SHARED
+    if not shared:
+        return AdaptiveRateLimiter(config)
+    if not REDIS_AVAILABLE:
+        logger.warning("redis package not installed, download rate limits are per process")
+        return AdaptiveRateLimiter(config)
+
+    try:
+        client = redis.Redis.from_url(settings.CELERY_BROKER_URL, socket_timeout=5)
+        client.ping()
+        return AdaptiveRateLimiter(config, RedisRateLimitBackend(client))
+    except Exception as e:
+        logger.warning(f"Could not connect to Redis for shared download rate limits, using per-process limits: {e}")
+        return AdaptiveRateLimiter(config)
+
+
+def create_gcra_backend(shared: Optional[bool] = None):
+    """
+    GCRA backend configured from settings: the Celery broker's Redis when
+    sharing is enabled, otherwise process memory. Nothing connects here; if
+    Redis turns out to be unreachable, the rate limiters using the backend fall
+    back to per-process limits on their first call.
+    """
+    from core.config import settings
+
+    if shared is None:
+        shared = settings.PRICE_RATE_LIMIT_SHARED
+    if not shared:
+        return LocalGCRABackend()
+    if not REDIS_AVAILABLE:
+        logger.warning("redis package not installed, price source rate limits are per process")
+        return LocalGCRABackend()
+
+    broker_url = settings.CELERY_BROKER_URL
+    return RedisGCRABackend(lambda: redis_asyncio.Redis.from_url(broker_url, socket_timeout=5))
+
+
+_gcra_backend = None
+_gcra_backend_lock = threading.Lock()
+
+
+def get_gcra_backend():
+    """Process-wide GCRA backend, created from settings on first use."""
+    global _gcra_backend
+    if _gcra_backend is None:
+        with _gcra_backend_lock:
+            if _gcra_backend is None:
+                _gcra_backend = create_gcra_backend()
+    return _gcra_backend
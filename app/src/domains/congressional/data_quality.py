@@ -10,8 +10,13 @@ This module provides advanced data quality processing for congressional trade da
 
 import re
 import json
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set, Any, NamedTuple
+from typing import Dict, List, Optional, Tuple, Set, Any, NamedTuple, Pattern
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
@@ -19,11 +24,29 @@ from enum import Enum
 from fuzzywuzzy import fuzz, process
 import regex
 
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+    from rapidfuzz.utils import default_process as rf_default_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 from domains.congressional.schemas import TradeOwner
+from domains.congressional.pattern_matching import AhoCorasickMatcher
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction/normalization logic changes so cached results
+# (including on-disk snapshots) from older code are not reused
+EXTRACTION_CACHE_VERSION = 1
+
+# Default number of results kept per DataQualityEnhancer
+DEFAULT_EXTRACTION_CACHE_SIZE = 50000
+
+# Minimum fuzz.ratio score for Method-3 fuzzy company name matches
+FUZZY_COMPANY_SCORE_CUTOFF = 85
+
 
 class TickerExtractionResult(NamedTuple):
     """Result of ticker extraction process."""
@@ -46,6 +69,22 @@ class AmountNormalizationResult(NamedTuple):
     notes: List[str]
 
 
+@lru_cache(maxsize=4096)
+def _ticker_word_pattern(ticker: str) -> Pattern:
+    """Compiled whole-word, case-insensitive pattern for a ticker (kept out of re's small shared cache)."""
+    return re.compile(rf'\b{re.escape(ticker)}\b', re.IGNORECASE)
+
+
+class _TickerCandidates(NamedTuple):
+    """Intermediate ticker extraction state, before batched fuzzy matching."""
+    original_description: str
+    normalized_description: str
+    ticker_candidates: List[Tuple[str, str]]
+    company_matches: List[Tuple[str, str]]
+    etf_matches: List[Tuple[str, str]]
+    fuzzy_word_groups: List[str]
+
+
 class OwnerNormalizationResult(NamedTuple):
     """Result of owner normalization process."""
     normalized_owner: Optional[TradeOwner]
@@ -72,6 +111,57 @@ class QualityReport:
     ticker_extraction_methods: Dict[str, int] = field(default_factory=dict)
     amount_parsing_issues: Dict[str, int] = field(default_factory=dict)
     owner_normalization_issues: Dict[str, int] = field(default_factory=dict)
+    
+    # Extraction result cache effectiveness, per operation
+    cache_hits: Dict[str, int] = field(default_factory=dict)
+    cache_misses: Dict[str, int] = field(default_factory=dict)
+    
+    @classmethod
+    def merge(cls, reports: List['QualityReport'], processing_time: Optional[float] = None) -> 'QualityReport':
+        """
+        Combine reports from independent import workers into a single report.
+        
+        Counts and breakdowns are summed, rates are weighted by each report's
+        record count, and processing_time defaults to the sum of the inputs
+        (pass wall-clock time for parallel runs).
+        """
+        total_records = sum(r.total_records for r in reports)
+        
+        def weighted(attr: str) -> float:
+            if not total_records:
+                return max((getattr(r, attr) for r in reports), default=0.0)
+            return sum(getattr(r, attr) * r.total_records for r in reports) / total_records
+        
+        def summed(attr: str) -> Dict[str, int]:
+            combined: Dict[str, int] = {}
+            for r in reports:
+                for key, count in getattr(r, attr).items():
+                    combined[key] = combined.get(key, 0) + count
+            return combined
+        
+        recommendations: List[str] = []
+        for r in reports:
+            for rec in r.recommendations:
+                if rec not in recommendations:
+                    recommendations.append(rec)
+        
+        return cls(
+            total_records=total_records,
+            successful_records=sum(r.successful_records for r in reports),
+            failed_records=sum(r.failed_records for r in reports),
+            processing_errors=sum(r.processing_errors for r in reports),
+            ticker_extraction_rate=weighted('ticker_extraction_rate'),
+            amount_parsing_rate=weighted('amount_parsing_rate'),
+            owner_normalization_rate=weighted('owner_normalization_rate'),
+            duplicate_count=max((r.duplicate_count for r in reports), default=0),  # table-wide count, not additive
+            processing_time=processing_time if processing_time is not None else sum(r.processing_time for r in reports),
+            recommendations=recommendations,
+            ticker_extraction_methods=summed('ticker_extraction_methods'),
+            amount_parsing_issues=summed('amount_parsing_issues'),
+            owner_normalization_issues=summed('owner_normalization_issues'),
+            cache_hits=summed('cache_hits'),
+            cache_misses=summed('cache_misses'),
+        )
 
 
 @dataclass
@@ -103,6 +193,26 @@ class ImportStatistics:
         self.amount_normalizations.clear()
         self.owner_normalizations.clear()
     
+    def merge(self, other: 'ImportStatistics'):
+        """Accumulate statistics from another (e.g. worker process) run into this one."""
+        self.records_processed += other.records_processed
+        self.records_successful += other.records_successful
+        self.records_failed += other.records_failed
+        self.processing_errors += other.processing_errors
+        
+        if other.import_start_time and (not self.import_start_time or other.import_start_time < self.import_start_time):
+            self.import_start_time = other.import_start_time
+        if other.import_end_time and (not self.import_end_time or other.import_end_time > self.import_end_time):
+            self.import_end_time = other.import_end_time
+        
+        for mine, theirs in (
+            (self.ticker_extractions, other.ticker_extractions),
+            (self.amount_normalizations, other.amount_normalizations),
+            (self.owner_normalizations, other.owner_normalizations),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+    
     @property
     def processing_time_seconds(self) -> float:
         """Calculate processing time in seconds."""
@@ -111,14 +221,142 @@ class ImportStatistics:
         return 0.0
 
 
+class ExtractionCache:
+    """
+    Bounded LRU cache of extraction/normalization results.
+    
+    Keys are (operation, mapping fingerprint, normalized input), so results
+    computed against different mapping tables never collide. Entries can be
+    persisted to an on-disk snapshot and loaded by other processes or later runs.
+    """
+    
+    SNAPSHOT_FORMAT = 1
+    
+    def __init__(self, max_size: int = DEFAULT_EXTRACTION_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: 'OrderedDict[Tuple[str, str, str], Any]' = OrderedDict()
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Tuple[str, str, str]) -> Optional[Any]:
+        operation = key[0]
+        value = self._entries.get(key)
+        if value is None:
+            self.misses[operation] = self.misses.get(operation, 0) + 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits[operation] = self.hits.get(operation, 0) + 1
+        return value
+    
+    def put(self, key: Tuple[str, str, str], value: Any):
+        if self.max_size <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def reset_stats(self):
+        self.hits.clear()
+        self.misses.clear()
+    
+    def clear(self):
+        self._entries.clear()
+        self.reset_stats()
+    
+    def save_snapshot(self, path: str, fingerprint: str):
+        """
+        Merge this cache's entries for the given fingerprint into a snapshot file.
+        
+        The write is atomic (temp file + rename); concurrent writers may drop each
+        other's newest entries but never corrupt the file.
+        """
+        entries = self._read_snapshot(path, fingerprint)
+        entries.update({key: value for key, value in self._entries.items() if key[1] == fingerprint})
+        if len(entries) > self.max_size:
+            entries = dict(list(entries.items())[-self.max_size:])
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'format': self.SNAPSHOT_FORMAT, 'fingerprint': fingerprint, 'entries': entries}, f)
+        os.replace(tmp_path, path)
+        logger.debug(f"Saved {len(entries)} cached extraction results to {path}")
+    
+    def load_snapshot(self, path: str, fingerprint: str) -> int:
+        """Load snapshot entries computed with the given fingerprint; returns the number loaded."""
+        entries = self._read_snapshot(path, fingerprint)
+        for key, value in entries.items():
+            self.put(key, value)
+        if entries:
+            logger.info(f"Loaded {len(entries)} cached extraction results from {path}")
+        return len(entries)
+    
+    def _read_snapshot(self, path: str, fingerprint: str) -> Dict[Tuple[str, str, str], Any]:
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable extraction cache snapshot {path}: {e}")
+            return {}
+        if snapshot.get('format') != self.SNAPSHOT_FORMAT or snapshot.get('fingerprint') != fingerprint:
+            logger.info(f"Extraction cache snapshot {path} is stale; starting cold")
+            return {}
+        return snapshot.get('entries', {})
+
+
 class DataQualityEnhancer:
     """Enhanced data quality processor for congressional trades."""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_EXTRACTION_CACHE_SIZE,
+                 cache_snapshot_path: Optional[str] = None, fuzzy_workers: int = 1):
+        self.mapping_version = 0
+        self.fuzzy_workers = fuzzy_workers  # Threads for batched rapidfuzz scoring (-1 = all cores)
+        self.cache = ExtractionCache(max_size=cache_size)
+        self.cache_snapshot_path = cache_snapshot_path
         self._init_ticker_patterns()
         self._init_amount_patterns()
         self._init_owner_patterns()
         self._init_asset_type_patterns()
+        self.rebuild_name_matcher()
+        
+        if cache_snapshot_path:
+            self.cache.load_snapshot(cache_snapshot_path, self.mapping_fingerprint)
+    
+    def _update_mapping_fingerprint(self):
+        """Hash the lookup tables that extraction results depend on."""
+        tables = {
+            'version': EXTRACTION_CACHE_VERSION,
+            'company': sorted(self.company_ticker_mapping.items(), key=lambda item: item[0]),
+            'etf': sorted(self.etf_mappings.items()),
+            'blacklist': sorted(self.ticker_blacklist),
+            'ranges': sorted(self.standard_ranges.items()),
+            'variations': sorted(self.amount_variations.items()),
+            'owners': sorted((key, owner.value) for key, owner in self.owner_mappings.items()),
+        }
+        payload = json.dumps(tables, sort_keys=True, default=str).encode('utf-8')
+        self.mapping_fingerprint = hashlib.sha1(payload).hexdigest()
+    
+    def cache_stats(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Per-operation (hits, misses) of the extraction result cache."""
+        return dict(self.cache.hits), dict(self.cache.misses)
+    
+    def save_cache_snapshot(self, path: Optional[str] = None):
+        """Persist cached results so later runs or other workers start warm."""
+        path = path or self.cache_snapshot_path
+        if not path:
+            return
+        try:
+            self.cache.save_snapshot(path, self.mapping_fingerprint)
+        except Exception as e:
+            logger.warning(f"Failed to save extraction cache snapshot {path}: {e}")
         
     def _init_ticker_patterns(self):
         """Initialize ticker extraction patterns."""
@@ -145,8 +383,20 @@ class DataQualityEnhancer:
             r'\b(V[A-Z]{2,3})\b',  # Vanguard ETFs
         ]
         
+        # Method 5: fallback patterns, used only when no other method found a candidate
+        self.fallback_ticker_patterns = [
+            r'\b([A-Z]{2,5})\s+(?:STOCK|SHARES|EQUITY|COMMON|ORDINARY)\b',
+            r'(?:STOCK|SHARES|EQUITY|COMMON|ORDINARY)\s+([A-Z]{2,5})\b',
+            r'\b([A-Z]{2,5})\s+(?:INC|CORP|CO|LTD|LLC)\b',
+            r'(?:INC|CORP|CO|LTD|LLC)\s+([A-Z]{2,5})\b',
+        ]
+        
         # Compile patterns for performance
         self.compiled_ticker_patterns = [re.compile(pattern) for pattern in self.ticker_patterns]
+        self.compiled_fallback_patterns = [re.compile(pattern) for pattern in self.fallback_ticker_patterns]
+        
+        # Method 3: sequences of words that may be a company name
+        self.word_group_pattern = re.compile(r'\b[A-Z][A-Z\s&\.]+\b')
         
         # Common false positives to exclude
         self.ticker_blacklist = {
@@ -377,6 +627,41 @@ class DataQualityEnhancer:
         # Combine all mappings
         self.company_ticker_mapping.update(self.etf_mappings)
         
+    def rebuild_name_matcher(self):
+        """
+        Compile company and ETF names into a single Aho-Corasick automaton.
+        
+        Must be called after editing company_ticker_mapping or etf_mappings in
+        place; update_company_mappings() does this automatically. Also refreshes
+        the mapping fingerprint so cached results from the old tables are not reused.
+        """
+        patterns = list(self.company_ticker_mapping)
+        patterns += [name for name in self.etf_mappings if name not in self.company_ticker_mapping]
+        self.name_matcher = AhoCorasickMatcher(patterns)
+        
+        # Per pattern ID: (company ticker or None, ETF rank or None, ETF ticker)
+        etf_ranks = {name: rank for rank, name in enumerate(self.etf_mappings)}
+        self._name_pattern_targets = [
+            (
+                self.company_ticker_mapping.get(name),
+                etf_ranks.get(name),
+                self.etf_mappings.get(name),
+            )
+            for name in self.name_matcher.patterns
+        ]
+        self.mapping_version += 1
+        self._update_mapping_fingerprint()
+        
+    def update_company_mappings(self, company_mappings: Optional[Dict[str, Optional[str]]] = None,
+                                etf_mappings: Optional[Dict[str, str]] = None):
+        """Add or override company/ETF name mappings and recompile the matcher."""
+        if company_mappings:
+            self.company_ticker_mapping.update(company_mappings)
+        if etf_mappings:
+            self.etf_mappings.update(etf_mappings)
+            self.company_ticker_mapping.update(etf_mappings)
+        self.rebuild_name_matcher()
+        
     def _init_amount_patterns(self):
         """Initialize amount parsing patterns."""
         # Standard congressional disclosure ranges
@@ -544,77 +829,195 @@ class DataQualityEnhancer:
             self.compiled_asset_patterns[asset_type] = [
                 re.compile(pattern, re.IGNORECASE) for pattern in patterns
             ]
+        
+        # One alternation per asset type, so detection is one search per type
+        self.asset_type_matchers: Dict[str, Pattern] = {
+            asset_type: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+            for asset_type, patterns in self.asset_type_patterns.items()
+        }
+        
+        # Noise removed from descriptions when building asset names, applied in order
+        self.asset_name_noise_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in (
+                r'\b(?:STOCK|SHARES|EQUITY|COMMON|ORDINARY|SECURITIES?)\b',
+                r'\b(?:INC|CORP|CO|LTD|LLC|CORPORATION|INCORPORATED|COMPANY)\b',
+                r'\b(?:THE|AND|OR|OF|IN|ON|AT|FOR|TO|BY|WITH|FROM)\b',
+                r'\([^)]*\)',  # Remove parentheses
+                r'\[[^\]]*\]',  # Remove brackets
+                r'\s+',  # Multiple spaces
+            )
+        ]
     
     def extract_ticker(self, asset_description: str) -> TickerExtractionResult:
+        """Extract ticker symbol from asset description, reusing cached results."""
+        return self.extract_tickers([asset_description])[0]
+    
+    def extract_tickers(self, descriptions: List[str]) -> List[TickerExtractionResult]:
+        """
+        Extract tickers for a batch of asset descriptions.
+        
+        Cached results are reused; for the remaining descriptions every word group
+        needing Method-3 fuzzy matching is scored against the company-name corpus
+        in a single matrix call, then results are mapped back in input order.
+        """
+        results: List[Optional[TickerExtractionResult]] = [None] * len(descriptions)
+        pending: Dict[Tuple[str, str, str], List[int]] = {}
+        
+        for i, description in enumerate(descriptions):
+            if not description:
+                results[i] = self._no_input_ticker_result()
+                continue
+            key = ('extract_ticker', self.mapping_fingerprint, description.strip())
+            if key in pending:
+                pending[key].append(i)
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending[key] = [i]
+        
+        if pending:
+            computed = self._extract_tickers_uncached([descriptions[indexes[0]] for indexes in pending.values()])
+            for (key, indexes), result in zip(pending.items(), computed):
+                self.cache.put(key, result)
+                for i in indexes:
+                    results[i] = result
+        
+        return results
+    
+    def _extract_ticker_uncached(self, asset_description: str) -> TickerExtractionResult:
         """Extract ticker symbol from asset description with enhanced accuracy."""
-        if not asset_description:
-            return TickerExtractionResult(
-                ticker=None,
-                asset_name=None,
-                asset_type=None,
-                confidence=Decimal('0.0'),
-                extraction_method='no_input',
-                notes=['No asset description provided']
-            )
+        return self._extract_tickers_uncached([asset_description])[0]
+    
+    def _extract_tickers_uncached(self, descriptions: List[str]) -> List[TickerExtractionResult]:
+        """Run the extraction pipeline for a batch, with Method-3 fuzzy matching batched."""
+        staged = [
+            self._collect_ticker_candidates(description) if description else None
+            for description in descriptions
+        ]
+        
+        word_groups = sorted({group for stage in staged if stage for group in stage.fuzzy_word_groups})
+        fuzzy_lookup = self._fuzzy_match_company_names(word_groups) if word_groups else {}
         
-        original_description = asset_description
+        return [
+            self._select_ticker(stage, fuzzy_lookup) if stage else self._no_input_ticker_result()
+            for stage in staged
+        ]
+    
+    @staticmethod
+    def _no_input_ticker_result() -> TickerExtractionResult:
+        return TickerExtractionResult(
+            ticker=None,
+            asset_name=None,
+            asset_type=None,
+            confidence=Decimal('0.0'),
+            extraction_method='no_input',
+            notes=['No asset description provided']
+        )
+    
+    def _collect_ticker_candidates(self, asset_description: str) -> _TickerCandidates:
+        """Methods 1, 2 and 4, plus the word groups Method 3 should fuzzy match."""
         normalized_description = asset_description.upper().strip()
-        notes = []
         
         # Method 1: Direct ticker pattern matching
         ticker_candidates = []
         for pattern in self.compiled_ticker_patterns:
-            matches = pattern.findall(normalized_description)
-            for match in matches:
+            for match in pattern.findall(normalized_description):
                 if match not in self.ticker_blacklist and len(match) <= 5:
                     ticker_candidates.append((match, 'regex_pattern'))
         
-        # Method 2: Company name mapping
+        # Methods 2 and 4: company and ETF name mapping, one automaton pass.
+        # Hits are ordered as in the mapping tables to keep tie-breaking stable.
         company_matches = []
-        for company_name, ticker in self.company_ticker_mapping.items():
-            if ticker and company_name in normalized_description:
-                company_matches.append((ticker, 'company_mapping'))
+        etf_hits = []
+        for pattern_id in sorted(self.name_matcher.find_ids(normalized_description)):
+            company_ticker, etf_rank, etf_ticker = self._name_pattern_targets[pattern_id]
+            if company_ticker:
+                company_matches.append((company_ticker, 'company_mapping'))
+            if etf_rank is not None:
+                etf_hits.append((etf_rank, etf_ticker))
+        etf_matches = [(ticker, 'etf_mapping') for _, ticker in sorted(etf_hits)]
+        
+        # Method 3 candidates: potential company names (sequences of words)
+        fuzzy_word_groups = []
+        if not ticker_candidates and not company_matches:
+            words = self.word_group_pattern.findall(normalized_description)
+            fuzzy_word_groups = [group for group in words if len(group) > 3]  # Skip very short matches
+        
+        return _TickerCandidates(
+            original_description=asset_description,
+            normalized_description=normalized_description,
+            ticker_candidates=ticker_candidates,
+            company_matches=company_matches,
+            etf_matches=etf_matches,
+            fuzzy_word_groups=fuzzy_word_groups,
+        )
+    
+    def _fuzzy_match_company_names(self, word_groups: List[str]) -> Dict[str, str]:
+        """
+        Best company-name match (score >= FUZZY_COMPANY_SCORE_CUTOFF) for each word group.
+        
+        Uses one rapidfuzz cdist matrix call when rapidfuzz is installed, otherwise
+        falls back to fuzzywuzzy's extractOne per word group.
+        """
+        choices = list(self.company_ticker_mapping.keys())
+        matched: Dict[str, str] = {}
+        
+        if RAPIDFUZZ_AVAILABLE:
+            scores = rf_process.cdist(
+                word_groups,
+                choices,
+                scorer=rf_fuzz.ratio,
+                processor=rf_default_process,
+                # fuzzywuzzy rounds scores to integers before applying the cutoff
+                score_cutoff=FUZZY_COMPANY_SCORE_CUTOFF - 0.5,
+                workers=self.fuzzy_workers,
+            )
+            best_indexes = scores.argmax(axis=1)
+            for row, word_group in enumerate(word_groups):
+                best = best_indexes[row]
+                if round(float(scores[row, best])) >= FUZZY_COMPANY_SCORE_CUTOFF:
+                    matched[word_group] = choices[best]
+            return matched
+        
+        for word_group in word_groups:
+            best_match = process.extractOne(
+                word_group,
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=FUZZY_COMPANY_SCORE_CUTOFF
+            )
+            if best_match:
+                matched[word_group] = best_match[0]
+        return matched
+    
+    def _select_ticker(self, stage: _TickerCandidates, fuzzy_lookup: Dict[str, str]) -> TickerExtractionResult:
+        """Combine candidates from every method and pick the best ticker."""
+        original_description = stage.original_description
+        normalized_description = stage.normalized_description
+        ticker_candidates = stage.ticker_candidates
+        company_matches = stage.company_matches
+        etf_matches = stage.etf_matches
+        notes = []
         
-        # Method 3: Fuzzy matching against company names
+        # Method 3: Fuzzy matching against company names (scored in batch)
         fuzzy_matches = []
-        if not ticker_candidates and not company_matches:
-            # Extract potential company names (sequences of words)
-            words = re.findall(r'\b[A-Z][A-Z\s&\.]+\b', normalized_description)
-            for word_group in words:
-                if len(word_group) > 3:  # Skip very short matches
-                    best_match = process.extractOne(
-                        word_group,
-                        self.company_ticker_mapping.keys(),
-                        scorer=fuzz.ratio,
-                        score_cutoff=85
-                    )
-                    if best_match:
-                        ticker = self.company_ticker_mapping[best_match[0]]
-                        if ticker:
-                            fuzzy_matches.append((ticker, 'fuzzy_company'))
-                            notes.append(f"Fuzzy matched: {word_group} -> {best_match[0]}")
-        
-        # Method 4: ETF pattern matching
-        etf_matches = []
-        for etf_name, ticker in self.etf_mappings.items():
-            if etf_name in normalized_description:
-                etf_matches.append((ticker, 'etf_mapping'))
+        for word_group in stage.fuzzy_word_groups:
+            company_name = fuzzy_lookup.get(word_group)
+            if company_name:
+                ticker = self.company_ticker_mapping[company_name]
+                if ticker:
+                    fuzzy_matches.append((ticker, 'fuzzy_company'))
+                    notes.append(f"Fuzzy matched: {word_group} -> {company_name}")
         
         # Combine all matches and score them
         all_matches = ticker_candidates + company_matches + fuzzy_matches + etf_matches
         
         if not all_matches:
             # Method 5: Fallback pattern matching
-            fallback_patterns = [
-                r'\b([A-Z]{2,5})\s+(?:STOCK|SHARES|EQUITY|COMMON|ORDINARY)\b',
-                r'(?:STOCK|SHARES|EQUITY|COMMON|ORDINARY)\s+([A-Z]{2,5})\b',
-                r'\b([A-Z]{2,5})\s+(?:INC|CORP|CO|LTD|LLC)\b',
-                r'(?:INC|CORP|CO|LTD|LLC)\s+([A-Z]{2,5})\b',
-            ]
-            
-            for pattern in fallback_patterns:
-                matches = re.findall(pattern, normalized_description)
-                for match in matches:
+            for pattern in self.compiled_fallback_patterns:
+                for match in pattern.findall(normalized_description):
                     if match not in self.ticker_blacklist:
                         all_matches.append((match, 'fallback_pattern'))
         
@@ -705,20 +1108,11 @@ class DataQualityEnhancer:
         
         # Remove ticker if present
         if ticker:
-            clean_desc = re.sub(rf'\b{re.escape(ticker)}\b', '', clean_desc, flags=re.IGNORECASE)
+            clean_desc = _ticker_word_pattern(ticker).sub('', clean_desc)
         
         # Remove common noise words
-        noise_patterns = [
-            r'\b(?:STOCK|SHARES|EQUITY|COMMON|ORDINARY|SECURITIES?)\b',
-            r'\b(?:INC|CORP|CO|LTD|LLC|CORPORATION|INCORPORATED|COMPANY)\b',
-            r'\b(?:THE|AND|OR|OF|IN|ON|AT|FOR|TO|BY|WITH|FROM)\b',
-            r'\([^)]*\)',  # Remove parentheses
-            r'\[[^\]]*\]',  # Remove brackets
-            r'\s+',  # Multiple spaces
-        ]
-        
-        for pattern in noise_patterns:
-            clean_desc = re.sub(pattern, ' ', clean_desc, flags=re.IGNORECASE)
+        for pattern in self.asset_name_noise_patterns:
+            clean_desc = pattern.sub(' ', clean_desc)
         
         # Clean up spacing and return
         clean_desc = ' '.join(clean_desc.split())
@@ -730,15 +1124,28 @@ class DataQualityEnhancer:
             return None
         
         # Check each asset type pattern
-        for asset_type, patterns in self.compiled_asset_patterns.items():
-            for pattern in patterns:
-                if pattern.search(description):
-                    return asset_type
+        for asset_type, matcher in self.asset_type_matchers.items():
+            if matcher.search(description):
+                return asset_type
         
         # Default to STOCK if no specific type detected
         return 'STOCK'
     
     def normalize_amount(self, amount_str: str) -> AmountNormalizationResult:
+        """Normalize amount string, reusing cached results."""
+        if not amount_str:
+            return self._normalize_amount_uncached(amount_str)
+        
+        key = ('normalize_amount', self.mapping_fingerprint, amount_str.strip())
+        result = self.cache.get(key)
+        if result is None:
+            result = self._normalize_amount_uncached(amount_str)
+            self.cache.put(key, result)
+        elif result.original_amount != amount_str:
+            result = result._replace(original_amount=amount_str)
+        return result
+    
+    def _normalize_amount_uncached(self, amount_str: str) -> AmountNormalizationResult:
         """Normalize amount string to standard congressional ranges."""
         if not amount_str:
             return AmountNormalizationResult(
@@ -859,6 +1266,20 @@ class DataQualityEnhancer:
         )
     
     def normalize_owner(self, owner_str: str) -> OwnerNormalizationResult:
+        """Normalize owner field, reusing cached results."""
+        if not owner_str:
+            return self._normalize_owner_uncached(owner_str)
+        
+        key = ('normalize_owner', self.mapping_fingerprint, owner_str.upper().strip())
+        result = self.cache.get(key)
+        if result is None:
+            result = self._normalize_owner_uncached(owner_str)
+            self.cache.put(key, result)
+        elif result.original_owner != owner_str:
+            result = result._replace(original_owner=owner_str)
+        return result
+    
+    def _normalize_owner_uncached(self, owner_str: str) -> OwnerNormalizationResult:
         """Normalize owner field to standard enum values."""
         if not owner_str:
             return OwnerNormalizationResult(
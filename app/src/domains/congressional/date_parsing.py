@@ -0,0 +1,238 @@
+"""
+Trade date parsing with per-file format detection.
+
+Dates within one disclosure file nearly always share a layout family (e.g.
+M/D/YYYY). DateParser samples the first rows of a file, picks the dominant
+family, and parses values of that family by slicing fixed positions instead
+of running strptime through a list of formats. Anything else, and every value
+before detection completes, goes through the full parse_date_full() chain;
+results are memoized per distinct raw string.
+"""
+
+import re
+from collections import Counter
+from datetime import datetime, date
+from typing import Dict, NamedTuple, Optional
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+# Rows sampled per file before the dominant layout is chosen
+DATE_FORMAT_SAMPLE_SIZE = 100
+
+# Distinct raw strings memoized; longer strings (free text) are not cached
+DATE_CACHE_SIZE = 20000
+DATE_CACHE_MAX_LENGTH = 32
+
+_PLACEHOLDERS = {"S", "[ST]", "ST", "N/A", "NA", "NONE", "-"}
+
+_STRUCTURED_FORMATS = [
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%m/%d/%Y %H:%M:%S',
+]
+
+_ISO_TOKEN = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_MDY_TOKEN = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{2,4})\b")
+
+# Layout of a value: ASCII digits become '9', everything else is kept
+_SHAPE_TABLE = str.maketrans('0123456789', '9999999999')
+
+_MISSING = object()
+
+
+def _two_digit_century(yy: int) -> int:
+    return 2000 if yy <= 30 else 1900
+
+
+def parse_date_full(date_str: str) -> Optional[date]:
+    """Parse date string with multiple format support and sanitization.
+
+    Handles placeholders like 'S', '[ST]', words leaking into the field,
+    and scans arbitrary text to extract a date token if needed.
+    """
+    if not date_str:
+        return None
+
+    # Normalize input to string
+    raw = str(date_str).strip()
+    if not raw:
+        return None
+
+    # Fast reject common non-dates/placeholders
+    if raw.upper() in _PLACEHOLDERS:
+        return None
+
+    # If the string is clearly just a year with 2 or 4 digits, try to coerce
+    if raw.isdigit():
+        if len(raw) == 4:
+            # Year-only -> choose Jan 1 of that year
+            try:
+                return date(int(raw), 1, 1)
+            except ValueError:
+                pass
+        elif len(raw) == 2:
+            # Two-digit year, assume 20xx for 00-30 else 19xx
+            try:
+                yy = int(raw)
+                return date(_two_digit_century(yy) + yy, 1, 1)
+            except ValueError:
+                pass
+
+    # Try structured formats first
+    for fmt in _STRUCTURED_FORMATS:
+        try:
+            return datetime.strptime(raw, fmt).date()
+        except ValueError:
+            continue
+
+    # Handle two-digit year in slash format (e.g., 2/18/22)
+    try:
+        mdy = datetime.strptime(raw, '%m/%d/%y').date()
+        # Normalize 2-digit year into 19xx/20xx similar to above assumption
+        yy = int(raw.split('/')[-1])
+        return date(_two_digit_century(yy) + mdy.year % 100, mdy.month, mdy.day)
+    except ValueError:
+        pass
+
+    # As a last resort, scan the string for a date token using regex
+    # - ISO: YYYY-MM-DD
+    # - M/D/YY(YY)
+    iso_match = _ISO_TOKEN.search(raw)
+    if iso_match:
+        try:
+            y, m, d = map(int, iso_match.groups())
+            return date(y, m, d)
+        except ValueError:
+            pass
+    mdy_match = _MDY_TOKEN.search(raw)
+    if mdy_match:
+        try:
+            m, d, y = mdy_match.groups()
+            m = int(m)
+            d = int(d)
+            if len(y) == 2:
+                yy = int(y)
+                y = _two_digit_century(yy) + yy
+            else:
+                y = int(y)
+            return date(y, m, d)
+        except ValueError:
+            pass
+
+    logger.warning(f"Could not parse date: {raw}")
+    return None
+
+
+class DateLayout(NamedTuple):
+    """Fixed positions of the year, month and day in values of one shape."""
+    family: str
+    shape: str
+    year: slice
+    month: slice
+    day: slice
+    two_digit_year: bool
+
+
+def _build_layouts() -> Dict[str, DateLayout]:
+    """Layouts parse_date_full resolves with a single strptime format: ISO dates and M/D/Y(Y)."""
+    layouts = {'9999-99-99': DateLayout('Y-M-D', '9999-99-99', slice(0, 4), slice(5, 7), slice(8, 10), False)}
+    for month_digits in (1, 2):
+        for day_digits in (1, 2):
+            for year_digits in (2, 4):
+                shape = f"{'9' * month_digits}/{'9' * day_digits}/{'9' * year_digits}"
+                day_start = month_digits + 1
+                year_start = day_start + day_digits + 1
+                layouts[shape] = DateLayout(
+                    'M/D/YY' if year_digits == 2 else 'M/D/YYYY',
+                    shape,
+                    slice(year_start, year_start + year_digits),
+                    slice(0, month_digits),
+                    slice(day_start, day_start + day_digits),
+                    year_digits == 2
+                )
+    return layouts
+
+
+DATE_LAYOUTS = _build_layouts()
+
+
+class DateParser:
+    """
+    parse_date_full() with a per-file fixed-position fast path and a memo of
+    distinct raw strings. Call start_file() when a new file begins so its
+    dominant layout family is detected afresh.
+    """
+
+    def __init__(self, sample_size: int = DATE_FORMAT_SAMPLE_SIZE, cache_size: int = DATE_CACHE_SIZE):
+        self.sample_size = sample_size
+        self.cache_size = cache_size
+        self._cache: Dict[str, Optional[date]] = {}
+        self.family: Optional[str] = None
+        self._samples: Counter = Counter()
+        self._sampled = 0
+        self.fast_hits = 0
+        self.cache_hits = 0
+        self.fallbacks = 0
+
+    def start_file(self):
+        """Forget the detected layout family; the memo of parsed strings is kept."""
+        self.family = None
+        self._samples = Counter()
+        self._sampled = 0
+
+    def parse(self, date_str: str) -> Optional[date]:
+        if not date_str:
+            return None
+        cached = self._cache.get(date_str, _MISSING)
+        if cached is not _MISSING:
+            self.cache_hits += 1
+            return cached
+
+        raw = str(date_str).strip()
+        shape = raw.translate(_SHAPE_TABLE)
+        result = _MISSING
+        if self.family is not None:
+            layout = DATE_LAYOUTS.get(shape)
+            if layout is not None and layout.family == self.family:
+                result = self._parse_layout(raw, layout)
+        elif self._sampled < self.sample_size:
+            self._observe(shape)
+
+        if result is _MISSING:
+            self.fallbacks += 1
+            result = parse_date_full(date_str)
+        else:
+            self.fast_hits += 1
+
+        if isinstance(date_str, str) and len(date_str) <= DATE_CACHE_MAX_LENGTH:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[date_str] = result
+        return result
+
+    def _observe(self, shape: str):
+        """Count a sampled value's layout family; pick the dominant one once the sample is complete."""
+        self._sampled += 1
+        layout = DATE_LAYOUTS.get(shape)
+        if layout is not None:
+            self._samples[layout.family] += 1
+        if self._sampled >= self.sample_size and self._samples:
+            family, count = self._samples.most_common(1)[0]
+            self.family = family
+            logger.debug(f"Dominant date layout {family} ({count}/{self._sampled} sampled values)")
+
+    @staticmethod
+    def _parse_layout(raw: str, layout: DateLayout):
+        """Date from fixed positions, or _MISSING when the value is not a valid date in this layout."""
+        try:
+            year = int(raw[layout.year])
+            if layout.two_digit_year:
+                year += _two_digit_century(year)
+            return date(year, int(raw[layout.month]), int(raw[layout.day]))
+        except ValueError:
+            # e.g. 13/05/2024: the full chain tries day-first next
+            return _MISSING
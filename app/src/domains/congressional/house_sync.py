@@ -0,0 +1,373 @@
+"""
+Incremental House periodic transaction report (PTR) synchronization.
+
+The House Clerk publishes one financial disclosure index per year
+({year}FD.zip, an XML/TXT listing of every filing by DocID). Instead of
+re-processing every DocID in the index on each run, this module keeps the
+last-seen index in the congressional_filing_manifest table and:
+- Diffs each freshly downloaded index against the stored manifest
+- Queues only new filings and entries whose index fields changed (amendments)
+- Downloads and parses just those PTR PDFs and feeds the trades through the
+  regular CongressionalDataIngestion batch pipeline
+"""
+
+import hashlib
+import io
+import tempfile
+import time
+import uuid
+import zipfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import datetime, date, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import requests
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from core.database import db_manager
+from core.rate_limiting import (
+    AdaptiveRateLimiter, THROTTLE_STATUS_CODES, create_download_rate_limiter, host_of, parse_retry_after
+)
+from domains.congressional.models import CongressionalFilingManifest
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+HOUSE_FD_INDEX_URL = "https://disclosures-clerk.house.gov/public_disc/financial-pdfs/{year}FD.zip"
+HOUSE_PTR_PDF_URL = "https://disclosures-clerk.house.gov/public_disc/ptr-pdfs/{year}/{doc_id}.pdf"
+
+# Index filing types that are periodic transaction reports
+PTR_FILING_TYPES = {'P'}
+
+# Manifest statuses that still need (re)processing
+PENDING_MANIFEST_STATUSES = ('pending', 'failed')
+
+# Failed PTRs are retried on later runs up to this many attempts (reset when the entry is amended)
+MAX_FILING_ATTEMPTS = 3
+
+# Attempts per PDF download when the clerk site throttles (403/429)
+MAX_DOWNLOAD_ATTEMPTS = 5
+
+# Rows per manifest upsert statement
+MANIFEST_UPSERT_CHUNK_SIZE = 1000
+
+
+@dataclass
+class FilingManifestEntry:
+    """One filing from the yearly FD index."""
+    doc_id: str
+    year: int
+    filing_type: str
+    filing_date: Optional[date]
+    prefix: str = ""
+    first_name: str = ""
+    last_name: str = ""
+    suffix: str = ""
+    state_district: str = ""
+
+    @property
+    def entry_hash(self) -> str:
+        """SHA-256 of the index fields; a change means the filing was amended."""
+        fields = [
+            self.doc_id, str(self.year), self.filing_type,
+            self.filing_date.isoformat() if self.filing_date else "",
+            self.prefix, self.first_name, self.last_name, self.suffix, self.state_district,
+        ]
+        return hashlib.sha256("\t".join(fields).encode('utf-8')).hexdigest()
+
+    @property
+    def is_ptr(self) -> bool:
+        return self.filing_type in PTR_FILING_TYPES
+
+    @property
+    def member_name(self) -> str:
+        return " ".join(part for part in (self.prefix, self.first_name, self.last_name) if part)
+
+
+@dataclass
+class ManifestDiff:
+    """Result of comparing a downloaded FD index with the stored manifest."""
+    new: List[FilingManifestEntry] = field(default_factory=list)
+    amended: List[FilingManifestEntry] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> List[FilingManifestEntry]:
+        return self.new + self.amended
+
+
+def fetch_fd_index(year: int, http: Optional[requests.Session] = None, timeout: int = 30) -> bytes:
+    """Download the yearly FD index zip."""
+    url = HOUSE_FD_INDEX_URL.format(year=year)
+    logger.info(f"Downloading House FD index: {url}")
+    response = (http or requests).get(url, timeout=timeout)
+    response.raise_for_status()
+    logger.info(f"Downloaded House FD index for {year}: {len(response.content)} bytes")
+    return response.content
+
+
+def parse_fd_index(zip_content: bytes, year: int) -> List[FilingManifestEntry]:
+    """Parse the XML listing inside a yearly FD index zip."""
+    entries = []
+    with zipfile.ZipFile(io.BytesIO(zip_content)) as zip_file:
+        with zip_file.open(f"{year}FD.xml") as xml_file:
+            for _, element in ET.iterparse(xml_file):
+                if element.tag != 'Member':
+                    continue
+                values = {child.tag: (child.text or "").strip() for child in element}
+                element.clear()
+
+                doc_id = values.get('DocID', '')
+                if not doc_id:
+                    continue
+                entries.append(FilingManifestEntry(
+                    doc_id=doc_id,
+                    year=year,
+                    filing_type=values.get('FilingType', ''),
+                    filing_date=_parse_filing_date(values.get('FilingDate', '')),
+                    prefix=values.get('Prefix', ''),
+                    first_name=values.get('First', ''),
+                    last_name=values.get('Last', ''),
+                    suffix=values.get('Suffix', ''),
+                    state_district=values.get('StateDst', ''),
+                ))
+    logger.info(f"Parsed {len(entries)} filings from the {year} FD index")
+    return entries
+
+
+def _parse_filing_date(value: str) -> Optional[date]:
+    try:
+        return datetime.strptime(value, '%m/%d/%Y').date()
+    except ValueError:
+        return None
+
+
+def diff_manifest(session: Session, year: int, entries: List[FilingManifestEntry]) -> ManifestDiff:
+    """Compare index entries with the stored manifest for a year (one query)."""
+    stored = dict(session.execute(
+        select(CongressionalFilingManifest.doc_id, CongressionalFilingManifest.entry_hash)
+        .where(CongressionalFilingManifest.year == year)
+    ).all())
+
+    diff = ManifestDiff()
+    for entry in entries:
+        stored_hash = stored.get(entry.doc_id)
+        if stored_hash is None:
+            diff.new.append(entry)
+        elif stored_hash != entry.entry_hash:
+            diff.amended.append(entry)
+        else:
+            diff.unchanged += 1
+    return diff
+
+
+def upsert_manifest_entries(session: Session, entries: List[FilingManifestEntry]):
+    """Record changed entries in the manifest; PTRs are queued as pending, other filings skipped."""
+    now = datetime.now(timezone.utc)
+    for start in range(0, len(entries), MANIFEST_UPSERT_CHUNK_SIZE):
+        rows = [
+            {
+                'id': uuid.uuid4(),
+                'doc_id': entry.doc_id,
+                'year': entry.year,
+                'filing_type': entry.filing_type,
+                'filing_date': entry.filing_date,
+                'prefix': entry.prefix,
+                'first_name': entry.first_name,
+                'last_name': entry.last_name,
+                'suffix': entry.suffix,
+                'state_district': entry.state_district,
+                'entry_hash': entry.entry_hash,
+                'status': 'pending' if entry.is_ptr else 'skipped',
+                'attempts': 0,
+                'trades_found': 0,
+                'last_error': None,
+                'processed_at': None,
+                'created_at': now,
+                'updated_at': now,
+            }
+            for entry in entries[start:start + MANIFEST_UPSERT_CHUNK_SIZE]
+        ]
+        stmt = pg_insert(CongressionalFilingManifest).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['doc_id'],
+            set_={
+                name: stmt.excluded[name]
+                for name in (
+                    'year', 'filing_type', 'filing_date', 'prefix', 'first_name', 'last_name',
+                    'suffix', 'state_district', 'entry_hash', 'status', 'attempts', 'trades_found',
+                    'last_error', 'processed_at', 'updated_at'
+                )
+            }
+        )
+        session.execute(stmt)
+
+
+def ingest_trade_batch(ingestion, session: Session, batch: List, doc_id: str):
+    """Run one filing's TradeRecords through the ingestion batch pipeline on the given session."""
+    ingestion.session = session
+    try:
+        if batch and not ingestion._process_batch(batch):
+            raise RuntimeError(f"Trade batch for {doc_id} could not be ingested")
+    finally:
+        ingestion.session = None
+
+
+class HousePTRSync:
+    """
+    Incremental sync of House PTRs for a filing year.
+
+    The ingestion pipeline (ticker/member reference data) and the PDF parser
+    are only built when the manifest diff leaves something to process. PDF
+    downloads are paced by an adaptive per-host rate limiter, shared with other
+    workers through Redis by default.
+    """
+
+    def __init__(self, timeout: int = 60, ingestion=None, rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        self.timeout = timeout
+        self.http = requests.Session()
+        self.http.headers['User-Agent'] = "CapitolScope/1.0 (https://capitolscope.com)"
+        self.rate_limiter = rate_limiter or create_download_rate_limiter()
+        self._ingestion = ingestion
+        self._parser = None
+
+    def sync_year(self, year: int) -> Dict[str, Any]:
+        """Diff the year's FD index against the manifest and process new or amended PTRs."""
+        start_time = time.monotonic()
+        entries = parse_fd_index(fetch_fd_index(year, self.http, self.timeout), year)
+
+        with db_manager.sync_session_scope() as session:
+            diff = diff_manifest(session, year, entries)
+            if diff.changed:
+                upsert_manifest_entries(session, diff.changed)
+                session.commit()
+            pending = session.execute(
+                select(CongressionalFilingManifest)
+                .where(CongressionalFilingManifest.year == year)
+                .where(CongressionalFilingManifest.filing_type.in_(PTR_FILING_TYPES))
+                .where(CongressionalFilingManifest.status.in_(PENDING_MANIFEST_STATUSES))
+                .where(CongressionalFilingManifest.attempts < MAX_FILING_ATTEMPTS)
+                .order_by(CongressionalFilingManifest.filing_date, CongressionalFilingManifest.doc_id)
+            ).scalars().all()
+
+            logger.info(
+                f"House FD index {year}: {len(entries)} filings, {len(diff.new)} new, "
+                f"{len(diff.amended)} amended, {diff.unchanged} unchanged, {len(pending)} PTRs to process"
+            )
+
+            processed = failed = trades_found = 0
+            for manifest_row in pending:
+                try:
+                    trades_found += self._process_filing(session, manifest_row)
+                    processed += 1
+                except Exception as e:
+                    session.rollback()
+                    manifest_row.status = 'failed'
+                    manifest_row.attempts += 1
+                    manifest_row.last_error = str(e)[:2000]
+                    session.commit()
+                    failed += 1
+                    logger.error(f"Failed to sync PTR {manifest_row.doc_id}: {e}")
+
+        return {
+            'year': year,
+            'filings_in_index': len(entries),
+            'new_filings': len(diff.new),
+            'amended_filings': len(diff.amended),
+            'ptrs_processed': processed,
+            'ptrs_failed': failed,
+            'trades_found': trades_found,
+            'duration_seconds': round(time.monotonic() - start_time, 2),
+        }
+
+    def _process_filing(self, session: Session, manifest_row: CongressionalFilingManifest) -> int:
+        """Download, parse and ingest one PTR; returns the number of trade rows found."""
+        ingestion = self._get_ingestion()
+        parser = self._get_parser()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_path = Path(tmp_dir) / f"{manifest_row.doc_id}.pdf"
+            pdf_path.write_bytes(self._download_pdf(manifest_row.year, manifest_row.doc_id))
+            records = parser.parse_pdf_improved(
+                pdf_path=str(pdf_path),
+                doc_id=manifest_row.doc_id,
+                member=manifest_row.last_name or ""
+            )
+
+        batch = []
+        for row_num, record in enumerate(records, 1):
+            trade_record = ingestion._parse_csv_row({
+                'DocID': manifest_row.doc_id,
+                'Prefix': manifest_row.prefix or "",
+                'FirstName': manifest_row.first_name or "",
+                'LastName': manifest_row.last_name or "",
+                'Owner': record.owner,
+                'Asset': record.asset,
+                'Transaction Type': record.transaction_type,
+                'Transaction Date': record.transaction_date,
+                'Notification Date': record.notification_date,
+                'Amount': record.amount,
+                'Filing Status': record.filing_status,
+                'Description': record.description,
+            }, row_num)
+            if trade_record:
+                batch.append(trade_record)
+
+        ingest_trade_batch(ingestion, session, batch, manifest_row.doc_id)
+
+        manifest_row.status = 'processed'
+        manifest_row.attempts += 1
+        manifest_row.trades_found = len(records)
+        manifest_row.last_error = None
+        manifest_row.processed_at = datetime.now(timezone.utc)
+        session.commit()
+        logger.info(f"Synced PTR {manifest_row.doc_id}: {len(records)} trades parsed, {len(batch)} queued for ingestion")
+        return len(records)
+
+    def _download_pdf(self, year: int, doc_id: str) -> bytes:
+        """Fetch a PTR PDF, retrying throttled responses after the limiter backs off."""
+        url = HOUSE_PTR_PDF_URL.format(year=year, doc_id=doc_id)
+        host = host_of(url)
+        for attempt in range(1, MAX_DOWNLOAD_ATTEMPTS + 1):
+            self.rate_limiter.acquire(host)
+            response = self.http.get(url, timeout=self.timeout)
+            self.rate_limiter.record_response(
+                host, response.status_code, parse_retry_after(response.headers.get('Retry-After'))
+            )
+            if response.status_code not in THROTTLE_STATUS_CODES or attempt == MAX_DOWNLOAD_ATTEMPTS:
+                break
+            logger.info(f"Download of {doc_id} throttled (HTTP {response.status_code}), attempt {attempt}/{MAX_DOWNLOAD_ATTEMPTS}")
+        response.raise_for_status()
+        return response.content
+
+    def _get_ingestion(self):
+        if self._ingestion is None:
+            from domains.congressional.ingestion import CongressionalDataIngestion
+            self._ingestion = CongressionalDataIngestion()
+        return self._ingestion
+
+    def _get_parser(self):
+        if self._parser is None:
+            from domains.congressional.pdf_parser import CongressionalPDFParser
+            from domains.securities.models import AssetType
+
+            ingestion = self._get_ingestion()
+            with db_manager.sync_session_scope() as session:
+                asset_dict = dict(session.execute(select(AssetType.code, AssetType.name)).all())
+            self._parser = CongressionalPDFParser(
+                tickers=set(ingestion.known_tickers),
+                asset_dict=asset_dict,
+                tickers_company={ticker: name for name, ticker in ingestion.company_names.items()}
+            )
+        return self._parser
+
+
+def sync_house_ptrs(years: List[int], rate_limiter: Optional[AdaptiveRateLimiter] = None) -> Dict[str, Any]:
+    """Run an incremental House PTR sync for each year."""
+    sync = HousePTRSync(rate_limiter=rate_limiter)
+    return {str(year): sync.sync_year(year) for year in years}
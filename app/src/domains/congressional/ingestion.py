@@ -8,29 +8,58 @@ This module handles the import and processing of congressional trade data with f
 - Comprehensive data quality reporting and batch processing
 """
 
-import re
 import csv as pycsv  # Avoid conflict with csv module
+import hashlib
+import io
 import json
 import logging
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Set, Any, BinaryIO
 from dataclasses import dataclass, field
 from pathlib import Path
 from decimal import Decimal
 
-from fuzzywuzzy import fuzz, process
-from sqlalchemy import text, or_
+from sqlalchemy import text, or_, and_, column, exists, func, select, tuple_, values, String
+from sqlalchemy.dialects.postgresql import insert as pg_insert, UUID as PG_UUID
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from core.database import db_manager
-from domains.congressional.models import CongressMember, CongressionalTrade
+from domains.congressional.models import CongressMember, CongressionalTrade, CongressionalImportProgress
 from domains.congressional.schemas import TradeOwner, FilingStatus, TransactionType
-from domains.congressional.data_quality import DataQualityEnhancer, QualityReport, ImportStatistics
+from domains.congressional.data_quality import (
+    DataQualityEnhancer, QualityReport, ImportStatistics, TickerExtractionResult,
+    DEFAULT_EXTRACTION_CACHE_SIZE
+)
+from domains.congressional.member_matching import MemberNameIndex
+from domains.congressional.date_parsing import DateParser, parse_date_full
+from domains.congressional.staging import TradeStagingStore, RAW_STAGE, PROCESSED_STAGE, source_key
 from domains.securities.models import Security
 
 logger = logging.getLogger(__name__)
 
+# Columns forming the natural key of a congressional trade (see unique_congressional_trade_natural_key)
+TRADE_NATURAL_KEY = ('doc_id', 'member_id', 'transaction_date', 'raw_asset_description')
+
+# Rows per multi-row INSERT statement; keeps bind parameters well under PostgreSQL's 32767 limit
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Files larger than this are split into byte ranges for parallel import
+PARALLEL_CSV_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Maximum trade IDs per notification task message
+NOTIFICATION_BATCH_SIZE = 1000
+
+# Transaction-scoped advisory lock serializing member auto-creation across concurrent imports
+MEMBER_AUTO_CREATE_LOCK_ID = 0x43534D45  # "CSME"
+
+# Leading name tokens stored as CongressMember.prefix (compared lowercased, without the period)
+MEMBER_NAME_HONORIFICS = {'hon', 'honorable', 'rep', 'sen', 'del', 'dr', 'mr', 'mrs', 'ms', 'miss'}
+
 @dataclass
 class TradeRecord:
     """Raw trade record from import source."""
@@ -86,22 +115,59 @@ class ProcessedTrade:
     validation_errors: List[str] = field(default_factory=list)
 
 
+@dataclass
+class IngestionReferenceData:
+    """Read-only lookup tables loaded once and shared with import worker processes."""
+    known_tickers: Set[str]
+    ticker_to_security_id: Dict[str, uuid.UUID]
+    company_names: Dict[str, str]
+    member_mapping: Dict[str, uuid.UUID]
+
+
+@dataclass
+class CsvImportChunk:
+    """A unit of work for parallel CSV import: a whole file or a byte range of one."""
+    csv_path: str
+    start_offset: Optional[int] = None  # None means "from the first data row"
+    end_offset: Optional[int] = None  # None means "to end of file"
+
+
 class CongressionalDataIngestion:
     """Enhanced congressional data ingestion with quality processing."""
     
-    def __init__(self, batch_size: int = 50, session: Optional[Session] = None):  # Reduced from 100 to 50
+    def __init__(self, batch_size: int = 50, session: Optional[Session] = None,  # Reduced from 100 to 50
+                 bulk_insert: bool = True, reference_data: Optional[IngestionReferenceData] = None,
+                 extraction_cache_size: int = DEFAULT_EXTRACTION_CACHE_SIZE,
+                 cache_snapshot_path: Optional[str] = None,
+                 staging: Optional[TradeStagingStore] = None):
         self.batch_size = batch_size
-        self.data_quality = DataQualityEnhancer()
+        self.bulk_insert = bulk_insert  # Set-based INSERT ... ON CONFLICT DO NOTHING per batch
+        self.data_quality = DataQualityEnhancer(
+            cache_size=extraction_cache_size,
+            cache_snapshot_path=cache_snapshot_path
+        )
         self.statistics = ImportStatistics()
+        # Date column parsing with per-file format detection
+        self.date_parser = DateParser()
         self.external_session = session  # For sync operations
+        # Parquet staging of raw and processed trades (optional)
+        self.staging = staging
+        self._stage_raw = True
         # Error collector
         self.error_counts = {}
         self.error_samples = {}
         self.error_records = []
         
-        # Load reference data
-        self._load_ticker_database()
-        self._load_member_mapping()
+        # Load reference data (worker processes receive it pre-loaded from the parent)
+        if reference_data:
+            self.known_tickers = reference_data.known_tickers
+            self.ticker_to_security_id = reference_data.ticker_to_security_id
+            self.company_names = reference_data.company_names
+            self.member_mapping = dict(reference_data.member_mapping)
+            self.member_index = MemberNameIndex.build(self.member_mapping)
+        else:
+            self._load_ticker_database()
+            self._load_member_mapping()
         self._load_company_ticker_mapping()
         
         # Processing state
@@ -110,6 +176,10 @@ class CongressionalDataIngestion:
         self.failed_records = 0
         self.session: Optional[Session] = None
         
+        # Auto-created members, and those not yet committed (name variations, export record)
+        self.auto_created_members = []
+        self._uncommitted_members: List[Tuple[List[str], Dict[str, Any]]] = []
+        
     def record_error(self, category, doc_id, member_name, message, row=None):
         self.error_counts[category] = self.error_counts.get(category, 0) + 1
         if category not in self.error_samples:
@@ -125,7 +195,7 @@ class CongressionalDataIngestion:
             securities = session.query(Security).filter(Security.is_active == True).all()
             
             self.known_tickers = {s.ticker.upper() for s in securities}
-            self.ticker_to_security = {s.ticker.upper(): s for s in securities}
+            self.ticker_to_security_id = {s.ticker.upper(): s.id for s in securities}
             
             # Also store by name for fuzzy matching
             self.company_names = {s.name.upper(): s.ticker.upper() for s in securities}
@@ -148,9 +218,21 @@ class CongressionalDataIngestion:
                 
                 for variation in variations:
                     self.member_mapping[variation] = member.id
+        
+        # Index for lookups that miss the exact variations above
+        self.member_index = MemberNameIndex.build(self.member_mapping)
                     
         logger.info(f"Loaded {len(self.member_mapping)} member name mappings")
     
+    def get_reference_data(self) -> IngestionReferenceData:
+        """Snapshot the loaded lookup tables for sharing with worker processes."""
+        return IngestionReferenceData(
+            known_tickers=self.known_tickers,
+            ticker_to_security_id=self.ticker_to_security_id,
+            company_names=self.company_names,
+            member_mapping=self.member_mapping,
+        )
+    
     def _load_company_ticker_mapping(self):
         """Load enhanced company name to ticker mapping."""
         # Common company name patterns that map to tickers
@@ -243,20 +325,42 @@ class CongressionalDataIngestion:
         # Combine all mappings
         self.company_ticker_mapping.update(self.etf_mappings)
         
-    def process_csv_file(self, csv_path: str, member_name: str = None) -> QualityReport:
-        """Process a CSV file of congressional trades."""
-        logger.info(f"Processing CSV file: {csv_path}")
+    def process_csv_file(self, csv_path: str, member_name: str = None,
+                         byte_range: Optional[Tuple[int, int]] = None) -> QualityReport:
+        """
+        Process a CSV file of congressional trades.
+        
+        Args:
+            csv_path: Path to the CSV file
+            member_name: Unused, kept for backwards compatibility
+            byte_range: Optional (start, end) byte offsets of whole records to process;
+                the header is always read from the start of the file
+        """
+        logger.info(f"Processing CSV file: {csv_path}" + (f" bytes {byte_range[0]}-{byte_range[1]}" if byte_range else ""))
         
         self.statistics.reset()
         self.statistics.import_start_time = datetime.now()
+        self.data_quality.cache.reset_stats()
+        self.date_parser.start_file()
+        self.member_index.clear_memo()
         
         try:
+            if self.staging is not None:
+                self.staging.open_source(source_key(csv_path, byte_range[0] if byte_range else None))
             with open(csv_path, 'r', encoding='utf-8') as file:
                 # Detect CSV format
                 dialect = pycsv.Sniffer().sniff(file.read(1024))
                 file.seek(0)
                 
-                reader = pycsv.DictReader(file, dialect=dialect)
+                if byte_range:
+                    header = next(pycsv.reader(file, dialect=dialect))
+                    reader = pycsv.DictReader(
+                        self._read_byte_range(csv_path, *byte_range),
+                        fieldnames=header,
+                        dialect=dialect
+                    )
+                else:
+                    reader = pycsv.DictReader(file, dialect=dialect)
                 
                 # Process in batches
                 with db_manager.sync_session_scope() as session:  # Use sync session scope
@@ -298,18 +402,278 @@ class CongressionalDataIngestion:
                         self._process_batch(batch)
                         
                     logger.info(f"Completed processing CSV file. Total rows processed: {total_rows}")
+                    logger.debug(f"Member name memo: {self.member_index.memo_hits} hits, {self.member_index.memo_misses} misses")
+                    
+        except Exception as e:
+            self.record_error('parse_error', '', '', str(e), None)
+            logger.error(f"Error processing CSV file: {e}")
+            self.statistics.processing_errors += 1
+            
+        finally:
+            if self.staging is not None:
+                self.staging.flush()
+            self.statistics.import_end_time = datetime.now()
+            self.session = None
+            
+        return self._generate_quality_report()
+    
+    def process_staged_trades(self, years: Optional[List[int]] = None) -> QualityReport:
+        """
+        Re-run enrichment and insertion over the raw Parquet stage.
+        
+        Rows are read with column pruning and already typed, so no CSV parsing or
+        date coercion happens; the processed stage of the affected years is rewritten.
+        
+        Args:
+            years: Transaction years to process (default: every staged year)
+        """
+        if self.staging is None:
+            raise ValueError("No staging store configured")
+        
+        years = list(years) if years is not None else self.staging.years(RAW_STAGE)
+        logger.info(f"Processing staged trades for years: {years}")
+        
+        self.statistics.reset()
+        self.statistics.import_start_time = datetime.now()
+        self.data_quality.cache.reset_stats()
+        self.staging.clear(PROCESSED_STAGE, years)
+        self._stage_raw = False
+        
+        try:
+            with db_manager.sync_session_scope() as session:
+                self.session = session
+                batch = []
+                for trade_record in self.staging.iter_raw_records(TradeRecord, years=years):
+                    batch.append(trade_record)
+                    if len(batch) >= self.batch_size:
+                        self._process_batch(batch)
+                        batch = []
+                if batch:
+                    self._process_batch(batch)
+                    
+        except Exception as e:
+            self.record_error('parse_error', '', '', str(e), None)
+            logger.error(f"Error processing staged trades: {e}")
+            self.statistics.processing_errors += 1
+            
+        finally:
+            self.staging.flush()
+            self._stage_raw = True
+            self.statistics.import_end_time = datetime.now()
+            self.session = None
+            
+        return self._generate_quality_report()
+    
+    def process_csv_file_resumable(self, csv_path: str) -> QualityReport:
+        """
+        Stream a CSV file in batches, checkpointing after every committed batch.
+        
+        The checkpoint (file hash, byte offset of the last consumed record, batch
+        number) lives in congressional_import_progress and is written in the same
+        transaction as the batch's trades, so a restarted import of the same file
+        content continues exactly where the last commit left off. A batch that fails
+        stops the import with the checkpoint left before it; rerunning retries it.
+        
+        Resumable imports are not staged to Parquet: staged files are written in
+        large groups, so an interrupted run would leave committed batches unstaged.
+        """
+        logger.info(f"Processing CSV file (resumable): {csv_path}")
+        
+        self.statistics.reset()
+        self.statistics.import_start_time = datetime.now()
+        self.data_quality.cache.reset_stats()
+        self.date_parser.start_file()
+        self.member_index.clear_memo()
+        staging, self.staging = self.staging, None
+        if staging is not None:
+            logger.info("Parquet staging is skipped for resumable imports")
+        
+        try:
+            file_hash = self._file_sha256(csv_path)
+            file_size = os.path.getsize(csv_path)
+            
+            with db_manager.sync_session_scope() as session:
+                self.session = session
+                progress = self._load_import_progress(file_hash, csv_path, file_size)
+                if progress.status == 'completed':
+                    logger.info(f"Skipping {csv_path}: already imported (checkpoint {progress.id})")
+                    return self._generate_quality_report()
+                
+                with open(csv_path, 'rb') as raw:
+                    # Detect CSV format
+                    dialect = pycsv.Sniffer().sniff(raw.read(1024).decode('utf-8', errors='ignore'))
+                    raw.seek(0)
+                    
+                    header_end, header_record = next(self._iter_csv_records(raw))
+                    header = next(pycsv.reader(io.StringIO(header_record.decode('utf-8')), dialect=dialect))
+                    
+                    start_offset = max(progress.byte_offset, header_end)
+                    if start_offset > header_end:
+                        logger.info(f"Resuming {csv_path} at byte {start_offset} "
+                                    f"(record {progress.records_read}, batch {progress.last_batch})")
+                    raw.seek(start_offset)
+                    
+                    position = {'offset': start_offset}
                     
+                    def records() -> Iterator[str]:
+                        for end_offset, record in self._iter_csv_records(raw):
+                            position['offset'] = end_offset
+                            yield record.decode('utf-8')
+                    
+                    reader = pycsv.DictReader(records(), fieldnames=header, dialect=dialect)
+                    batch = []
+                    batch_number = progress.last_batch
+                    row_num = progress.records_read
+                    
+                    for row in reader:
+                        row_num += 1
+                        try:
+                            trade_record = self._parse_csv_row(row, row_num)
+                            if trade_record:
+                                batch.append(trade_record)
+                        except Exception as e:
+                            self.record_error('parse_error', row.get('DocID', ''), row.get('Member', ''), str(e), row)
+                            logger.error(f"Error processing row {row_num}: {e}")
+                            self.statistics.processing_errors += 1
+                        
+                        if len(batch) >= self.batch_size:
+                            batch_number += 1
+                            if not self._commit_checkpointed_batch(progress, batch, position['offset'], row_num, batch_number):
+                                return self._generate_quality_report()
+                            batch = []
+                    
+                    # Final batch (also records the end-of-file offset)
+                    batch_number += 1
+                    if not self._commit_checkpointed_batch(progress, batch, position['offset'], row_num, batch_number):
+                        return self._generate_quality_report()
+                
+                progress.status = 'completed'
+                progress.completed_at = datetime.now()
+                session.commit()
+                logger.info(f"Completed resumable import of {csv_path}: {row_num} records, {batch_number} batches")
+                
         except Exception as e:
             self.record_error('parse_error', '', '', str(e), None)
             logger.error(f"Error processing CSV file: {e}")
             self.statistics.processing_errors += 1
             
         finally:
+            self.staging = staging
             self.statistics.import_end_time = datetime.now()
             self.session = None
             
         return self._generate_quality_report()
     
+    def _commit_checkpointed_batch(self, progress: CongressionalImportProgress, batch: List[TradeRecord],
+                                   byte_offset: int, records_read: int, batch_number: int) -> bool:
+        """Process a batch and commit it together with its checkpoint; returns False if it failed."""
+        # Staged before processing so the commit in _insert_trades persists both
+        progress.byte_offset = byte_offset
+        progress.records_read = records_read
+        progress.last_batch = batch_number
+        
+        if batch and not self._process_batch(batch):
+            self.session.rollback()  # Also discards the staged checkpoint
+            logger.error(f"Batch {batch_number} failed; import of {progress.file_path} stopped at byte "
+                         f"{progress.byte_offset} and can be resumed")
+            progress.status = 'failed'
+            progress.last_error = f"Batch {batch_number} failed"
+            self.session.commit()
+            return False
+        
+        # Commits the checkpoint on its own when the batch had nothing to insert
+        self.session.commit()
+        return True
+    
+    def _load_import_progress(self, file_hash: str, csv_path: str, file_size: int) -> CongressionalImportProgress:
+        """Fetch the checkpoint for a file's content, creating one at the start of the file if needed."""
+        progress = self.session.query(CongressionalImportProgress).filter(
+            CongressionalImportProgress.file_hash == file_hash
+        ).first()
+        if progress is None:
+            progress = CongressionalImportProgress(
+                file_hash=file_hash,
+                file_path=str(csv_path),
+                file_size=file_size,
+                byte_offset=0,
+                records_read=0,
+                last_batch=0,
+                status='in_progress'
+            )
+            self.session.add(progress)
+        elif progress.status == 'failed':
+            progress.status = 'in_progress'
+            progress.last_error = None
+        self.session.commit()
+        return progress
+    
+    @staticmethod
+    def _file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+        """SHA-256 hex digest of a file's content."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _read_byte_range(csv_path: str, start: int, end: int) -> io.StringIO:
+        """Read the records between two byte offsets of a CSV file."""
+        with open(csv_path, 'rb') as raw:
+            raw.seek(start)
+            data = raw.read(end - start)
+        return io.StringIO(data.decode('utf-8'))
+    
+    @staticmethod
+    def split_csv_byte_ranges(csv_path: str, chunk_bytes: int = PARALLEL_CSV_CHUNK_BYTES) -> List[CsvImportChunk]:
+        """
+        Split a CSV file into byte ranges of roughly chunk_bytes each.
+        
+        Boundaries are placed only at line ends outside quoted fields, so a quoted
+        description containing newlines is never cut in half. The header row is
+        excluded from every range.
+        """
+        file_size = os.path.getsize(csv_path)
+        if file_size <= chunk_bytes:
+            return [CsvImportChunk(csv_path=csv_path)]
+        
+        chunks = []
+        with open(csv_path, 'rb') as raw:
+            offset = 0
+            chunk_start = None
+            for offset, _ in CongressionalDataIngestion._iter_csv_records(raw):
+                if chunk_start is None:
+                    # End of the header record
+                    chunk_start = offset
+                elif offset - chunk_start >= chunk_bytes:
+                    chunks.append(CsvImportChunk(csv_path, chunk_start, offset))
+                    chunk_start = offset
+            if chunk_start is not None and chunk_start < offset:
+                chunks.append(CsvImportChunk(csv_path, chunk_start, offset))
+        return chunks
+    
+    @staticmethod
+    def _iter_csv_records(raw: BinaryIO) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yield (end offset, record bytes) for each CSV record from the current file position.
+        
+        Records end at line ends outside quoted fields, so a quoted description
+        containing newlines is yielded as one record.
+        """
+        offset = raw.tell()
+        in_quotes = False
+        record = []
+        for line in raw:
+            offset += len(line)
+            record.append(line)
+            if line.count(b'"') % 2:
+                in_quotes = not in_quotes
+            if not in_quotes:
+                yield offset, b''.join(record)
+                record = []
+        if record:
+            yield offset, b''.join(record)
+    
     def _parse_csv_row(self, row: Dict[str, str], row_num: int) -> Optional[TradeRecord]:
         """Parse a CSV row into a TradeRecord."""
         try:
@@ -341,7 +705,7 @@ class CongressionalDataIngestion:
                 else:
                     # Try extracting a date from description text as last resort
                     description_text = row.get('Description', '') or row.get('comment', '') or ''
-                    inferred_date = self._parse_date(description_text)
+                    inferred_date = parse_date_full(description_text)
                     if inferred_date:
                         transaction_date = inferred_date
                         date_notes.append('transaction_date_inferred_from_description')
@@ -374,135 +738,67 @@ class CongressionalDataIngestion:
             return None
     
     def _parse_date(self, date_str: str) -> Optional[date]:
-        """Parse date string with multiple format support and sanitization.
-
-        Handles placeholders like 'S', '[ST]', words leaking into the field,
-        and scans arbitrary text to extract a date token if needed.
-        """
-        if not date_str:
-            return None
-        
-        # Normalize input to string
-        raw = str(date_str).strip()
-        if not raw:
-            return None
-        
-        # Fast reject common non-dates/placeholders
-        placeholders = {"S", "[ST]", "ST", "N/A", "NA", "NONE", "-"}
-        if raw.upper() in placeholders:
-            return None
-        
-        # If the string is clearly just a year with 2 or 4 digits, try to coerce
-        if raw.isdigit():
-            if len(raw) == 4:
-                # Year-only -> choose Jan 1 of that year
-                try:
-                    return date(int(raw), 1, 1)
-                except ValueError:
-                    pass
-            elif len(raw) == 2:
-                # Two-digit year, assume 20xx for 00-30 else 19xx
-                try:
-                    yy = int(raw)
-                    century = 2000 if yy <= 30 else 1900
-                    return date(century + yy, 1, 1)
-                except ValueError:
-                    pass
-        
-        # Try structured formats first
-        formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%d %H:%M:%S',
-            '%m/%d/%Y',
-            '%d/%m/%Y',
-            '%m/%d/%Y %H:%M:%S',
-        ]
-        for fmt in formats:
-            try:
-                return datetime.strptime(raw, fmt).date()
-            except ValueError:
-                continue
-        
-        # Handle two-digit year in slash format (e.g., 2/18/22)
-        try:
-            mdy = datetime.strptime(raw, '%m/%d/%y').date()
-            # Normalize 2-digit year into 19xx/20xx similar to above assumption
-            yy = int(raw.split('/')[-1])
-            century = 2000 if yy <= 30 else 1900
-            return date(century + mdy.year % 100, mdy.month, mdy.day)
-        except ValueError:
-            pass
-        
-        # As a last resort, scan the string for a date token using regex
-        # - ISO: YYYY-MM-DD
-        # - M/D/YY(YY)
-        iso_match = re.search(r"\b(\d{4})-(\d{2})-(\d{2})\b", raw)
-        if iso_match:
-            try:
-                y, m, d = map(int, iso_match.groups())
-                return date(y, m, d)
-            except ValueError:
-                pass
-        mdy_match = re.search(r"\b(\d{1,2})/(\d{1,2})/(\d{2,4})\b", raw)
-        if mdy_match:
-            try:
-                m, d, y = mdy_match.groups()
-                m = int(m)
-                d = int(d)
-                if len(y) == 2:
-                    yy = int(y)
-                    y = 2000 + yy if yy <= 30 else 1900 + yy
-                else:
-                    y = int(y)
-                return date(y, m, d)
-            except ValueError:
-                pass
-        
-        logger.warning(f"Could not parse date: {raw}")
-        return None
+        """Parse a date column value; see DateParser for the per-file fast path."""
+        return self.date_parser.parse(date_str)
     
-    def _process_batch(self, batch: List[TradeRecord]):
-        """Process a batch of trade records with transaction management."""
+    def _process_batch(self, batch: List[TradeRecord]) -> bool:
+        """Process a batch of trade records with transaction management; returns False if the batch failed."""
         # logger.info(f"Processing batch of {len(batch)} records")
         
         try:
             processed_trades = []
             start_time = datetime.now()
             
+            # Create members missing from the mapping once per batch, inside the batch transaction
+            self._create_missing_members(batch)
+            
+            # Extract tickers for the whole batch so fuzzy company matching is scored in one pass
+            ticker_results = self.data_quality.extract_tickers(
+                [trade_record.raw_asset_description for trade_record in batch]
+            )
+            
             for i, trade_record in enumerate(batch):
                 # Add progress indicator every 1000 records
                 if i % 1000 == 0 and i > 0:
                     elapsed = (datetime.now() - start_time).total_seconds()
                     logger.info(f"Processed {i}/{len(batch)} records in current batch (elapsed: {elapsed:.1f}s)")
                 
-                # Add timeout check - if processing takes too long, skip remaining records
-                if i > 0 and (datetime.now() - start_time).total_seconds() > 300:  # 5 minute timeout
-                    logger.warning(f"Batch processing timeout after {i} records, skipping remaining {len(batch) - i} records")
-                    break
-                
-                processed_trade = self._process_single_trade(trade_record)
+                processed_trade = self._process_single_trade(trade_record, ticker_results[i])
                 if processed_trade:
                     processed_trades.append(processed_trade)
                     
             # Insert valid trades
             valid_trades = [t for t in processed_trades if t.is_valid]
             self._insert_trades(valid_trades)
+            if self._uncommitted_members:
+                # Nothing was inserted: commit the new members on their own
+                self.session.commit()
+            self._uncommitted_members = []
             
             # Update statistics
             self.statistics.records_processed += len(batch)
             self.statistics.records_successful += len(valid_trades)
             self.statistics.records_failed += len(batch) - len(valid_trades)
             
+            if self.staging is not None:
+                if self._stage_raw:
+                    self.staging.add_raw(batch)
+                self.staging.add_processed(processed_trades)
+            
             # Log batch summary
             elapsed = (datetime.now() - start_time).total_seconds()
             # logger.info(f"Batch processed: {len(valid_trades)}/{len(batch)} successful (elapsed: {elapsed:.1f}s)")
+            return True
             
         except Exception as e:
             logger.error(f"Error processing batch: {e}")
             self.statistics.processing_errors += 1
-            # Rollback handled by session_scope context manager
+            self.session.rollback()
+            self._discard_uncommitted_members()
+            return False
             
-    def _process_single_trade(self, trade_record: TradeRecord) -> Optional[ProcessedTrade]:
+    def _process_single_trade(self, trade_record: TradeRecord,
+                              ticker_result: Optional[TickerExtractionResult] = None) -> Optional[ProcessedTrade]:
         """Process a single trade record with quality enhancement."""
         try:
             # Increment processed records counter
@@ -518,7 +814,8 @@ class CongressionalDataIngestion:
                 return None
                 
             # Enhance ticker extraction
-            ticker_result = self.data_quality.extract_ticker(trade_record.raw_asset_description)
+            if ticker_result is None:
+                ticker_result = self.data_quality.extract_ticker(trade_record.raw_asset_description)
             
             # Normalize amount
             amount_result = self.data_quality.normalize_amount(trade_record.amount)
@@ -591,61 +888,103 @@ class CongressionalDataIngestion:
         if lf_name in self.member_mapping:
             return self.member_mapping[lf_name]
 
-        # Try partial match on first name (case-insensitive)
-        for key in self.member_mapping.keys():
-            if last_name in key and (first_name[:2] in key):
-                logger.debug(f"Partial match for member: {member_name} -> {key}")
-                return self.member_mapping[key]
-
-        # Fuzzy match with lower threshold
-        best_match = process.extractOne(
-            fl_name,
-            self.member_mapping.keys(),
-            scorer=fuzz.ratio,
-            score_cutoff=70
-        )
-        if best_match:
-            logger.debug(f"Fuzzy matched member: {member_name} -> {best_match[0]}")
-            return self.member_mapping[best_match[0]]
+        # Partial (last name bucket) then bounded fuzzy match, memoized per file
+        member_id = self.member_index.resolve(normalized_name, first_name, last_name)
+        if member_id:
+            return member_id
             
         # If still not found, auto-create member if trade_record is provided
         if trade_record:
-            new_member_id = self.create_member_from_trade(trade_record)
-            if new_member_id:
-                logger.info(f"Auto-created new member: {trade_record.member_name}")
-                return new_member_id
+            return self.create_member_from_trade(trade_record)
 
         return None
     
     def create_member_from_trade(self, trade_record: 'TradeRecord') -> Optional[int]:
         """Create a new CongressMember from trade record and add to DB. Log and export."""
-        # Only use first and last name, ignore prefix
-        name_parts = trade_record.member_name.strip().split()
-        first_name = name_parts[1] if len(name_parts) > 1 else ''
-        last_name = name_parts[-1] if len(name_parts) > 0 else ''
-        full_name = f"{first_name} {last_name}".strip()
-        # Check for duplicate (same first and last name)
-        with db_manager.sync_session_scope() as session:
-            existing = session.query(CongressMember).filter(
-                CongressMember.first_name.ilike(first_name),
-                CongressMember.last_name.ilike(last_name)
-            ).first()
-            if existing:
-                logger.debug(f"Duplicate member found, not auto-creating: {full_name}")
-                return existing.id
-            # Create new member
-            new_member = CongressMember(
-                first_name=first_name,
-                last_name=last_name,
-                full_name=full_name,
-                prefix=name_parts[0] if len(name_parts) > 2 else None,
-                party=None,
-                chamber=None,
-                state=None,
-                district=None
+        first_name, last_name, _ = self._split_trade_member_name(trade_record.member_name)
+        return self.create_members_from_trades([trade_record]).get((first_name.lower(), last_name.lower()))
+    
+    def _create_missing_members(self, batch: List[TradeRecord]):
+        """Auto-create, in one statement, every member of a batch that cannot be resolved."""
+        unresolved: List[TradeRecord] = []
+        seen: Set[str] = set()
+        for trade_record in batch:
+            name = (trade_record.member_name or '').upper().strip()
+            if not name or name in seen:
+                continue
+            seen.add(name)
+            if not self._resolve_member_id(trade_record.member_name):
+                unresolved.append(trade_record)
+        if unresolved:
+            self.create_members_from_trades(unresolved)
+    
+    def create_members_from_trades(self, trade_records: List['TradeRecord']) -> Dict[Tuple[str, str], Any]:
+        """
+        Create missing CongressMembers for trade records in the current session.
+        
+        Names are de-duplicated on (first, last), case-insensitively, and inserted
+        with a single INSERT ... SELECT that skips members already stored; the IDs
+        of new and existing members are then read back with one query. Nothing is
+        committed here: the members become durable with the batch that needed them.
+        
+        Returns:
+            Mapping of (first name, last name), lowercased, to member ID
+        """
+        candidates: Dict[Tuple[str, str], Tuple['TradeRecord', str, str, Optional[str]]] = {}
+        for trade_record in trade_records:
+            first_name, last_name, prefix = self._split_trade_member_name(trade_record.member_name)
+            candidates.setdefault((first_name.lower(), last_name.lower()), (trade_record, first_name, last_name, prefix))
+        if not candidates:
+            return {}
+        
+        new_members = values(
+            column('id', PG_UUID(as_uuid=True)),
+            column('first_name', String),
+            column('last_name', String),
+            column('full_name', String),
+            column('prefix', String),
+            name='new_members'
+        ).data([
+            (uuid.uuid4(), first_name, last_name, f"{first_name} {last_name}".strip(), prefix)
+            for _, first_name, last_name, prefix in candidates.values()
+        ])
+        already_stored = exists().where(and_(
+            func.lower(CongressMember.first_name) == func.lower(new_members.c.first_name),
+            func.lower(CongressMember.last_name) == func.lower(new_members.c.last_name)
+        ))
+        insert_stmt = (
+            pg_insert(CongressMember)
+            .from_select(
+                ['id', 'first_name', 'last_name', 'full_name', 'prefix'],
+                select(new_members).where(~already_stored)
             )
-            session.add(new_member)
-            session.commit()
+            .returning(CongressMember.first_name, CongressMember.last_name)
+        )
+        
+        # Serialize with concurrent imports (e.g. parallel workers) until this transaction ends
+        self.session.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {'lock_id': MEMBER_AUTO_CREATE_LOCK_ID})
+        try:
+            # Savepoint so a rejected member row doesn't abort the whole batch transaction;
+            # trades of members that could not be created fail individually instead
+            with self.session.begin_nested():
+                created = {(row.first_name.lower(), row.last_name.lower()) for row in self.session.execute(insert_stmt)}
+        except Exception as e:
+            logger.error(f"Auto-creating {len(candidates)} members failed: {e}")
+            self.record_error('member_create_error', '', '', str(e), '')
+            created = set()
+        
+        rows = self.session.execute(
+            select(CongressMember.id, CongressMember.first_name, CongressMember.last_name)
+            .where(tuple_(func.lower(CongressMember.first_name), func.lower(CongressMember.last_name)).in_(list(candidates)))
+            .order_by(CongressMember.created_at)
+        )
+        member_ids: Dict[Tuple[str, str], Any] = {}
+        for row in rows:
+            member_ids.setdefault((row.first_name.lower(), row.last_name.lower()), row.id)
+        
+        for key, member_id in member_ids.items():
+            trade_record, first_name, last_name, prefix = candidates[key]
+            full_name = f"{first_name} {last_name}".strip()
             # Add to mapping for future lookups
             variations = [
                 full_name.upper(),
@@ -653,20 +992,51 @@ class CongressionalDataIngestion:
                 f"{last_name}, {first_name}".upper(),
             ]
             for variation in variations:
-                self.member_mapping[variation] = new_member.id
+                self.member_mapping[variation] = member_id
+                self.member_index.add(variation, member_id)
+            
+            if key not in created:
+                logger.debug(f"Duplicate member found, not auto-creating: {full_name}")
+                continue
             # Log and export
-            self.auto_created_members = getattr(self, 'auto_created_members', [])
-            self.auto_created_members.append({
+            record = {
                 'first_name': first_name,
                 'last_name': last_name,
                 'full_name': full_name,
-                'prefix': name_parts[0] if len(name_parts) > 2 else '',
+                'prefix': prefix or '',
                 'source_doc_id': trade_record.doc_id,
                 'source_line': trade_record.source_line
-            })
-            logger.debug(f"Auto-created member: {full_name}")
-            return new_member.id
-
+            }
+            self.auto_created_members.append(record)
+            self._uncommitted_members.append((variations, record))
+            logger.info(f"Auto-created new member: {trade_record.member_name}")
+        
+        return member_ids
+    
+    def _discard_uncommitted_members(self):
+        """Forget members whose creation was rolled back together with a failed batch."""
+        if not self._uncommitted_members:
+            return
+        for variations, record in self._uncommitted_members:
+            for variation in variations:
+                self.member_mapping.pop(variation, None)
+            if record in self.auto_created_members:
+                self.auto_created_members.remove(record)
+        self._uncommitted_members = []
+        self.member_index = MemberNameIndex.build(self.member_mapping)
+    
+    @staticmethod
+    def _split_trade_member_name(member_name: str) -> Tuple[str, str, Optional[str]]:
+        """(first, last, prefix) of a filer name; only first and last name are used for matching."""
+        name_parts = member_name.strip().split()
+        first_name = name_parts[1] if len(name_parts) > 1 else ''
+        last_name = name_parts[-1] if len(name_parts) > 0 else ''
+        # Only a recognised honorific is a prefix; otherwise the first word is a first name
+        prefix = None
+        if len(name_parts) > 2 and name_parts[0].rstrip('.').lower() in MEMBER_NAME_HONORIFICS:
+            prefix = name_parts[0]
+        return first_name, last_name, prefix
+    
     def export_auto_created_members(self, path='logs/auto_created_members.csv'):
         if not hasattr(self, 'auto_created_members') or not self.auto_created_members:
             return
@@ -684,9 +1054,7 @@ class CongressionalDataIngestion:
         if not ticker:
             return None
             
-        ticker_upper = ticker.upper()
-        security = self.ticker_to_security.get(ticker_upper)
-        return security.id if security else None
+        return self.ticker_to_security_id.get(ticker.upper())
     
     def _parse_filing_status(self, status: str) -> Optional[FilingStatus]:
         """Parse filing status string."""
@@ -738,13 +1106,79 @@ class CongressionalDataIngestion:
         trade.validation_errors = errors
         trade.is_valid = len(errors) == 0
     
-    def _insert_trades(self, trades: List[ProcessedTrade]):
-        """Insert processed trades into database with diagnostics."""
+    def _insert_trades(self, trades: List[ProcessedTrade]) -> List[uuid.UUID]:
+        """Insert processed trades into database and return the IDs of newly inserted rows."""
         if not trades:
             logger.debug("No trades to insert.")
-            return
+            return []
         logger.debug(f"Attempting to insert {len(trades)} trades.")
-        inserted = 0
+        
+        if self.bulk_insert:
+            inserted_ids = self._bulk_insert_trades(trades)
+        else:
+            inserted_ids = self._insert_trades_individually(trades)
+        
+        try:
+            self.session.commit()
+            logger.debug(f"Committed {len(inserted_ids)} trades to the database.")
+            
+            # Trigger notifications for new trades
+            if inserted_ids:
+                self._trigger_trade_notifications(inserted_ids)
+                
+        except Exception as e:
+            logger.error(f"DB commit failed: {e}")
+            self.record_error('db_commit_error', '', '', str(e), '')
+            self.session.rollback()
+            raise
+        logger.info(f"Inserted {len(inserted_ids)} trades")
+        return inserted_ids
+    
+    def _bulk_insert_trades(self, trades: List[ProcessedTrade]) -> List[uuid.UUID]:
+        """
+        Insert trades with multi-row INSERT ... ON CONFLICT DO NOTHING statements.
+        
+        Duplicates (already stored or repeated within the batch) are skipped by the
+        database via the natural-key unique constraint, so the cost is one round trip
+        per chunk instead of a SELECT plus INSERT per trade. RETURNING reports exactly
+        which rows were written.
+        """
+        # De-duplicate within the batch so each natural key is sent once
+        unique_trades: Dict[Tuple, ProcessedTrade] = {}
+        for trade in trades:
+            unique_trades.setdefault(self._trade_key(trade), trade)
+        
+        inserted_ids: List[uuid.UUID] = []
+        pending = list(unique_trades.values())
+        
+        for start in range(0, len(pending), BULK_INSERT_CHUNK_SIZE):
+            chunk = pending[start:start + BULK_INSERT_CHUNK_SIZE]
+            stmt = (
+                pg_insert(CongressionalTrade)
+                .values([self._trade_to_row(trade) for trade in chunk])
+                .on_conflict_do_nothing(index_elements=list(TRADE_NATURAL_KEY))
+                .returning(CongressionalTrade.id)
+            )
+            try:
+                # Savepoint so a failed chunk doesn't poison the rest of the batch
+                with self.session.begin_nested():
+                    rows = self.session.execute(stmt).all()
+            except Exception as e:
+                logger.error(f"Bulk insert of {len(chunk)} trades failed: {e}")
+                for trade in chunk:
+                    self.record_error('db_insert_error', trade.doc_id, trade.member_id, str(e), str(trade))
+                continue
+            
+            inserted_ids.extend(row.id for row in rows)
+        
+        skipped = len(trades) - len(inserted_ids)
+        if skipped:
+            logger.debug(f"Skipped {skipped} duplicate or failed trades in bulk insert")
+        return inserted_ids
+    
+    def _insert_trades_individually(self, trades: List[ProcessedTrade]) -> List[uuid.UUID]:
+        """Insert trades one at a time with a duplicate check per trade (legacy path)."""
+        inserted_ids: List[uuid.UUID] = []
         for trade in trades:
             try:
                 existing = self.session.query(CongressionalTrade).filter(
@@ -756,69 +1190,62 @@ class CongressionalDataIngestion:
                 if existing:
                     logger.debug(f"Duplicate trade found, skipping: {trade.doc_id}")
                     continue
-                db_trade = CongressionalTrade(
-                    doc_id=trade.doc_id,
-                    member_id=trade.member_id,
-                    security_id=trade.security_id,
-                    raw_asset_description=trade.raw_asset_description,
-                    ticker=trade.ticker,
-                    asset_name=trade.asset_name,
-                    asset_type=trade.asset_type,
-                    transaction_type=trade.transaction_type,
-                    transaction_date=trade.transaction_date,
-                    notification_date=trade.notification_date,
-                    owner=trade.owner.value if trade.owner else None,
-                    amount_min=trade.amount_min,
-                    amount_max=trade.amount_max,
-                    amount_exact=trade.amount_exact,
-                    filing_status=trade.filing_status.value if trade.filing_status else None,
-                    comment=trade.comment,
-                    cap_gains_over_200=trade.cap_gains_over_200,
-                    ticker_confidence=trade.ticker_confidence,
-                    amount_confidence=trade.amount_confidence,
-                    parsed_successfully=trade.parsed_successfully,
-                    parsing_notes='; '.join(trade.parsing_notes) if trade.parsing_notes else None
-                )
+                db_trade = CongressionalTrade(**self._trade_to_row(trade))
                 self.session.add(db_trade)
-                inserted += 1
+                inserted_ids.append(db_trade.id)
             except Exception as e:
                 logger.error(f"Error inserting trade: {e}")
                 self.record_error('db_insert_error', getattr(trade, 'doc_id', ''), getattr(trade, 'member_id', ''), str(e), str(trade))
                 continue
-        try:
-            self.session.commit()
-            logger.debug(f"Committed {inserted} trades to the database.")
-            
-            # NEW: Trigger notifications for new trades
-            if inserted > 0:
-                self._trigger_trade_notifications(trades[:inserted])
-                
-        except Exception as e:
-            logger.error(f"DB commit failed: {e}")
-            self.record_error('db_commit_error', '', '', str(e), '')
-            self.session.rollback()
-        logger.info(f"Inserted {inserted} trades")
+        return inserted_ids
+    
+    @staticmethod
+    def _trade_key(trade: ProcessedTrade) -> Tuple:
+        """Natural key of a processed trade, matching TRADE_NATURAL_KEY."""
+        return (trade.doc_id, trade.member_id, trade.transaction_date, trade.raw_asset_description)
+    
+    @staticmethod
+    def _trade_to_row(trade: ProcessedTrade) -> Dict[str, Any]:
+        """Convert a processed trade into CongressionalTrade column values."""
+        return {
+            'id': uuid.uuid4(),
+            'doc_id': trade.doc_id,
+            'member_id': trade.member_id,
+            'security_id': trade.security_id,
+            'raw_asset_description': trade.raw_asset_description,
+            'ticker': trade.ticker,
+            'asset_name': trade.asset_name,
+            'asset_type': trade.asset_type,
+            'transaction_type': trade.transaction_type,
+            'transaction_date': trade.transaction_date,
+            'notification_date': trade.notification_date,
+            'owner': trade.owner.value if trade.owner else None,
+            'amount_min': trade.amount_min,
+            'amount_max': trade.amount_max,
+            'amount_exact': trade.amount_exact,
+            'filing_status': trade.filing_status.value if trade.filing_status else None,
+            'comment': trade.comment,
+            'cap_gains_over_200': trade.cap_gains_over_200,
+            'ticker_confidence': trade.ticker_confidence,
+            'amount_confidence': trade.amount_confidence,
+            'parsed_successfully': trade.parsed_successfully,
+            'parsing_notes': '; '.join(trade.parsing_notes) if trade.parsing_notes else None,
+        }
     
-    def _trigger_trade_notifications(self, trades: List[ProcessedTrade]):
-        """Trigger notification processing for newly inserted trades."""
+    def _trigger_trade_notifications(self, trade_ids: List[uuid.UUID]):
+        """Queue batched notification processing for trades inserted in one commit."""
         try:
             # Import here to avoid circular imports
-            from background.tasks import process_new_trade_notifications
+            from background.tasks import process_new_trade_notifications_batch
             
-            for trade in trades:
+            for start in range(0, len(trade_ids), NOTIFICATION_BATCH_SIZE):
+                chunk = [str(trade_id) for trade_id in trade_ids[start:start + NOTIFICATION_BATCH_SIZE]]
                 try:
-                    # Schedule background task for each new trade
-                    # We pass the doc_id and member_id to find the trade later
-                    process_new_trade_notifications.delay(
-                        doc_id=trade.doc_id,
-                        member_id=str(trade.member_id),
-                        transaction_date=trade.transaction_date.isoformat()
-                    )
-                    logger.debug(f"Scheduled notification task for trade {trade.doc_id}")
+                    process_new_trade_notifications_batch.delay(trade_ids=chunk)
                 except Exception as e:
-                    logger.error(f"Failed to schedule notification for trade {trade.doc_id}: {e}")
+                    logger.error(f"Failed to schedule notifications for {len(chunk)} trades: {e}")
             
-            logger.info(f"Triggered notification processing for {len(trades)} new trades")
+            logger.info(f"Triggered notification processing for {len(trade_ids)} new trades")
             
         except Exception as e:
             logger.error(f"Error triggering trade notifications: {e}")
@@ -826,6 +1253,7 @@ class CongressionalDataIngestion:
     
     def _generate_quality_report(self) -> QualityReport:
         """Generate comprehensive quality report."""
+        cache_hits, cache_misses = self.data_quality.cache_stats()
         return QualityReport(
             total_records=self.statistics.records_processed,
             successful_records=self.statistics.records_successful,
@@ -836,7 +1264,9 @@ class CongressionalDataIngestion:
             owner_normalization_rate=self._calculate_owner_normalization_rate(),
             duplicate_count=self._count_duplicates(),
             processing_time=self.statistics.processing_time_seconds,
-            recommendations=self._generate_recommendations()
+            recommendations=self._generate_recommendations(),
+            cache_hits=cache_hits,
+            cache_misses=cache_misses
         )
     
     def _calculate_ticker_extraction_rate(self) -> float:
@@ -988,19 +1418,22 @@ class CongressionalDataIngestion:
         print(summary)
         logger.info(summary)
 
-    def import_congressional_data_from_csvs_sync(self, csv_directory: str) -> Dict[str, Any]:
+    def import_congressional_data_from_csvs_sync(self, csv_directory: str, workers: int = 1,
+                                                 chunk_bytes: int = PARALLEL_CSV_CHUNK_BYTES,
+                                                 resumable: bool = False) -> Dict[str, Any]:
         """
         Import congressional data from CSV files in a directory (synchronous version).
         
         Args:
             csv_directory: Path to directory containing CSV files
+            workers: Number of worker processes; values above 1 enable the parallel import mode
+            chunk_bytes: In parallel mode, files larger than this are split into byte ranges
+            resumable: Stream each file with per-batch checkpoints and resume unfinished files
+                (sequential only)
             
         Returns:
             Dictionary with import results and statistics
         """
-        import os
-        from pathlib import Path
-        
         logger.info(f"Starting CSV import from directory: {csv_directory}")
         
         csv_dir = Path(csv_directory)
@@ -1024,6 +1457,11 @@ class CongressionalDataIngestion:
             "files": []
         }
         
+        if workers > 1:
+            if resumable:
+                raise ValueError("Resumable import is sequential; use workers=1")
+            return self._import_csvs_parallel(csv_files, results, workers, chunk_bytes)
+        
         # Use external session if provided, otherwise create sync session scope
         if self.external_session:
             session_context = self.external_session
@@ -1044,7 +1482,10 @@ class CongressionalDataIngestion:
                     print(f"📁 Processing: {csv_file.name}")
                     
                     # Process the file
-                    report = self.process_csv_file(str(csv_file))
+                    if resumable:
+                        report = self.process_csv_file_resumable(str(csv_file))
+                    else:
+                        report = self.process_csv_file(str(csv_file))
                     
                     # Update results
                     results["files_processed"] += 1
@@ -1084,9 +1525,111 @@ class CongressionalDataIngestion:
         finally:
             self.session = None
         
+        self.data_quality.save_cache_snapshot()
+        
         logger.info(f"CSV import completed: {results['successful_records']}/{results['total_records']} records successful")
         return results
 
+    def _import_csvs_parallel(self, csv_files: List[Path], results: Dict[str, Any], workers: int,
+                              chunk_bytes: int) -> Dict[str, Any]:
+        """
+        Import CSV files across a pool of worker processes.
+        
+        Each file (or byte range of a large file) is processed by a worker holding its
+        own database connection and a copy of this instance's reference data, so the
+        securities and member tables are queried once rather than once per worker.
+        Per-chunk statistics, errors and quality reports are merged back into this
+        instance.
+        """
+        chunks: List[CsvImportChunk] = []
+        for csv_file in sorted(csv_files):
+            chunks.extend(self.split_csv_byte_ranges(str(csv_file), chunk_bytes))
+        
+        logger.info(f"Parallel CSV import: {len(csv_files)} files in {len(chunks)} chunks across {workers} workers")
+        
+        if self.staging is not None:
+            # Drop each file's staged rows from earlier runs, however they were chunked
+            for csv_file in csv_files:
+                self.staging.open_source(source_key(str(csv_file)))
+        
+        self.statistics.reset()
+        self.statistics.import_start_time = datetime.now()
+        file_reports: Dict[str, List[QualityReport]] = {}
+        file_errors: Dict[str, str] = {}
+        
+        # spawn: workers must not inherit the parent's database connections
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_import_worker,
+            initargs=(
+                self.get_reference_data(),
+                self.batch_size,
+                self.bulk_insert,
+                self.data_quality.cache.max_size,
+                self.data_quality.cache_snapshot_path,
+                str(self.staging.root) if self.staging is not None else None,
+            ),
+        ) as executor:
+            futures = {executor.submit(_import_csv_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                filename = Path(futures[future].csv_path).name
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing CSV chunk of {filename}: {e}")
+                    results["processing_errors"] += 1
+                    file_errors[filename] = str(e)
+                    continue
+                
+                self._merge_worker_outcome(outcome)
+                file_reports.setdefault(filename, []).append(outcome['report'])
+        
+        self.statistics.import_end_time = datetime.now()
+        
+        for filename in sorted(set(file_reports) | set(file_errors)):
+            if filename in file_errors:
+                results["files"].append({"filename": filename, "error": file_errors[filename]})
+                continue
+            report = QualityReport.merge(file_reports[filename])
+            results["files_processed"] += 1
+            results["total_records"] += report.total_records
+            results["successful_records"] += report.successful_records
+            results["failed_records"] += report.failed_records
+            results["processing_errors"] += report.processing_errors
+            results["files"].append({
+                "filename": filename,
+                "total_records": report.total_records,
+                "successful_records": report.successful_records,
+                "failed_records": report.failed_records,
+                "ticker_extraction_rate": report.ticker_extraction_rate,
+                "amount_parsing_rate": report.amount_parsing_rate,
+                "owner_normalization_rate": report.owner_normalization_rate
+            })
+        
+        self.quality_report = QualityReport.merge(
+            [r for reports in file_reports.values() for r in reports],
+            processing_time=self.statistics.processing_time_seconds
+        )
+        results["workers"] = workers
+        results["processing_time"] = self.quality_report.processing_time
+        
+        logger.info(f"Parallel CSV import completed: {results['successful_records']}/{results['total_records']} records successful")
+        return results
+    
+    def _merge_worker_outcome(self, outcome: Dict[str, Any]):
+        """Fold a worker's statistics and error collections into this instance."""
+        self.statistics.merge(outcome['statistics'])
+        for category, count in outcome['error_counts'].items():
+            self.error_counts[category] = self.error_counts.get(category, 0) + count
+        for category, samples in outcome['error_samples'].items():
+            existing = self.error_samples.setdefault(category, [])
+            existing.extend(samples[:max(0, 5 - len(existing))])
+        self.error_records.extend(outcome['error_records'])
+        if outcome['auto_created_members']:
+            self.auto_created_members = getattr(self, 'auto_created_members', [])
+            self.auto_created_members.extend(outcome['auto_created_members'])
+    
     def enrich_member_data_sync(self) -> Dict[str, Any]:
         """
         Enrich existing member data with additional information (synchronous version).
@@ -1199,22 +1742,89 @@ class CongressionalDataIngestion:
         return normalized
 
 
+# ============================================================================
+# PARALLEL IMPORT WORKERS
+# ============================================================================
+
+# Per-process ingestion instance, created once by the pool initializer
+_worker_ingestion: Optional[CongressionalDataIngestion] = None
+
+
+def _init_import_worker(reference_data: IngestionReferenceData, batch_size: int, bulk_insert: bool,
+                        extraction_cache_size: int, cache_snapshot_path: Optional[str],
+                        staging_root: Optional[str] = None):
+    """Pool initializer: open a database engine and build the worker's ingestion instance."""
+    global _worker_ingestion
+    db_manager.initialize_sync()
+    _worker_ingestion = CongressionalDataIngestion(
+        batch_size=batch_size,
+        bulk_insert=bulk_insert,
+        reference_data=reference_data,
+        extraction_cache_size=extraction_cache_size,
+        cache_snapshot_path=cache_snapshot_path,
+        staging=TradeStagingStore(staging_root) if staging_root else None
+    )
+
+
+def _import_csv_chunk(chunk: CsvImportChunk) -> Dict[str, Any]:
+    """Process one CSV chunk in a worker process and return picklable results."""
+    ingestion = _worker_ingestion
+    ingestion.error_counts = {}
+    ingestion.error_samples = {}
+    ingestion.error_records = []
+    ingestion.auto_created_members = []
+    
+    byte_range = (chunk.start_offset, chunk.end_offset) if chunk.start_offset is not None else None
+    report = ingestion.process_csv_file(chunk.csv_path, byte_range=byte_range)
+    ingestion.data_quality.save_cache_snapshot()
+    
+    return {
+        'report': report,
+        'statistics': ingestion.statistics,
+        'error_counts': ingestion.error_counts,
+        'error_samples': ingestion.error_samples,
+        'error_records': ingestion.error_records,
+        'auto_created_members': ingestion.auto_created_members,
+    }
+
+
 def main():
     """Main ingestion function for CLI usage."""
     import argparse
     
     parser = argparse.ArgumentParser(description='Congressional data ingestion')
-    parser.add_argument('csv_file', help='Path to CSV file to import')
+    parser.add_argument('csv_file', nargs='?', help='Path to CSV file to import')
     parser.add_argument('--batch-size', type=int, default=100, help='Batch size for processing')
     parser.add_argument('--export-problems', help='Export problematic records to CSV')
+    parser.add_argument('--no-bulk-insert', action='store_true', help='Insert trades one at a time instead of in bulk')
+    parser.add_argument('--cache-snapshot', help='Path of an extraction cache snapshot to load and update')
+    parser.add_argument('--resume', action='store_true', help='Checkpoint each batch and resume an interrupted import')
+    parser.add_argument('--staging-dir', help='Directory of the Parquet trade stages to write (and read with --from-staging)')
+    parser.add_argument('--from-staging', action='store_true', help='Process the raw Parquet stage instead of a CSV file')
+    parser.add_argument('--years', type=int, nargs='+', help='Transaction years to process with --from-staging')
     
     args = parser.parse_args()
+    if args.from_staging and not args.staging_dir:
+        parser.error('--from-staging requires --staging-dir')
+    if not args.from_staging and not args.csv_file:
+        parser.error('csv_file is required unless --from-staging is given')
     
     # Initialize ingestion
-    ingestion = CongressionalDataIngestion(batch_size=args.batch_size)
+    ingestion = CongressionalDataIngestion(
+        batch_size=args.batch_size,
+        bulk_insert=not args.no_bulk_insert,
+        cache_snapshot_path=args.cache_snapshot,
+        staging=TradeStagingStore(args.staging_dir) if args.staging_dir else None
+    )
     
     # Process file
-    report = ingestion.process_csv_file(args.csv_file)
+    if args.from_staging:
+        report = ingestion.process_staged_trades(args.years)
+    elif args.resume:
+        report = ingestion.process_csv_file_resumable(args.csv_file)
+    else:
+        report = ingestion.process_csv_file(args.csv_file)
+    ingestion.data_quality.save_cache_snapshot()
     
     # Print summary
     print(f"\n=== Import Summary ===")
@@ -1225,6 +1835,8 @@ def main():
     print(f"Ticker extraction rate: {report.ticker_extraction_rate:.1f}%")
     print(f"Amount parsing rate: {report.amount_parsing_rate:.1f}%")
     print(f"Owner normalization rate: {report.owner_normalization_rate:.1f}%")
+    for operation in sorted(set(report.cache_hits) | set(report.cache_misses)):
+        print(f"Cache {operation}: {report.cache_hits.get(operation, 0)} hits, {report.cache_misses.get(operation, 0)} misses")
     
     if report.recommendations:
         print(f"\n=== Recommendations ===")
@@ -0,0 +1,178 @@
+"""
+Indexed congress member name resolution.
+
+This module provides a pre-built index over member name variations so that
+resolving a filer name during import does not scan every known name:
+- Last-name hash buckets for the common "prefix first last" case
+- Soundex buckets to catch misspelled last names
+- Trigram candidate generation with a bounded fuzzy rescoring step
+- A per-file memo of raw name -> member ID
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Any
+
+from fuzzywuzzy import fuzz, process
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys('BFPV', '1'),
+    **dict.fromkeys('CGJKQSXZ', '2'),
+    **dict.fromkeys('DT', '3'),
+    'L': '4',
+    **dict.fromkeys('MN', '5'),
+    'R': '6',
+}
+
+_NON_ALPHA = re.compile(r'[^A-Z]')
+
+
+def soundex(name: str) -> str:
+    """American Soundex code for a (last) name, e.g. 'PELOSI' -> 'P420'."""
+    letters = _NON_ALPHA.sub('', name.upper())
+    if not letters:
+        return ''
+
+    code = letters[0]
+    previous = _SOUNDEX_CODES.get(letters[0], '')
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, '')
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # H and W do not separate letters with the same code; vowels do
+        if char not in 'HW':
+            previous = digit
+    return code.ljust(4, '0')
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of a padded string."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MemberNameIndex:
+    """Index of member name variations for fast candidate lookup."""
+
+    def __init__(self, fuzzy_cutoff: int = 70, max_candidates: int = 25):
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.max_candidates = max_candidates
+
+        self.names: Dict[str, Any] = {}  # name variation -> member ID
+        self.last_name_buckets: Dict[str, Set[str]] = {}
+        self.soundex_buckets: Dict[str, Set[str]] = {}
+        self.trigram_index: Dict[str, Set[str]] = {}
+
+        # Per-file memo of normalized raw name -> member ID
+        self.memo: Dict[str, Any] = {}
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    @classmethod
+    def build(cls, member_mapping: Dict[str, Any], **kwargs) -> 'MemberNameIndex':
+        """Build an index from a name variation -> member ID mapping."""
+        index = cls(**kwargs)
+        for name, member_id in member_mapping.items():
+            index.add(name, member_id)
+        logger.debug(f"Built member name index: {len(index.names)} names, {len(index.last_name_buckets)} last names")
+        return index
+
+    def add(self, name: str, member_id: Any):
+        """Add (or replace) a name variation."""
+        name = name.upper().strip()
+        if not name:
+            return
+        self.names[name] = member_id
+
+        last_name = self._last_name_of_key(name)
+        if last_name:
+            self.last_name_buckets.setdefault(last_name, set()).add(name)
+            self.soundex_buckets.setdefault(soundex(last_name), set()).add(name)
+
+        for gram in trigrams(name):
+            self.trigram_index.setdefault(gram, set()).add(name)
+
+    def resolve(self, normalized_name: str, first_name: str, last_name: str) -> Optional[Any]:
+        """
+        Resolve a name that missed the exact lookups.
+
+        Mirrors the legacy resolution order: a partial match (last name and the
+        first two letters of the first name both present) wins, otherwise the
+        best fuzzy ratio above the cutoff among the indexed candidates.
+        """
+        if normalized_name in self.memo:
+            self.memo_hits += 1
+            return self.memo[normalized_name]
+        self.memo_misses += 1
+
+        member_id = self._partial_match(first_name, last_name)
+        if member_id is None:
+            member_id = self._fuzzy_match(f"{first_name} {last_name}".strip())
+
+        if member_id is not None:
+            self.memo[normalized_name] = member_id
+        return member_id
+
+    def clear_memo(self):
+        """Forget memoized resolutions and reset the hit/miss counters (called per imported file)."""
+        self.memo.clear()
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def _partial_match(self, first_name: str, last_name: str) -> Optional[Any]:
+        if not last_name:
+            return None
+        first_prefix = first_name[:2]
+        for key in sorted(self.last_name_buckets.get(last_name, ())):
+            if first_prefix in key:
+                logger.debug(f"Partial match for member: {first_name} {last_name} -> {key}")
+                return self.names[key]
+        return None
+
+    def _fuzzy_match(self, query: str) -> Optional[Any]:
+        if not query:
+            return None
+
+        candidates = self._candidates(query)
+        if not candidates:
+            return None
+
+        best_match = process.extractOne(
+            query,
+            candidates,
+            scorer=fuzz.ratio,
+            score_cutoff=self.fuzzy_cutoff
+        )
+        if best_match:
+            logger.debug(f"Fuzzy matched member: {query} -> {best_match[0]}")
+            return self.names[best_match[0]]
+        return None
+
+    def _candidates(self, query: str) -> List[str]:
+        """Bounded candidate set: last-name and Soundex buckets plus top trigram overlaps."""
+        last_name = query.split()[-1] if query.split() else ''
+        candidates = set(self.last_name_buckets.get(last_name, ()))
+        if last_name:
+            candidates |= self.soundex_buckets.get(soundex(last_name), set())
+
+        overlap: Dict[str, int] = {}
+        for gram in trigrams(query):
+            for name in self.trigram_index.get(gram, ()):
+                overlap[name] = overlap.get(name, 0) + 1
+        top = sorted(overlap.items(), key=lambda item: (-item[1], item[0]))[:self.max_candidates]
+        candidates.update(name for name, _ in top)
+
+        return sorted(candidates)
+
+    @staticmethod
+    def _last_name_of_key(name: str) -> str:
+        """Last name of a mapping key ("FIRST LAST" or "LAST, FIRST")."""
+        if ',' in name:
+            return name.split(',', 1)[0].strip()
+        parts = name.split()
+        return parts[-1] if parts else ''
@@ -222,6 +222,10 @@ class CongressionalTrade(CapitolScopeBaseModel, AuditMixin):
         Index('idx_congressional_trade_ticker_date', 'ticker', 'transaction_date'),
         Index('idx_congressional_trade_security_date', 'security_id', 'transaction_date'),
         Index('idx_congressional_trade_type_date', 'transaction_type', 'transaction_date'),
+        UniqueConstraint(
+            'doc_id', 'member_id', 'transaction_date', 'raw_asset_description',
+            name='unique_congressional_trade_natural_key'
+        ),
     )
     
     def __repr__(self):
@@ -467,6 +471,68 @@ class TradeDiscussion(CapitolScopeBaseModel):
         return f"<TradeDiscussion(trade_id={self.trade_id}, topic_id={self.topic_id})>"
 
 
+# ============================================================================
+# IMPORT PROGRESS
+# ============================================================================
+
+class CongressionalImportProgress(CapitolScopeBaseModel):
+    """Checkpoint of a resumable CSV import, one row per source file content."""
+    
+    __tablename__ = 'congressional_import_progress'
+    
+    file_hash = Column(String(64), nullable=False, unique=True)  # SHA-256 of the file content
+    file_path = Column(String(500), nullable=False)
+    file_size = Column(BigInteger, nullable=False)
+    
+    # Position after the last committed batch
+    byte_offset = Column(BigInteger, nullable=False, default=0)  # End of the last consumed CSV record
+    records_read = Column(Integer, nullable=False, default=0)  # CSV records up to byte_offset
+    last_batch = Column(Integer, nullable=False, default=0)
+    
+    status = Column(String(20), nullable=False, default='in_progress')  # in_progress, completed, failed
+    last_error = Column(Text)
+    completed_at = Column(DateTime(timezone=True))
+    
+    def __repr__(self):
+        return f"<CongressionalImportProgress(file_path={self.file_path}, offset={self.byte_offset}, status={self.status})>"
+
+
+# ============================================================================
+# FILING MANIFEST
+# ============================================================================
+
+class CongressionalFilingManifest(CapitolScopeBaseModel):
+    """Last-seen entry of a filing index (House yearly FD index or Senate eFD search), one row per DocID."""
+    
+    __tablename__ = 'congressional_filing_manifest'
+    
+    doc_id = Column(String(50), nullable=False, unique=True)
+    year = Column(Integer, nullable=False)
+    filing_type = Column(String(5))  # P = House periodic transaction report, SPTR/SPPR = Senate electronic/paper PTR
+    filing_date = Column(Date)
+    
+    # Filer as listed in the index
+    prefix = Column(String(20))
+    first_name = Column(String(100))
+    last_name = Column(String(100))
+    suffix = Column(String(20))
+    state_district = Column(String(10))
+    
+    entry_hash = Column(String(64), nullable=False)  # SHA-256 of the index fields; changes when an entry is amended
+    status = Column(String(20), nullable=False, default='pending')  # pending, processed, failed, skipped
+    attempts = Column(Integer, nullable=False, default=0)
+    trades_found = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    processed_at = Column(DateTime(timezone=True))
+    
+    __table_args__ = (
+        Index('idx_filing_manifest_year_status', 'year', 'status'),
+    )
+    
+    def __repr__(self):
+        return f"<CongressionalFilingManifest(doc_id={self.doc_id}, year={self.year}, status={self.status})>"
+
+
 # Log model creation
 logger.info("Congressional domain models initialized")
 
@@ -476,5 +542,7 @@ __all__ = [
     "CongressionalTrade", 
     "MemberPortfolio",
     "MemberPortfolioPerformance",
-    "TradeDiscussion"
+    "TradeDiscussion",
+    "CongressionalImportProgress",
+    "CongressionalFilingManifest"
 ] 
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Multi-pattern substring matching for asset descriptions.
+
+This module provides an Aho-Corasick automaton that finds every occurrence of
+a fixed set of patterns (company names, ETF names) in a single pass over the
+input, replacing per-pattern `pattern in text` scans whose cost grows with
+the size of the mapping tables.
+"""
+
+from typing import Dict, Iterable, List, Set
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class AhoCorasickMatcher:
+    """Compiled Aho-Corasick automaton over a fixed list of patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._pattern_ids: Dict[str, int] = {}
+
+        # Trie: one transition dict per state, root is state 0
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._build_failure_links()
+
+        logger.debug(f"Compiled Aho-Corasick matcher: {len(self.patterns)} patterns, {len(self._goto)} states")
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _add(self, pattern: str):
+        if not pattern or pattern in self._pattern_ids:
+            return
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        self._pattern_ids[pattern] = pattern_id
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        """Breadth-first construction of failure links and merged outputs."""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_ids(self, text: str) -> Set[int]:
+        """IDs (insertion order indexes) of all patterns occurring anywhere in text."""
+        found: Set[int] = set()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def find_all(self, text: str) -> List[str]:
+        """All patterns occurring in text, in pattern insertion order."""
+        return [self.patterns[i] for i in sorted(self.find_ids(text))]
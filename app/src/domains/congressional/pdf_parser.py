@@ -5,16 +5,45 @@ This module provides improved PDF parsing capabilities for congressional
 trade disclosure documents with enhanced validation and confidence scoring.
 """
 
+import heapq
 import re
 import pandas as pd
 import pdfplumber
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Characters str.splitlines() treats as line boundaries
+LINE_BOUNDARIES = frozenset('\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029')
+
+# Lines that start the certification/signature block after the transaction table;
+# extraction stops there, so trailing boilerplate pages are never laid out
+TRANSACTION_SECTION_END_MARKERS = ('I CERTIFY', 'DIGITALLY SIGNED')
+
+# Line prefixes that end a trade entry's continuation lines
+ENTRY_BREAK_PREFIXES = ('SP', 'DC', 'JT', '* For the', 'Initial', 'Asset')
+
+# Line kinds assigned once by the trade entry segmenter
+LINE_OTHER = 0
+LINE_TRADE_START = 1
+LINE_CONTINUATION = 2
+LINE_SECTION_BREAK = 3
+
+# Words ignored when matching asset descriptions to company names word by word
+CORPORATE_SUFFIXES = frozenset(['inc', 'corp', 'ltd', 'llc', 'co', 'company', 'corporation'])
+
+
+@dataclass
+class TradeEntry:
+    """A trade start line and its continuation lines, with its span in the document's lines."""
+    start: int  # Index of the trade start line
+    end: int  # Index after the last line belonging to the entry
+    main_line: str
+    continuation_lines: List[str]
+
 
 @dataclass
 class TradeRecord:
@@ -146,6 +175,136 @@ class PDFParsingValidator:
         return False
 
 
+class CompanyNameIndex:
+    """
+    Reverse company name -> ticker index.
+    
+    Answers the parser's reverse lookups (exact name, name/asset prefix, first word,
+    shared significant words) with hash, trie and posting-list probes instead of
+    scanning the mapping. Where several companies match, the one earliest in the
+    mapping wins, as with the original linear scans.
+    """
+    
+    def __init__(self, tickers_company: Dict[str, str]):
+        self.tickers: List[str] = []
+        self.exact: Dict[str, int] = {}  # lowercased name -> first mapping position
+        self.first_words: Dict[str, int] = {}  # first word (> 3 chars) -> first mapping position
+        
+        # Prefix trie over lowercased names: one transition dict per node, root is node 0,
+        # with the first mapping position of names ending at / passing through each node
+        self._children: List[Dict[str, int]] = [{}]
+        self._ends_here: List[Optional[int]] = [None]
+        self._below: List[Optional[int]] = [None]
+        
+        # Significant-word posting lists for companies with at least two words
+        self._word_postings: Dict[str, List[int]] = {}
+        self._word_sets: List[Optional[frozenset]] = []
+        self._word_counts: List[int] = []
+        
+        for ticker, company_name in tickers_company.items():
+            position = len(self.tickers)
+            self.tickers.append(ticker)
+            if not isinstance(company_name, str):
+                self._word_sets.append(None)
+                self._word_counts.append(0)
+                continue
+            
+            company_lower = company_name.lower()
+            self.exact.setdefault(company_lower, position)
+            self._add_to_trie(company_lower, position)
+            
+            words = company_lower.split()
+            if words and len(words[0]) > 3:
+                self.first_words.setdefault(words[0], position)
+            
+            company_words = company_lower.replace(',', '').replace('.', '').split()
+            if len(company_words) >= 2:
+                significant = [w for w in company_words if w not in CORPORATE_SUFFIXES]
+                self._word_sets.append(frozenset(significant))
+                self._word_counts.append(len(significant))
+                for word in set(significant):
+                    self._word_postings.setdefault(word, []).append(position)
+            else:
+                self._word_sets.append(None)
+                self._word_counts.append(0)
+        
+        logger.debug(f"Built company name index: {len(self.tickers)} companies, {len(self._children)} trie nodes")
+    
+    def _add_to_trie(self, name: str, position: int):
+        node = 0
+        if self._below[node] is None:
+            self._below[node] = position
+        for char in name:
+            next_node = self._children[node].get(char)
+            if next_node is None:
+                next_node = len(self._children)
+                self._children.append({})
+                self._ends_here.append(None)
+                self._below.append(None)
+                self._children[node][char] = next_node
+            node = next_node
+            if self._below[node] is None:
+                self._below[node] = position
+        if self._ends_here[node] is None:
+            self._ends_here[node] = position
+    
+    def lookup(self, asset: str) -> Optional[str]:
+        """Ticker for an asset description without a parenthesized/bracketed ticker, or None."""
+        asset_lower = asset.lower().strip()
+        
+        position = self.exact.get(asset_lower)
+        if position is None:
+            position = self._partial_match(asset_lower)
+        if position is None:
+            position = self._word_match(asset_lower)
+        return self.tickers[position] if position is not None else None
+    
+    def _partial_match(self, asset_lower: str) -> Optional[int]:
+        """Earliest company whose name is a prefix of the asset, has the asset as a prefix, or shares its first word."""
+        candidates = []
+        
+        # Names that are prefixes of the asset lie on the asset's trie path
+        node = 0
+        if self._ends_here[node] is not None:
+            candidates.append(self._ends_here[node])
+        for char in asset_lower:
+            node = self._children[node].get(char)
+            if node is None:
+                break
+            if self._ends_here[node] is not None:
+                candidates.append(self._ends_here[node])
+        else:
+            # Names with the asset as a prefix lie below the end of the path
+            if self._below[node] is not None:
+                candidates.append(self._below[node])
+        
+        words = asset_lower.split()
+        if words and len(words[0]) > 3 and words[0] in self.first_words:
+            candidates.append(self.first_words[words[0]])
+        
+        return min(candidates) if candidates else None
+    
+    def _word_match(self, asset_lower: str) -> Optional[int]:
+        """Earliest company sharing at least two significant words covering 70% of the shorter name."""
+        asset_words = asset_lower.replace(',', '').replace('.', '').split()
+        if len(asset_words) < 2:
+            return None
+        significant = [w for w in asset_words if w not in CORPORATE_SUFFIXES]
+        
+        postings = [self._word_postings[w] for w in set(significant) if w in self._word_postings]
+        previous = None
+        for position in heapq.merge(*postings):
+            if position == previous:
+                continue
+            previous = position
+            company_words = self._word_sets[position]
+            matches = sum(1 for word in significant if word in company_words)
+            min_words = min(len(significant), self._word_counts[position])
+            if matches >= 2 and matches >= min_words * 0.7:
+                return position
+        return None
+
+
 class CongressionalPDFParser:
     """Improved PDF parsing service for congressional trade disclosures."""
     
@@ -155,6 +314,13 @@ class CongressionalPDFParser:
         self.tickers_company = tickers_company
         self.validator = PDFParsingValidator()
         
+        # Lookup indexes for _extract_ticker: uppercase ticker -> known spelling, reverse company index
+        self.tickers_by_upper: Dict[str, str] = {}
+        for known_ticker in tickers:
+            if isinstance(known_ticker, str):
+                self.tickers_by_upper.setdefault(known_ticker.upper(), known_ticker)
+        self.company_index = CompanyNameIndex(tickers_company)
+        
         # Regex patterns for better field extraction
         self.ticker_pattern = r'\(([A-Z]{1,5})\)'
         self.amount_range_mapping = {
@@ -172,38 +338,111 @@ class CongressionalPDFParser:
         }
         
     def parse_pdf_improved(self, pdf_path: str, doc_id: str, member: str) -> List[TradeRecord]:
-        """Improved PDF parsing with better structure detection."""
-        records = []
+        """
+        Improved PDF parsing with better structure detection.
         
+        Text is streamed page by page and grouped into trade entries as it arrives,
+        so only the current page and entry are held in memory, and extraction stops
+        at the certification section that follows the transaction table.
+        """
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                pdf_text = "".join(page.extract_text() for page in pdf.pages)
+                extraction = {'pages_read': 0, 'has_text': False}
+                records = self.parse_lines(self._iter_pdf_lines(pdf, extraction), doc_id, member)
+                page_count = len(pdf.pages)
         except Exception as e:
-            logger.error(f"Failed to open PDF {pdf_path}: {e}")
-            return records
+            logger.error(f"Failed to read PDF {pdf_path}: {e}")
+            return []
             
-        if not pdf_text.strip():
+        if not extraction['has_text']:
             logger.warning(f"No text extracted from PDF {pdf_path}")
             return records
             
-        lines = pdf_text.splitlines()
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Look for trade entry starting lines
-            if self._is_trade_line_start(line):
-                record, lines_consumed = self._parse_trade_entry(lines[i:], doc_id, member)
-                if record:
-                    records.append(record)
-                i += lines_consumed
-            else:
-                i += 1
-                
-        logger.info(f"Parsed {len(records)} trade records from {pdf_path}")
+        logger.info(f"Parsed {len(records)} trade records from {pdf_path} ({extraction['pages_read']}/{page_count} pages read)")
         return records
     
+    def parse_lines(self, lines: Iterable[str], doc_id: str, member: str) -> List[TradeRecord]:
+        """Parse trade records from a document's text lines (a list or a stream)."""
+        records = []
+        for entry in self._segment_trade_entries(lines):
+            record = self._parse_trade_entry(entry, doc_id, member)
+            if record:
+                records.append(record)
+        return records
+    
+    def _iter_pdf_lines(self, pdf, extraction: Dict[str, object]) -> Iterator[str]:
+        """
+        Yield the document's text lines page by page, releasing each page's layout
+        objects once its text is extracted. Stops at the end of the transaction section.
+        Pages read and whether any text was found are recorded in `extraction`.
+        """
+        pending = ""
+        for page in pdf.pages:
+            text = pending + (page.extract_text() or "")
+            self._release_page(page)
+            extraction['pages_read'] += 1
+            
+            lines = text.splitlines()
+            # Page texts are concatenated without a separator, so an unterminated
+            # last line continues on the next page
+            pending = lines.pop() if lines and text[-1] not in LINE_BOUNDARIES else ""
+            
+            for line in lines:
+                stripped = line.strip()
+                if stripped:
+                    extraction['has_text'] = True
+                    if stripped.upper().startswith(TRANSACTION_SECTION_END_MARKERS):
+                        return
+                yield line
+        
+        if pending.strip():
+            extraction['has_text'] = True
+            if not pending.strip().upper().startswith(TRANSACTION_SECTION_END_MARKERS):
+                yield pending
+    
+    @staticmethod
+    def _release_page(page) -> None:
+        """Drop a page's cached layout objects (chars, words, text map)."""
+        close = getattr(page, 'close', None) or getattr(page, 'flush_cache', None)
+        if close:
+            close()
+    
+    def _segment_trade_entries(self, lines: Iterable[str]) -> Iterator[TradeEntry]:
+        """
+        Single pass over the lines, classifying each one once, that yields every trade
+        entry: a trade start line plus the continuation lines that follow it before the
+        next trade start or section break. Lines are not copied or rescanned.
+        """
+        entry = None
+        for index, line in enumerate(lines):
+            stripped = line.strip()
+            kind = self._classify_line(stripped)
+            
+            if kind == LINE_TRADE_START:
+                if entry:
+                    yield entry
+                entry = TradeEntry(start=index, end=index + 1, main_line=stripped, continuation_lines=[])
+            elif entry is None:
+                continue
+            elif kind == LINE_SECTION_BREAK:
+                yield entry
+                entry = None
+            elif kind == LINE_CONTINUATION:
+                entry.continuation_lines.append(stripped)
+                entry.end = index + 1
+        if entry:
+            yield entry
+    
+    def _classify_line(self, line: str) -> int:
+        """Kind of a stripped line for trade entry segmentation."""
+        if self._is_trade_line_start(line):
+            return LINE_TRADE_START
+        if line.startswith(ENTRY_BREAK_PREFIXES):
+            return LINE_SECTION_BREAK
+        if self._is_continuation_line(line):
+            return LINE_CONTINUATION
+        return LINE_OTHER
+    
     def _is_trade_line_start(self, line: str) -> bool:
         """Improved detection of trade line starts."""
         # Match original parser logic - just check if line starts with owner type
@@ -213,35 +452,17 @@ class CongressionalPDFParser:
             
         return parts[0] in ['SP', 'DC', 'JT']
     
-    def _parse_trade_entry(self, lines: List[str], doc_id: str, member: str) -> Tuple[Optional[TradeRecord], int]:
+    def _parse_trade_entry(self, entry: TradeEntry, doc_id: str, member: str) -> Optional[TradeRecord]:
         """Parse a complete trade entry spanning multiple lines."""
-        if not lines:
-            return None, 1
-            
-        main_line = lines[0].strip()
-        lines_consumed = 1
-        
         # Parse main line using multiple strategies
-        parsed_data = self._parse_main_line(main_line)
+        parsed_data = self._parse_main_line(entry.main_line)
         if not parsed_data:
-            return None, 1
+            return None
             
-        # Look for continuation lines - extend lookahead like original parser
+        # Apply the continuation lines found by the segmenter
         additional_data = {}
-        owner_types = ["SP", "DC", "JT"]
-        
-        for i in range(1, len(lines)):  # Look ahead through all remaining lines
-            line = lines[i].strip()
-            
-            # Stop if we hit a new trade line or section break
-            if any(line.startswith(owner_type) for owner_type in owner_types):
-                break
-            if line.startswith("* For the") or line.startswith("Initial") or line.startswith("Asset"):
-                break
-                
-            if self._is_continuation_line(line):
-                self._parse_continuation_line(line, additional_data)
-                lines_consumed = i + 1
+        for line in entry.continuation_lines:
+            self._parse_continuation_line(line, additional_data)
                 
         # Merge main data with additional data
         merged_data = {**parsed_data, **additional_data}
@@ -271,7 +492,7 @@ class CongressionalPDFParser:
         if validation_results['warnings']:
             record.parsing_notes.extend(validation_results['warnings'])
             
-        return record, lines_consumed
+        return record
     
     def _parse_main_line(self, line: str) -> Optional[Dict[str, str]]:
         """Parse the main trade line using improved logic."""
@@ -510,8 +731,8 @@ class CongressionalPDFParser:
         if not asset:
             return ""
         
-        # Look for ticker in parentheses
-        ticker_match = re.search(r'\((.*?)\)', asset)
+        # Look for ticker in parentheses, then in brackets
+        ticker_match = re.search(r'\((.*?)\)', asset) or re.search(r'\[(.*?)\]', asset)
         if ticker_match:
             ticker = ticker_match.group(1).strip()
             # Normalize to uppercase for comparison
@@ -522,76 +743,12 @@ class CongressionalPDFParser:
                 return ticker_upper
             elif ticker in self.tickers:
                 return ticker
-            else:
-                # Try case-insensitive matching
-                for known_ticker in self.tickers:
-                    if known_ticker.upper() == ticker_upper:
-                        return known_ticker
-                return ticker  # Return original if not found
-        
-        # Look for ticker in brackets
-        bracket_match = re.search(r'\[(.*?)\]', asset)
-        if bracket_match:
-            ticker = bracket_match.group(1).strip()
-            ticker_upper = ticker.upper()
-            
-            if ticker_upper in self.tickers:
-                return ticker_upper
-            elif ticker in self.tickers:
-                return ticker
-            else:
-                # Try case-insensitive matching
-                for known_ticker in self.tickers:
-                    if known_ticker.upper() == ticker_upper:
-                        return known_ticker
-                return ticker
+            # Case-insensitive match, or the original if not found
+            return self.tickers_by_upper.get(ticker_upper, ticker)
         
         # Reverse lookup using company names in tickers_company mapping
-        if not ticker_match and not bracket_match:
-            asset_lower = asset.lower().strip()
-            
-            # Try exact match first
-            for ticker, company_name in self.tickers_company.items():
-                if company_name.lower() == asset_lower:
-                    return ticker
-            
-            # Try partial matching - check if asset starts with company name or vice versa
-            for ticker, company_name in self.tickers_company.items():
-                company_lower = company_name.lower()
-                
-                # Check if asset name starts with company name (e.g., "Apple Inc." matches "Apple Inc")
-                if asset_lower.startswith(company_lower) or company_lower.startswith(asset_lower):
-                    return ticker
-                
-                # Check if first word of asset matches first word of company name
-                asset_first_word = asset_lower.split()[0] if asset_lower.split() else ""
-                company_first_word = company_lower.split()[0] if company_lower.split() else ""
-                
-                if asset_first_word and company_first_word and asset_first_word == company_first_word:
-                    # Additional validation - check if it's a meaningful match (not just "the", "a", etc.)
-                    if len(asset_first_word) > 3:  # Avoid matching articles and short words
-                        return ticker
-            
-            # Try matching key words in the asset name
-            asset_words = asset_lower.replace(',', '').replace('.', '').split()
-            for ticker, company_name in self.tickers_company.items():
-                company_words = company_name.lower().replace(',', '').replace('.', '').split()
-                
-                # Check if we have at least 2 matching significant words
-                if len(asset_words) >= 2 and len(company_words) >= 2:
-                    # Remove common corporate suffixes for matching
-                    filtered_asset_words = [w for w in asset_words if w not in ['inc', 'corp', 'ltd', 'llc', 'co', 'company', 'corporation']]
-                    filtered_company_words = [w for w in company_words if w not in ['inc', 'corp', 'ltd', 'llc', 'co', 'company', 'corporation']]
-                    
-                    # Count matching words
-                    matches = sum(1 for word in filtered_asset_words if word in filtered_company_words)
-                    
-                    # If we have 2+ matching significant words and they represent majority of the shorter list
-                    min_words = min(len(filtered_asset_words), len(filtered_company_words))
-                    if matches >= 2 and matches >= min_words * 0.7:
-                        return ticker
-        
-        return ""
+        ticker = self.company_index.lookup(asset)
+        return ticker if ticker is not None else ""
 
 
 class PDFParsingTestSuite:
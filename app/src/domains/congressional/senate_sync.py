@@ -0,0 +1,416 @@
+"""
+Senate periodic transaction report (PTR) ingestion from the eFD site.
+
+Electronic Senate PTRs are HTML pages with one transaction table, so they are
+parsed directly (no PDF extraction). The sync:
+- Pages through the eFD report search for PTRs filed since a start date
+- Records the reports in congressional_filing_manifest, queuing only new or
+  amended ones (paper filings are recorded but skipped: they are scanned images)
+- Streams each queued report page through lxml iterparse into TradeRecords and
+  feeds them through the CongressionalDataIngestion batch pipeline
+
+parse_ptr_html() and import_saved_reports() work on saved report pages, so the
+parsing and ingestion path can be exercised offline.
+"""
+
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, date, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Any, BinaryIO, Union
+
+import requests
+from lxml import etree
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.database import db_manager
+from core.rate_limiting import (
+    AdaptiveRateLimiter, THROTTLE_STATUS_CODES, create_download_rate_limiter, host_of, parse_retry_after
+)
+from domains.congressional.house_sync import (
+    FilingManifestEntry, PENDING_MANIFEST_STATUSES, MAX_FILING_ATTEMPTS, MAX_DOWNLOAD_ATTEMPTS,
+    diff_manifest, upsert_manifest_entries, ingest_trade_batch
+)
+from domains.congressional.models import CongressionalFilingManifest
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+SENATE_EFD_URL = "https://efdsearch.senate.gov"
+SENATE_EFD_HOME_URL = SENATE_EFD_URL + "/search/home/"
+SENATE_EFD_SEARCH_URL = SENATE_EFD_URL + "/search/"
+SENATE_EFD_REPORT_DATA_URL = SENATE_EFD_URL + "/search/report/data/"
+
+# eFD report type code for periodic transaction reports
+SENATE_PTR_REPORT_TYPE = 11
+
+# Manifest filing types for Senate reports (House index types are single letters)
+SENATE_PTR_FILING_TYPE = 'SPTR'
+SENATE_PAPER_PTR_FILING_TYPE = 'SPPR'
+
+# Reports per eFD search request
+SENATE_SEARCH_PAGE_SIZE = 100
+
+# eFD transaction types -> the P/S/E codes used by the House data
+SENATE_TRANSACTION_TYPES = {
+    'PURCHASE': 'P',
+    'SALE': 'S',
+    'SALE (FULL)': 'S',
+    'SALE (PARTIAL)': 'S',
+    'EXCHANGE': 'E',
+}
+
+# Placeholder eFD uses for empty cells
+EMPTY_CELL = '--'
+
+_REPORT_LINK_PATTERN = re.compile(r'href="(?P<path>/search/view/(?P<kind>ptr|paper)/(?P<report_id>[^/"]+)/?)"[^>]*>(?P<title>[^<]*)<')
+_FILER_PATTERN = re.compile(r'\((?P<last>[^,()]+),\s*(?P<first>[^()]+)\)')
+_FILED_DATE_PATTERN = re.compile(r'Filed\s+(\d{1,2}/\d{1,2}/\d{4})')
+_CSRF_PATTERN = re.compile(r'name="csrfmiddlewaretoken"\s+value="([^"]+)"')
+
+
+@dataclass
+class SenateFilingEntry(FilingManifestEntry):
+    """One report from the eFD search; electronic PTRs are queued, paper ones skipped."""
+    report_path: str = ""
+
+    @property
+    def is_ptr(self) -> bool:
+        return self.filing_type == SENATE_PTR_FILING_TYPE
+
+
+@dataclass
+class SenatePTRPage:
+    """Filer details and transaction rows of one eFD PTR page."""
+    first_name: str = ""
+    last_name: str = ""
+    filed_date: Optional[date] = None
+    is_amendment: bool = False
+    rows: List[Dict[str, str]] = field(default_factory=list)
+
+
+def _cell_text(element) -> str:
+    """Whitespace-normalized text of an element, including nested links."""
+    return " ".join("".join(element.itertext()).split())
+
+
+def _split_cell(element):
+    """(text, notes) of a table cell: eFD puts asset details in nested divs below the value."""
+    parts = [element.text or ""]
+    notes = []
+    for child in element:
+        if child.tag == 'div':
+            notes.append(_cell_text(child))
+        else:
+            parts.append("".join(child.itertext()))
+        parts.append(child.tail or "")
+    return " ".join("".join(parts).split()), " ".join(notes)
+
+
+def parse_ptr_html(source: Union[str, Path, BinaryIO]) -> SenatePTRPage:
+    """
+    Stream an eFD PTR page (path or binary file object) through lxml iterparse.
+
+    Table rows are mapped by the header row's column names (a cell's nested
+    notes go under "<column> Notes"), and each element is cleared once read, so
+    memory stays flat however long the report is.
+    """
+    page = SenatePTRPage()
+    columns: List[str] = []
+    for _, element in etree.iterparse(source, events=('end',), html=True, tag=('h1', 'h2', 'p', 'tr')):
+        if element.tag == 'tr':
+            cells = [child for child in element if child.tag in ('th', 'td')]
+            if cells and all(cell.tag == 'th' for cell in cells):
+                columns = [_cell_text(cell) for cell in cells]
+            elif cells and columns:
+                row = {}
+                for column, cell in zip(columns, cells):
+                    row[column], notes = _split_cell(cell)
+                    if notes:
+                        row[f"{column} Notes"] = notes
+                page.rows.append(row)
+            element.clear()
+            continue
+
+        text = _cell_text(element)
+        if element.tag == 'h1' and 'amendment' in text.lower():
+            page.is_amendment = True
+        elif element.tag == 'h2' and not page.last_name:
+            filer = _FILER_PATTERN.search(text)
+            if filer:
+                page.first_name = filer.group('first').strip()
+                page.last_name = filer.group('last').strip()
+        elif element.tag == 'p' and page.filed_date is None:
+            filed = _FILED_DATE_PATTERN.search(text)
+            if filed:
+                page.filed_date = datetime.strptime(filed.group(1), '%m/%d/%Y').date()
+    return page
+
+
+def _clean_cell(value: Optional[str]) -> str:
+    value = (value or "").strip()
+    return "" if value == EMPTY_CELL else value
+
+
+def ptr_page_to_trade_records(ingestion, page: SenatePTRPage, doc_id: str,
+                              first_name: str = "", last_name: str = "") -> List[Any]:
+    """
+    TradeRecords for a parsed PTR page, built through the ingestion's CSV row
+    parser so dates, required fields and errors are handled as for House data.
+    Filer names from the search index take precedence over the page header.
+    """
+    filing_status = 'Amendment' if page.is_amendment else 'New'
+    notification_date = page.filed_date.strftime('%m/%d/%Y') if page.filed_date else ''
+
+    records = []
+    for row_num, row in enumerate(page.rows, 1):
+        asset = _clean_cell(row.get('Asset Name'))
+        ticker = _clean_cell(row.get('Ticker'))
+        if ticker and f"({ticker})" not in asset:
+            asset = f"{asset} ({ticker})".strip()
+        transaction_type = _clean_cell(row.get('Type'))
+
+        trade_record = ingestion._parse_csv_row({
+            'DocID': doc_id,
+            'Prefix': 'Sen.',
+            'FirstName': first_name or page.first_name,
+            'LastName': last_name or page.last_name,
+            'Owner': _clean_cell(row.get('Owner')),
+            'Asset': asset,
+            'Transaction Type': SENATE_TRANSACTION_TYPES.get(transaction_type.upper(), transaction_type),
+            'Transaction Date': _clean_cell(row.get('Transaction Date')),
+            'Notification Date': notification_date,
+            'Amount': _clean_cell(row.get('Amount')),
+            'Filing Status': filing_status,
+            'Description': _clean_cell(row.get('Comment')),
+        }, row_num)
+        if trade_record:
+            records.append(trade_record)
+    return records
+
+
+def parse_report_search_rows(rows: Iterable[List[str]]) -> List[SenateFilingEntry]:
+    """Manifest entries from eFD search result rows: [first, last, office, report link, filed date]."""
+    entries = []
+    for row in rows:
+        if len(row) < 5:
+            continue
+        link = _REPORT_LINK_PATTERN.search(row[3])
+        if not link:
+            continue
+        try:
+            filed_date = datetime.strptime(row[4].strip(), '%m/%d/%Y').date()
+        except ValueError:
+            continue
+        entries.append(SenateFilingEntry(
+            doc_id=link.group('report_id'),
+            year=filed_date.year,
+            filing_type=SENATE_PTR_FILING_TYPE if link.group('kind') == 'ptr' else SENATE_PAPER_PTR_FILING_TYPE,
+            filing_date=filed_date,
+            prefix='Sen.',
+            first_name=row[0].strip(),
+            last_name=row[1].strip(),
+            report_path=link.group('path'),
+        ))
+    return entries
+
+
+class SenatePTRSync:
+    """
+    Incremental sync of Senate PTRs from the eFD site.
+
+    Shares the filing manifest, ingestion pipeline and adaptive download rate
+    limiter with the House sync; the ingestion reference data is only loaded
+    when there are reports to process.
+    """
+
+    def __init__(self, timeout: int = 60, ingestion=None, rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        self.timeout = timeout
+        self.http = requests.Session()
+        self.http.headers['User-Agent'] = "CapitolScope/1.0 (https://capitolscope.com)"
+        self.rate_limiter = rate_limiter or create_download_rate_limiter()
+        self._ingestion = ingestion
+        self._csrf_token: Optional[str] = None
+
+    def sync(self, start_date: date, end_date: Optional[date] = None) -> Dict[str, Any]:
+        """Record PTRs filed in the date range in the manifest and process new or amended ones."""
+        start_time = time.monotonic()
+        entries = list(self.iter_reports(start_date, end_date))
+
+        by_year: Dict[int, List[SenateFilingEntry]] = defaultdict(list)
+        for entry in entries:
+            by_year[entry.year].append(entry)
+
+        new_reports = amended_reports = 0
+        processed = failed = trades_found = 0
+        with db_manager.sync_session_scope() as session:
+            for year, year_entries in sorted(by_year.items()):
+                diff = diff_manifest(session, year, year_entries)
+                if diff.changed:
+                    upsert_manifest_entries(session, diff.changed)
+                    session.commit()
+                new_reports += len(diff.new)
+                amended_reports += len(diff.amended)
+
+            pending = session.execute(
+                select(CongressionalFilingManifest)
+                .where(CongressionalFilingManifest.filing_type == SENATE_PTR_FILING_TYPE)
+                .where(CongressionalFilingManifest.status.in_(PENDING_MANIFEST_STATUSES))
+                .where(CongressionalFilingManifest.attempts < MAX_FILING_ATTEMPTS)
+                .order_by(CongressionalFilingManifest.filing_date, CongressionalFilingManifest.doc_id)
+            ).scalars().all()
+
+            logger.info(
+                f"Senate eFD search since {start_date}: {len(entries)} reports, {new_reports} new, "
+                f"{amended_reports} amended, {len(pending)} PTRs to process"
+            )
+
+            for manifest_row in pending:
+                try:
+                    trades_found += self._process_report(session, manifest_row)
+                    processed += 1
+                except Exception as e:
+                    session.rollback()
+                    manifest_row.status = 'failed'
+                    manifest_row.attempts += 1
+                    manifest_row.last_error = str(e)[:2000]
+                    session.commit()
+                    failed += 1
+                    logger.error(f"Failed to sync Senate PTR {manifest_row.doc_id}: {e}")
+
+        return {
+            'reports_found': len(entries),
+            'new_reports': new_reports,
+            'amended_reports': amended_reports,
+            'ptrs_processed': processed,
+            'ptrs_failed': failed,
+            'trades_found': trades_found,
+            'duration_seconds': round(time.monotonic() - start_time, 2),
+        }
+
+    def iter_reports(self, start_date: date, end_date: Optional[date] = None) -> Iterator[SenateFilingEntry]:
+        """PTRs (electronic and paper) filed in the date range, one search page at a time."""
+        self._accept_agreement()
+        offset = 0
+        while True:
+            response = self._request('POST', SENATE_EFD_REPORT_DATA_URL, data={
+                'start': str(offset),
+                'length': str(SENATE_SEARCH_PAGE_SIZE),
+                'report_types': f"[{SENATE_PTR_REPORT_TYPE}]",
+                'filer_types': '[]',
+                'submitted_start_date': start_date.strftime('%m/%d/%Y 00:00:00'),
+                'submitted_end_date': end_date.strftime('%m/%d/%Y 23:59:59') if end_date else '',
+                'candidate_state': '',
+                'senator_state': '',
+                'office_id': '',
+                'first_name': '',
+                'last_name': '',
+                'csrfmiddlewaretoken': self._csrf_token,
+            }, headers={'Referer': SENATE_EFD_SEARCH_URL})
+            payload = response.json()
+            rows = payload.get('data', [])
+            yield from parse_report_search_rows(rows)
+
+            offset += len(rows)
+            if not rows or offset >= int(payload.get('recordsTotal', 0)):
+                break
+
+    def _accept_agreement(self):
+        """eFD only serves search results to sessions that accepted the usage agreement."""
+        if self._csrf_token:
+            return
+        home = self._request('GET', SENATE_EFD_HOME_URL)
+        token = _CSRF_PATTERN.search(home.text)
+        if not token:
+            raise RuntimeError("Could not find the eFD agreement form token")
+        self._request('POST', SENATE_EFD_HOME_URL, data={
+            'prohibition_agreement': '1',
+            'csrfmiddlewaretoken': token.group(1),
+        }, headers={'Referer': SENATE_EFD_HOME_URL})
+        self._csrf_token = self.http.cookies.get('csrftoken') or token.group(1)
+
+    def _process_report(self, session: Session, manifest_row: CongressionalFilingManifest) -> int:
+        """Stream, parse and ingest one PTR page; returns the number of transaction rows found."""
+        ingestion = self._get_ingestion()
+        self._accept_agreement()
+
+        response = self._request('GET', f"{SENATE_EFD_URL}/search/view/ptr/{manifest_row.doc_id}/", stream=True)
+        try:
+            response.raw.decode_content = True
+            page = parse_ptr_html(response.raw)
+        finally:
+            response.close()
+
+        batch = ptr_page_to_trade_records(
+            ingestion, page, manifest_row.doc_id, manifest_row.first_name or "", manifest_row.last_name or ""
+        )
+        ingest_trade_batch(ingestion, session, batch, manifest_row.doc_id)
+
+        manifest_row.status = 'processed'
+        manifest_row.attempts += 1
+        manifest_row.trades_found = len(page.rows)
+        manifest_row.last_error = None
+        manifest_row.processed_at = datetime.now(timezone.utc)
+        session.commit()
+        logger.info(f"Synced Senate PTR {manifest_row.doc_id}: {len(page.rows)} transactions, {len(batch)} queued for ingestion")
+        return len(page.rows)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """eFD request paced by the rate limiter, retrying throttled responses."""
+        host = host_of(url)
+        for attempt in range(1, MAX_DOWNLOAD_ATTEMPTS + 1):
+            self.rate_limiter.acquire(host)
+            response = self.http.request(method, url, timeout=self.timeout, **kwargs)
+            self.rate_limiter.record_response(
+                host, response.status_code, parse_retry_after(response.headers.get('Retry-After'))
+            )
+            if response.status_code not in THROTTLE_STATUS_CODES or attempt == MAX_DOWNLOAD_ATTEMPTS:
+                break
+            response.close()
+            logger.info(f"eFD request throttled (HTTP {response.status_code}), attempt {attempt}/{MAX_DOWNLOAD_ATTEMPTS}")
+        response.raise_for_status()
+        return response
+
+    def _get_ingestion(self):
+        if self._ingestion is None:
+            from domains.congressional.ingestion import CongressionalDataIngestion
+            self._ingestion = CongressionalDataIngestion()
+        return self._ingestion
+
+
+def import_saved_reports(paths: Iterable[Union[str, Path]], ingestion=None) -> Dict[str, Any]:
+    """
+    Ingest saved eFD PTR pages (e.g. fixtures), one report per file named <report id>.html.
+    The manifest is not touched; filer names come from each page's header.
+    """
+    if ingestion is None:
+        from domains.congressional.ingestion import CongressionalDataIngestion
+        ingestion = CongressionalDataIngestion()
+
+    reports = transactions = queued = 0
+    with db_manager.sync_session_scope() as session:
+        for path in paths:
+            path = Path(path)
+            page = parse_ptr_html(str(path))
+            batch = ptr_page_to_trade_records(ingestion, page, path.stem)
+            ingest_trade_batch(ingestion, session, batch, path.stem)
+            reports += 1
+            transactions += len(page.rows)
+            queued += len(batch)
+            logger.info(f"Imported saved Senate PTR {path.name}: {len(page.rows)} transactions, {len(batch)} queued")
+
+    return {
+        'reports_imported': reports,
+        'transactions_found': transactions,
+        'records_queued': queued,
+        'records_successful': ingestion.statistics.records_successful,
+    }
+
+
+def sync_senate_ptrs(start_date: date, rate_limiter: Optional[AdaptiveRateLimiter] = None) -> Dict[str, Any]:
+    """Run an incremental Senate PTR sync for reports filed since start_date."""
+    return SenatePTRSync(rate_limiter=rate_limiter).sync(start_date)
@@ -0,0 +1,242 @@
+"""
+Columnar Parquet staging for congressional trades.
+
+Raw TradeRecords and ProcessedTrades from an import are written with Arrow to
+Parquet files partitioned by transaction year (hive layout):
+
+    <root>/raw/year=2024/<source>-00000.parquet
+    <root>/processed/year=2024/<source>-00000.parquet
+
+Files are named after the import source (CSV file or byte range), and opening a
+source replaces its earlier files, so re-importing a file does not duplicate
+staged rows. Reads go through pyarrow.dataset with column pruning and year
+partition filters: re-running enrichment from the raw stage skips CSV parsing
+and date coercion, and the processed stage can be loaded for analysis without
+touching the database.
+"""
+
+import re
+import uuid
+from dataclasses import fields
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import logging
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+RAW_STAGE = 'raw'
+PROCESSED_STAGE = 'processed'
+
+# Rows buffered per stage before a Parquet file is written
+STAGING_FLUSH_ROWS = 50000
+
+# Confidence scores are stored as decimal(7, 4)
+CONFIDENCE_QUANTUM = Decimal('0.0001')
+
+# TradeRecord columns left out of ingestion reads unless requested (large, provenance only)
+RAW_PROVENANCE_COLUMNS = ('source_line', 'batch_id')
+
+_SOURCE_KEY_PATTERN = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def raw_trade_schema() -> 'pa.Schema':
+    return pa.schema([
+        ('doc_id', pa.string()),
+        ('member_name', pa.string()),
+        ('raw_asset_description', pa.string()),
+        ('transaction_type', pa.string()),
+        ('transaction_date', pa.date32()),
+        ('notification_date', pa.date32()),
+        ('owner', pa.string()),
+        ('amount', pa.string()),
+        ('filing_status', pa.string()),
+        ('comment', pa.string()),
+        ('cap_gains_over_200', pa.bool_()),
+        ('source_line', pa.string()),
+        ('line_number', pa.int32()),
+        ('batch_id', pa.string()),
+    ])
+
+
+def processed_trade_schema() -> 'pa.Schema':
+    confidence = pa.decimal128(7, 4)
+    return pa.schema([
+        ('doc_id', pa.string()),
+        ('member_id', pa.string()),
+        ('raw_asset_description', pa.string()),
+        ('transaction_type', pa.string()),
+        ('transaction_date', pa.date32()),
+        ('notification_date', pa.date32()),
+        ('owner', pa.string()),
+        ('amount_min', pa.int64()),
+        ('amount_max', pa.int64()),
+        ('amount_exact', pa.int64()),
+        ('filing_status', pa.string()),
+        ('comment', pa.string()),
+        ('cap_gains_over_200', pa.bool_()),
+        ('ticker', pa.string()),
+        ('asset_name', pa.string()),
+        ('asset_type', pa.string()),
+        ('security_id', pa.string()),
+        ('ticker_confidence', confidence),
+        ('amount_confidence', confidence),
+        ('parsed_successfully', pa.bool_()),
+        ('parsing_notes', pa.list_(pa.string())),
+        ('is_valid', pa.bool_()),
+        ('validation_errors', pa.list_(pa.string())),
+    ])
+
+
+def _column_value(value: Any) -> Any:
+    """Python value of a dataclass field as stored in Parquet."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return value.quantize(CONFIDENCE_QUANTUM)
+    return value
+
+
+def source_key(path: str, start_offset: Optional[int] = None) -> str:
+    """Staging file prefix for an import source (a CSV file, or a byte range of one)."""
+    key = _SOURCE_KEY_PATTERN.sub('_', Path(path).stem)
+    return f"{key}-{start_offset}" if start_offset is not None else key
+
+
+class TradeStagingStore:
+    """Writer and reader of the year-partitioned Parquet trade stages."""
+
+    def __init__(self, root: str, flush_rows: int = STAGING_FLUSH_ROWS):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet trade staging")
+        self.root = Path(root)
+        self.flush_rows = flush_rows
+        self.schemas = {RAW_STAGE: raw_trade_schema(), PROCESSED_STAGE: processed_trade_schema()}
+        self._source: Optional[str] = None
+        self._sequence = 0
+        self._buffers: Dict[str, Dict[int, List[Any]]] = {RAW_STAGE: {}, PROCESSED_STAGE: {}}
+        self._buffered_rows = 0
+
+    def stage_path(self, stage: str) -> Path:
+        return self.root / stage
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def open_source(self, key: str):
+        """Start staging rows for an import source, dropping files from its earlier runs."""
+        self.flush()
+        for stage in self.schemas:
+            for old_file in self.stage_path(stage).glob(f"year=*/{key}-[0-9]*.parquet"):
+                old_file.unlink()
+        self._source = key
+        self._sequence = 0
+
+    def clear(self, stage: str, years: Optional[Iterable[int]] = None):
+        """Remove a stage's files, for all years or the given ones."""
+        self.flush()
+        patterns = [f"year={year}/*.parquet" for year in years] if years is not None else ["year=*/*.parquet"]
+        for pattern in patterns:
+            for old_file in self.stage_path(stage).glob(pattern):
+                old_file.unlink()
+
+    def add_raw(self, records: Iterable[Any]):
+        self._add(RAW_STAGE, records)
+
+    def add_processed(self, trades: Iterable[Any]):
+        self._add(PROCESSED_STAGE, trades)
+
+    def _add(self, stage: str, items: Iterable[Any]):
+        buffers = self._buffers[stage]
+        for item in items:
+            buffers.setdefault(item.transaction_date.year, []).append(item)
+            self._buffered_rows += 1
+        if self._buffered_rows >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        """Write buffered rows, one Parquet file per stage and year."""
+        if not self._buffered_rows:
+            return
+        prefix = self._source or f"run_{uuid.uuid4().hex[:12]}"
+        for stage, by_year in self._buffers.items():
+            schema = self.schemas[stage]
+            for year, items in sorted(by_year.items()):
+                table = pa.Table.from_pydict({
+                    name: [_column_value(getattr(item, name)) for item in items]
+                    for name in schema.names
+                }, schema=schema)
+                path = self.stage_path(stage) / f"year={year}" / f"{prefix}-{self._sequence:05d}.parquet"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                pq.write_table(table, path, compression='zstd')
+            by_year.clear()
+        self._sequence += 1
+        logger.debug(f"Staged {self._buffered_rows} trade rows under {self.root}")
+        self._buffered_rows = 0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def dataset(self, stage: str) -> 'ds.Dataset':
+        return ds.dataset(
+            str(self.stage_path(stage)),
+            format='parquet',
+            partitioning=ds.partitioning(pa.schema([('year', pa.int32())]), flavor='hive'),
+            schema=self.schemas[stage].append(pa.field('year', pa.int32()))
+        )
+
+    def years(self, stage: str) -> List[int]:
+        return sorted(
+            int(path.name.split('=', 1)[1])
+            for path in self.stage_path(stage).glob("year=*") if any(path.glob("*.parquet"))
+        )
+
+    def scan(self, stage: str, columns: Optional[Sequence[str]] = None,
+             years: Optional[Iterable[int]] = None, batch_size: int = 10000) -> Iterator['pa.RecordBatch']:
+        """Record batches of a stage, reading only the requested columns and year partitions."""
+        if not self.stage_path(stage).exists():
+            return
+        year_filter = ds.field('year').isin(list(years)) if years is not None else None
+        yield from self.dataset(stage).to_batches(
+            columns=list(columns) if columns is not None else None,
+            filter=year_filter,
+            batch_size=batch_size
+        )
+
+    def read_table(self, stage: str, columns: Optional[Sequence[str]] = None,
+                   years: Optional[Iterable[int]] = None) -> 'pa.Table':
+        """A stage as one Arrow table (e.g. for export with .to_pandas())."""
+        if not self.stage_path(stage).exists():
+            table = self.schemas[stage].empty_table()
+            return table.select(list(columns)) if columns is not None else table
+        year_filter = ds.field('year').isin(list(years)) if years is not None else None
+        return self.dataset(stage).to_table(
+            columns=list(columns) if columns is not None else None,
+            filter=year_filter
+        )
+
+    def iter_raw_records(self, record_type, years: Optional[Iterable[int]] = None,
+                         include_provenance: bool = False, batch_size: int = 10000) -> Iterator[Any]:
+        """
+        Raw stage rows as `record_type` (TradeRecord) instances. Provenance
+        columns are pruned from the read unless requested.
+        """
+        names = [f.name for f in fields(record_type) if f.name in self.schemas[RAW_STAGE].names]
+        if not include_provenance:
+            names = [name for name in names if name not in RAW_PROVENANCE_COLUMNS]
+        for batch in self.scan(RAW_STAGE, columns=names, years=years, batch_size=batch_size):
+            for row in batch.to_pylist():
+                yield record_type(**row)
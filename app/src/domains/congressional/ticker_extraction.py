@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from functools import lru_cache
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process as rf_process
     RAPIDFUZZ_AVAILABLE = True
 except ImportError:
     try:
@@ -200,31 +200,56 @@ class TickerExtractor:
     
     def extract_ticker_from_description(self, description: str) -> TickerExtractionResult:
         """Extract ticker from asset description using multiple methods."""
-        if not description or not description.strip():
-            return TickerExtractionResult(method="empty_description")
+        return self.extract_tickers_from_descriptions([description])[0]
+    
+    def extract_tickers_from_descriptions(self, descriptions: List[str], workers: int = 1) -> List[TickerExtractionResult]:
+        """
+        Extract tickers for a batch of asset descriptions.
         
-        description = description.strip()
-        result = TickerExtractionResult()
+        Same methods and precedence as extract_ticker_from_description, but the
+        fuzzy company-name step scores every unresolved description against the
+        mapping in a single rapidfuzz cdist call (``workers`` threads, -1 = all cores).
+        """
+        results: List[Optional[TickerExtractionResult]] = [None] * len(descriptions)
+        fuzzy_pending: List[int] = []
         
         # Method 1: Regex pattern matching
-        ticker_result = self._extract_ticker_with_regex(description)
-        if ticker_result.ticker:
-            return ticker_result
+        for i, description in enumerate(descriptions):
+            if not description or not description.strip():
+                results[i] = TickerExtractionResult(method="empty_description")
+                continue
+            ticker_result = self._extract_ticker_with_regex(description.strip())
+            if ticker_result.ticker:
+                results[i] = ticker_result
+            else:
+                fuzzy_pending.append(i)
         
         # Method 2: Fuzzy matching with company names
-        fuzzy_result = self._extract_ticker_with_fuzzy_matching(description)
-        if fuzzy_result.ticker:
-            return fuzzy_result
-        
-        # Method 3: Word-based heuristics
-        heuristic_result = self._extract_ticker_with_heuristics(description)
-        if heuristic_result.ticker:
-            return heuristic_result
-        
-        # No ticker found
-        result.method = "no_match"
-        result.notes.append(f"No ticker found in: {description}")
-        return result
+        if fuzzy_pending:
+            fuzzy_results = self._extract_tickers_with_fuzzy_matching(
+                [descriptions[i].strip() for i in fuzzy_pending], workers
+            )
+            for i, fuzzy_result in zip(fuzzy_pending, fuzzy_results):
+                if fuzzy_result.ticker:
+                    results[i] = fuzzy_result
+        
+        for i, description in enumerate(descriptions):
+            if results[i] is not None:
+                continue
+            description = description.strip()
+            
+            # Method 3: Word-based heuristics
+            heuristic_result = self._extract_ticker_with_heuristics(description)
+            if heuristic_result.ticker:
+                results[i] = heuristic_result
+                continue
+            
+            # No ticker found
+            result = TickerExtractionResult(method="no_match")
+            result.notes.append(f"No ticker found in: {description}")
+            results[i] = result
+        
+        return results
     
     def _extract_ticker_with_regex(self, description: str) -> TickerExtractionResult:
         """Extract ticker using regex patterns."""
@@ -281,6 +306,58 @@ class TickerExtractor:
         
         return TickerExtractionResult(method="fuzzy_no_match")
     
+    def _extract_tickers_with_fuzzy_matching(self, descriptions: List[str], workers: int = 1) -> List[TickerExtractionResult]:
+        """Batched _extract_ticker_with_fuzzy_matching using one cdist matrix for the partial scores."""
+        if not RAPIDFUZZ_AVAILABLE:
+            return [self._extract_ticker_with_fuzzy_matching(description) for description in descriptions]
+        
+        company_items = list(self.company_ticker_mapping.items())
+        company_names = [company_name.lower() for company_name, _ in company_items]
+        results: List[Optional[TickerExtractionResult]] = [None] * len(descriptions)
+        partial_pending: List[int] = []
+        partial_queries: List[str] = []
+        
+        for i, description in enumerate(descriptions):
+            description_clean = self._clean_description_for_matching(description).lower()
+            
+            # Try exact match first
+            for (company_name, ticker), company_lower in zip(company_items, company_names):
+                if company_lower in description_clean:
+                    results[i] = TickerExtractionResult(
+                        ticker=ticker,
+                        confidence=0.95,
+                        method="fuzzy_exact_match",
+                        notes=[f"Exact match: {company_name}"]
+                    )
+                    break
+            else:
+                partial_pending.append(i)
+                partial_queries.append(description_clean)
+        
+        if partial_pending and company_names:
+            # Rows are company names so the scorer sees (company, description) as in the per-item path
+            scores = rf_process.cdist(
+                company_names,
+                partial_queries,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=80,  # 80% threshold
+                workers=workers,
+            )
+            best_companies = scores.argmax(axis=0)
+            for column, i in enumerate(partial_pending):
+                best = best_companies[column]
+                best_score = float(scores[best, column])
+                if best_score >= 80:
+                    best_match, best_ticker = company_items[best]
+                    results[i] = TickerExtractionResult(
+                        ticker=best_ticker,
+                        confidence=best_score / 100.0,
+                        method="fuzzy_partial_match",
+                        notes=[f"Fuzzy match: {best_match} (score: {best_score})"]
+                    )
+        
+        return [result or TickerExtractionResult(method="fuzzy_no_match") for result in results]
+    
     def _extract_ticker_with_heuristics(self, description: str) -> TickerExtractionResult:
         """Extract ticker using word-based heuristics."""
         words = re.findall(r'\b[A-Z]{1,5}\b', description.upper())
@@ -4,6 +4,7 @@ Alert Rule Engine for Congressional Trade Notifications.
 This engine evaluates alert rules against new trades to determine which users should be notified.
 """
 
+from bisect import bisect_right
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -114,6 +115,65 @@ class AlertRuleEngine:
             logger.error(f"Error evaluating ticker alerts: {e}")
             return []
     
+    async def evaluate_alerts_for_trades(self, trades: List[CongressionalTradeDetail]) -> Dict[Any, List[TradeAlertRule]]:
+        """
+        Evaluate all alert types for a set of trades in one pass.
+        
+        Loads every candidate rule with a single query and matches trades in memory,
+        instead of three queries per trade. Returns trade ID -> unique triggered rules.
+        """
+        if not trades:
+            return {}
+        
+        member_ids = {trade.member_id for trade in trades}
+        tickers = {trade.ticker.upper() for trade in trades if trade.ticker}
+        max_amount = max((trade.amount_max or trade.amount_exact or 0) for trade in trades)
+        
+        conditions = [
+            and_(TradeAlertRule.alert_type == "member_trades", TradeAlertRule.target_id.in_(member_ids)),
+            and_(TradeAlertRule.alert_type == "amount_threshold", TradeAlertRule.threshold_value <= max_amount),
+        ]
+        if tickers:
+            conditions.append(
+                and_(TradeAlertRule.alert_type == "ticker_trades", TradeAlertRule.target_symbol.in_(tickers))
+            )
+        
+        try:
+            query = select(TradeAlertRule).where(
+                and_(TradeAlertRule.is_active == True, or_(*conditions))
+            )
+            result = await self.session.execute(query)
+            rules = result.scalars().all()
+        except Exception as e:
+            logger.error(f"Error loading alert rules for {len(trades)} trades: {e}")
+            return {trade.id: [] for trade in trades}
+        
+        member_rules: Dict[Any, List[TradeAlertRule]] = {}
+        ticker_rules: Dict[str, List[TradeAlertRule]] = {}
+        amount_rules: List[TradeAlertRule] = []
+        for rule in rules:
+            if rule.alert_type == "member_trades":
+                member_rules.setdefault(rule.target_id, []).append(rule)
+            elif rule.alert_type == "ticker_trades":
+                ticker_rules.setdefault(rule.target_symbol, []).append(rule)
+            else:
+                amount_rules.append(rule)
+        amount_rules.sort(key=lambda rule: rule.threshold_value)
+        thresholds = [rule.threshold_value for rule in amount_rules]
+        
+        triggered: Dict[Any, List[TradeAlertRule]] = {}
+        for trade in trades:
+            trade_amount = trade.amount_max or trade.amount_exact or 0
+            alerts = list(member_rules.get(trade.member_id, []))
+            alerts.extend(amount_rules[:bisect_right(thresholds, trade_amount)])
+            if trade.ticker:
+                alerts.extend(ticker_rules.get(trade.ticker.upper(), []))
+            triggered[trade.id] = self._deduplicate_alerts(alerts)
+        
+        logger.info(f"Evaluated {len(rules)} alert rules against {len(trades)} trades: "
+                    f"{sum(len(alerts) for alerts in triggered.values())} alerts triggered")
+        return triggered
+    
     def _deduplicate_alerts(self, alerts: List[TradeAlertRule]) -> List[TradeAlertRule]:
         """Remove duplicate alerts for the same user and alert type."""
         seen = set()
@@ -77,7 +77,7 @@ class TradeDetectionService:
             raise
     
     async def batch_process_trades(self, trades: List[CongressionalTradeDetail]) -> Dict[str, Any]:
-        """Process multiple trades efficiently."""
+        """Process multiple trades, evaluating alert rules for the whole set at once."""
         results = {
             "total_trades": len(trades),
             "processed_trades": 0,
@@ -85,20 +85,23 @@ class TradeDetectionService:
             "errors": []
         }
         
+        triggered_by_trade = await self.alert_engine.evaluate_alerts_for_trades(trades)
+        
         for trade in trades:
-            try:
-                result = await self.process_new_trade(trade)
-                results["processed_trades"] += 1
-                results["total_notifications"] += result["notifications_sent"]
-            except Exception as e:
-                results["errors"].append({
-                    "trade_id": trade.id,
-                    "error": str(e)
-                })
-                logger.error(f"Error processing trade {trade.id}: {e}")
+            for alert_rule in triggered_by_trade.get(trade.id, []):
+                try:
+                    await self.notification_service.send_trade_alert_email(
+                        alert_rule.user, trade, alert_rule
+                    )
+                    results["total_notifications"] += 1
+                except Exception as e:
+                    results["errors"].append({
+                        "trade_id": trade.id,
+                        "alert_rule_id": alert_rule.id,
+                        "error": str(e)
+                    })
+                    logger.error(f"Failed to send notification for alert {alert_rule.id}: {e}")
+            results["processed_trades"] += 1
         
         logger.info(f"Batch processing completed: {results}")
         return results
-
-
-
@@ -25,6 +25,7 @@ logger = logging.getLogger(__name__)
 
 from domains.securities.models import Security, AssetType, Exchange, Sector, DailyPrice
 from domains.base.schemas import validate_ticker_symbol
+from core.blocking_io import run_blocking
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -255,7 +256,7 @@ async def get_or_create_security_enhanced(session: AsyncSession, ticker: str, na
             else:
                 # For non-TSX tickers, try YFinance first, then Alpha Vantage as fallback if YF returns no data
                 try:
-                    yf_data = fetch_yfinance_data(ticker)
+                    yf_data = await run_blocking(fetch_yfinance_data, ticker)
                     used_source = 'yfinance'
                 except Exception as e:
                     logger.warning(f"YFinance failed for {ticker}: {e}")
@@ -1012,11 +1013,17 @@ async def ingest_price_data_for_all_securities(session: AsyncSession, batch_size
         batch = securities[i:i + batch_size]
         logger.info(f"Processing batch {i//batch_size + 1}: securities {i+1}-{min(i+batch_size, total_securities)}")
         
-        for security in batch:
+        # Fetch the batch's price histories in parallel on the provider thread pool
+        # (yfinance is blocking); database writes below stay on this session
+        histories = await asyncio.gather(*(
+            run_blocking(yf.Ticker(security.ticker).history, period="1y")  # 1 year of data
+            for security in batch
+        ), return_exceptions=True)
+        
+        for security, hist in zip(batch, histories):
             try:
-                # Fetch price data using yfinance
-                ticker_obj = yf.Ticker(security.ticker)
-                hist = ticker_obj.history(period="1y")  # 1 year of data
+                if isinstance(hist, Exception):
+                    raise hist
                 
                 if hist.empty:
                     logger.warning(f"No price data found for {security.ticker}")
@@ -12,15 +12,20 @@ import asyncio
 import aiohttp
 import time
 import logging
-from typing import Dict, Optional, List, Tuple
-from datetime import datetime, date, timedelta
+from typing import Dict, Optional, List, Set, Tuple
+from datetime import datetime, date, timedelta, timezone
 from decimal import Decimal
 import yfinance as yf
 import pandas as pd
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import os
-from dataclasses import dataclass
+import uuid
+from functools import lru_cache
+from core.blocking_io import run_blocking
+from core.rate_limiting import LocalGCRABackend, get_gcra_backend
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -48,57 +53,277 @@ class PriceData:
     data_quality: str = "good"
 
 
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th given weekday (Monday = 0) of a month; n = -1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = (date(year, month + 1, 1) if month < 12 else date(year + 1, 1, 1)) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(holiday: date) -> date:
+    """Weekday a fixed-date holiday is observed on: Saturday -> Friday, Sunday -> Monday."""
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year: int) -> frozenset:
+    """Weekdays of a year on which NYSE is closed for a scheduled holiday."""
+    holidays = {
+        _nth_weekday(year, 2, 0, 3),            # Washington's Birthday
+        _easter(year) - timedelta(days=2),      # Good Friday
+        _nth_weekday(year, 5, 0, -1),           # Memorial Day
+        _observed(date(year, 7, 4)),            # Independence Day
+        _nth_weekday(year, 9, 0, 1),            # Labor Day
+        _nth_weekday(year, 11, 3, 4),           # Thanksgiving
+        _observed(date(year, 12, 25)),          # Christmas
+    }
+    # New Year's Day falling on a Saturday is not observed on the Friday before
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 1998:
+        holidays.add(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+
+def is_trading_day(check_date: date) -> bool:
+    """Whether NYSE is open on a date (weekdays that are not holidays or special closures)."""
+    return (
+        check_date.weekday() < 5
+        and check_date not in nyse_holidays(check_date.year)
+        and check_date not in NYSE_SPECIAL_CLOSURES
+    )
+
+
 class RateLimiter:
-    """Rate limiter for API calls."""
+    """
+    Rate limiter for API calls: at most max_requests per time_window seconds.
+    
+    GCRA keeps one theoretical arrival time per source, so admission is O(1)
+    and the wait until the next slot is exact. Bursts of up to max_requests
+    are allowed, then requests are spaced time_window / max_requests apart.
+    The state lives in the given backend: process memory by default, or Redis
+    to share a provider's budget across Celery workers. A failing shared
+    backend falls back to per-process limits.
+    """
     
-    def __init__(self, max_requests: int, time_window: int):
+    def __init__(self, max_requests: int, time_window: int, name: str = "default", backend=None):
         self.max_requests = max_requests
         self.time_window = time_window  # seconds
-        self.requests = []
+        self.name = name
+        self.interval = time_window / max_requests
+        self.backend = backend or LocalGCRABackend()
+        self._fallback_backend: Optional[LocalGCRABackend] = None
     
-    def can_proceed(self) -> bool:
-        """Check if we can make another request."""
-        now = time.time()
-        # Remove old requests outside the time window
-        self.requests = [req_time for req_time in self.requests 
-                        if now - req_time < self.time_window]
-        
-        if len(self.requests) < self.max_requests:
-            self.requests.append(now)
-            return True
-        
-        return False
+    async def _admit(self, consume: bool) -> float:
+        if self._fallback_backend is None:
+            try:
+                return await self.backend.admit(self.name, self.interval, self.time_window, consume)
+            except Exception as e:
+                logger.warning(f"Shared rate limit backend unavailable, using per-process limits: {e}")
+                self._fallback_backend = LocalGCRABackend()
+        return await self._fallback_backend.admit(self.name, self.interval, self.time_window, consume)
+    
+    async def can_proceed(self) -> bool:
+        """Check if we can make another request (and count it if so)."""
+        return await self._admit(consume=True) <= 0
     
-    def get_wait_time(self) -> float:
+    async def get_wait_time(self) -> float:
         """Get time to wait before next request."""
-        if not self.requests:
-            return 0.0
-        
-        oldest_request = min(self.requests)
-        wait_time = self.time_window - (time.time() - oldest_request)
-        return max(0.0, wait_time)
+        return await self._admit(consume=False)
+    
+    async def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Wait for a request slot. Returns False, without waiting, if the next
+        slot is more than max_wait seconds away.
+        """
+        deadline = time.monotonic() + max_wait if max_wait is not None else None
+        while True:
+            wait = await self._admit(consume=True)
+            if wait <= 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+
+# Tickers per grouped yf.download request
+YFINANCE_BATCH_SIZE = 200
+
+# Longest wait for a source's rate limit slot before falling back to the next source
+RATE_LIMIT_MAX_WAIT = 120.0
+
+# Days either side of a target date searched for the closest trading day
+PRICE_WINDOW_DAYS = 5
+
+# Alpha Vantage "compact" series (100 trading days) covers roughly this many calendar days
+ALPHA_VANTAGE_COMPACT_DAYS = 140
+
+# Polygon aggregates returned per request (the API maximum)
+POLYGON_MAX_AGGREGATES = 50000
+
+# Missing trading-day runs separated by at most this many stored days are fetched together
+BACKFILL_GAP_MERGE_DAYS = 5
+
+# Gaps of at most this many trading days between stored days are most likely
+# unscheduled market closures: they are asked of YFinance only, and an empty
+# answer does not fall through to the quota-limited sources
+BACKFILL_SHORT_GAP_DAYS = 2
+
+# Unscheduled full-day NYSE closures (September 11, national days of mourning, Hurricane Sandy)
+NYSE_SPECIAL_CLOSURES = frozenset({
+    date(2001, 9, 11), date(2001, 9, 12), date(2001, 9, 13), date(2001, 9, 14),
+    date(2004, 6, 11),
+    date(2007, 1, 2),
+    date(2012, 10, 29), date(2012, 10, 30),
+    date(2018, 12, 5),
+    date(2025, 1, 9),
+})
+
+# DailyPrice rows per INSERT ... ON CONFLICT statement
+PRICE_UPSERT_CHUNK_SIZE = 1000
+
+# Requests in flight per provider
+DEFAULT_PROVIDER_CONCURRENCY = {
+    DataSource.YFINANCE: 10,
+    DataSource.ALPHA_VANTAGE: 1,
+    DataSource.POLYGON: 4,
+}
+
+# Retry rounds for securities whose backfill raised, and the delay before each round
+BACKFILL_MAX_RETRIES = 2
+BACKFILL_RETRY_DELAY = 30.0
+
+# Seconds between backfill progress log lines
+BACKFILL_PROGRESS_INTERVAL = 30.0
+
+
+def closest_price(prices: List[PriceData], target_date: date) -> Optional[PriceData]:
+    """The price on target_date or the closest available day, reported for target_date."""
+    if not prices:
+        return None
+    closest = min(prices, key=lambda p: abs((p.date - target_date).days))
+    if closest.date != target_date:
+        closest = replace(closest, date=target_date)
+    return closest
 
 
 class YFinanceSource:
     """YFinance data source implementation."""
     
-    def __init__(self):
-        self.rate_limiter = RateLimiter(max_requests=2000, time_window=3600)  # 2000 requests per hour
+    def __init__(self, rate_limit_backend=None):
         self.name = "yfinance"
+        self.rate_limiter = RateLimiter(max_requests=2000, time_window=3600,  # 2000 requests per hour
+                                        name=self.name, backend=rate_limit_backend)
+    
+    def _price_from_row(self, ticker: str, price_date: date, row) -> PriceData:
+        return PriceData(
+            ticker=ticker,
+            date=price_date,
+            open_price=Decimal(str(row['Open'])),
+            high_price=Decimal(str(row['High'])),
+            low_price=Decimal(str(row['Low'])),
+            close_price=Decimal(str(row['Close'])),
+            volume=int(row['Volume']) if pd.notna(row['Volume']) else 0,
+            adjusted_close=Decimal(str(row['Adj Close'])) if 'Adj Close' in row and pd.notna(row['Adj Close']) else None,
+            source=self.name,
+            data_quality="good"
+        )
+    
+    def _split_download(self, frame: pd.DataFrame, tickers: List[str]) -> Dict[str, List[PriceData]]:
+        """Split a grouped yf.download frame (ticker, field) into per-ticker price lists."""
+        prices = {}
+        if frame is None or frame.empty:
+            return prices
+        grouped = isinstance(frame.columns, pd.MultiIndex)
+        available = set(frame.columns.get_level_values(0)) if grouped else set(tickers[:1])
+        for ticker in tickers:
+            if ticker not in available:
+                continue
+            ticker_frame = frame[ticker] if grouped else frame
+            ticker_frame = ticker_frame.dropna(subset=['Open', 'High', 'Low', 'Close'])
+            if ticker_frame.empty:
+                continue
+            prices[ticker] = [
+                self._price_from_row(ticker, index.date(), row)
+                for index, row in ticker_frame.iterrows()
+            ]
+        return prices
+    
+    async def fetch_batch_history(self, tickers: List[str], start_date: date,
+                                  end_date: date) -> Dict[str, List[PriceData]]:
+        """
+        Fetch daily prices for many tickers over [start_date, end_date] with
+        grouped yf.download requests (YFINANCE_BATCH_SIZE tickers each).
+        
+        Tickers yfinance returned no rows for are absent from the result.
+        """
+        prices = {}
+        for i in range(0, len(tickers), YFINANCE_BATCH_SIZE):
+            chunk = tickers[i:i + YFINANCE_BATCH_SIZE]
+            if not await self.rate_limiter.acquire(RATE_LIMIT_MAX_WAIT):
+                logger.warning(f"Rate limit exceeded for YFinance batch of {len(chunk)} tickers")
+                continue
+            
+            try:
+                frame = await run_blocking(
+                    yf.download,
+                    tickers=chunk,
+                    start=start_date,
+                    end=end_date + timedelta(days=1),  # end is exclusive
+                    group_by='ticker',
+                    auto_adjust=True,  # same prices as Ticker.history()
+                    actions=False,
+                    threads=True,
+                    progress=False
+                )
+                prices.update(self._split_download(frame, chunk))
+            except Exception as e:
+                logger.error(f"YFinance batch error for {len(chunk)} tickers: {e}")
+        
+        logger.info(f"YFinance batch returned data for {len(prices)}/{len(tickers)} tickers")
+        return prices
+    
+    async def fetch_price_range(self, ticker: str, start_date: date, end_date: date) -> List[PriceData]:
+        """Fetch all daily prices of one ticker in [start_date, end_date] in one request."""
+        history = await self.fetch_batch_history([ticker], start_date, end_date)
+        return history.get(ticker, [])
     
     async def fetch_daily_price(self, ticker: str, target_date: date) -> Optional[PriceData]:
         """Fetch daily price data from YFinance."""
-        if not self.rate_limiter.can_proceed():
+        if not await self.rate_limiter.acquire(RATE_LIMIT_MAX_WAIT):
             logger.warning(f"Rate limit exceeded for YFinance: {ticker}")
             return None
         
         try:
             # Get data for a range around the target date
-            start_date = target_date - timedelta(days=5)
-            end_date = target_date + timedelta(days=5)
+            start_date = target_date - timedelta(days=PRICE_WINDOW_DAYS)
+            end_date = target_date + timedelta(days=PRICE_WINDOW_DAYS)
             
             ticker_obj = yf.Ticker(ticker)
-            hist = ticker_obj.history(start=start_date, end=end_date)
+            hist = await run_blocking(ticker_obj.history, start=start_date, end=end_date)
             
             if hist.empty:
                 logger.warning(f"No data found for {ticker} on {target_date}")
@@ -114,18 +339,7 @@ class YFinanceSource:
                 closest_date = min(available_dates, key=lambda x: abs((x - target_date).days))
                 row = hist.loc[closest_date.strftime('%Y-%m-%d')]
             
-            return PriceData(
-                ticker=ticker,
-                date=target_date,
-                open_price=Decimal(str(row['Open'])),
-                high_price=Decimal(str(row['High'])),
-                low_price=Decimal(str(row['Low'])),
-                close_price=Decimal(str(row['Close'])),
-                volume=int(row['Volume']),
-                adjusted_close=Decimal(str(row['Adj Close'])) if 'Adj Close' in row else None,
-                source=self.name,
-                data_quality="good"
-            )
+            return self._price_from_row(ticker, target_date, row)
             
         except Exception as e:
             logger.error(f"YFinance error for {ticker}: {e}")
@@ -135,80 +349,160 @@ class YFinanceSource:
 class AlphaVantageSource:
     """Alpha Vantage data source implementation."""
     
-    def __init__(self):
+    def __init__(self, rate_limit_backend=None):
         self.api_key = os.getenv('ALPHA_VANTAGE_API_KEY')
-        self.rate_limiter = RateLimiter(max_requests=500, time_window=86400)  # 500 requests per day
         self.name = "alpha_vantage"
+        self.rate_limiter = RateLimiter(max_requests=500, time_window=86400,  # 500 requests per day
+                                        name=self.name, backend=rate_limit_backend)
         
         if not self.api_key:
             logger.warning("Alpha Vantage API key not found")
     
+    def _price_from_daily(self, ticker: str, price_date: date, daily_data: Dict) -> PriceData:
+        return PriceData(
+            ticker=ticker,
+            date=price_date,
+            open_price=Decimal(daily_data['1. open']),
+            high_price=Decimal(daily_data['2. high']),
+            low_price=Decimal(daily_data['3. low']),
+            close_price=Decimal(daily_data['4. close']),
+            volume=int(daily_data['5. volume']),
+            source=self.name,
+            data_quality="good"
+        )
+    
+    async def _fetch_time_series(self, ticker: str, outputsize: str) -> Optional[Dict]:
+        """The TIME_SERIES_DAILY series of a ticker keyed by YYYY-MM-DD, or None on errors."""
+        url = "https://www.alphavantage.co/query"
+        params = {
+            "function": "TIME_SERIES_DAILY",
+            "symbol": ticker,
+            "apikey": self.api_key,
+            "outputsize": outputsize
+        }
+        
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    logger.error(f"Alpha Vantage API error: {response.status}")
+                    return None
+                
+                data = await response.json()
+                
+                if "Error Message" in data:
+                    logger.error(f"Alpha Vantage error: {data['Error Message']}")
+                    return None
+                
+                return data.get("Time Series (Daily)", {})
+    
     async def fetch_daily_price(self, ticker: str, target_date: date) -> Optional[PriceData]:
         """Fetch daily price data from Alpha Vantage."""
-        if not self.api_key or not self.rate_limiter.can_proceed():
+        if not self.api_key or not await self.rate_limiter.acquire(RATE_LIMIT_MAX_WAIT):
             return None
         
         try:
-            url = "https://www.alphavantage.co/query"
-            params = {
-                "function": "TIME_SERIES_DAILY",
-                "symbol": ticker,
-                "apikey": self.api_key,
-                "outputsize": "compact"
-            }
+            time_series = await self._fetch_time_series(ticker, "compact")
+            if time_series is None:
+                return None
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"Alpha Vantage API error: {response.status}")
-                        return None
-                    
-                    data = await response.json()
-                    
-                    if "Error Message" in data:
-                        logger.error(f"Alpha Vantage error: {data['Error Message']}")
-                        return None
-                    
-                    time_series = data.get("Time Series (Daily)", {})
-                    target_date_str = target_date.strftime('%Y-%m-%d')
-                    
-                    if target_date_str not in time_series:
-                        logger.warning(f"No data for {ticker} on {target_date_str}")
-                        return None
-                    
-                    daily_data = time_series[target_date_str]
-                    
-                    return PriceData(
-                        ticker=ticker,
-                        date=target_date,
-                        open_price=Decimal(daily_data['1. open']),
-                        high_price=Decimal(daily_data['2. high']),
-                        low_price=Decimal(daily_data['3. low']),
-                        close_price=Decimal(daily_data['4. close']),
-                        volume=int(daily_data['5. volume']),
-                        source=self.name,
-                        data_quality="good"
-                    )
+            target_date_str = target_date.strftime('%Y-%m-%d')
+            if target_date_str not in time_series:
+                logger.warning(f"No data for {ticker} on {target_date_str}")
+                return None
+            
+            return self._price_from_daily(ticker, target_date, time_series[target_date_str])
                     
         except Exception as e:
             logger.error(f"Alpha Vantage error for {ticker}: {e}")
             return None
+    
+    async def fetch_price_range(self, ticker: str, start_date: date, end_date: date) -> List[PriceData]:
+        """Fetch all daily prices of one ticker in [start_date, end_date] in one request."""
+        if not self.api_key or not await self.rate_limiter.acquire(RATE_LIMIT_MAX_WAIT):
+            return []
+        
+        try:
+            # "compact" only holds the latest 100 trading days
+            compact_start = date.today() - timedelta(days=ALPHA_VANTAGE_COMPACT_DAYS)
+            outputsize = "compact" if start_date >= compact_start else "full"
+            time_series = await self._fetch_time_series(ticker, outputsize)
+            if not time_series:
+                return []
+            
+            prices = []
+            for day_str, daily_data in time_series.items():
+                price_date = datetime.strptime(day_str, '%Y-%m-%d').date()
+                if start_date <= price_date <= end_date:
+                    prices.append(self._price_from_daily(ticker, price_date, daily_data))
+            prices.sort(key=lambda p: p.date)
+            return prices
+        
+        except Exception as e:
+            logger.error(f"Alpha Vantage error for {ticker}: {e}")
+            return []
 
 
 class PolygonSource:
     """Polygon.io data source implementation."""
     
-    def __init__(self):
+    def __init__(self, rate_limit_backend=None):
         self.api_key = os.getenv('POLYGON_API_KEY')
-        self.rate_limiter = RateLimiter(max_requests=5000, time_window=60)  # 5000 requests per minute
         self.name = "polygon"
+        self.rate_limiter = RateLimiter(max_requests=5000, time_window=60,  # 5000 requests per minute
+                                        name=self.name, backend=rate_limit_backend)
         
         if not self.api_key:
             logger.warning("Polygon API key not found")
     
+    async def fetch_price_range(self, ticker: str, start_date: date, end_date: date) -> List[PriceData]:
+        """Fetch all daily prices of one ticker in [start_date, end_date] in one request."""
+        if not self.api_key or not await self.rate_limiter.acquire(RATE_LIMIT_MAX_WAIT):
+            return []
+        
+        try:
+            url = f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/1/day/{start_date}/{end_date}"
+            params = {
+                "apiKey": self.api_key,
+                "adjusted": "true",
+                "sort": "asc",
+                "limit": POLYGON_MAX_AGGREGATES
+            }
+            
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, params=params) as response:
+                    if response.status != 200:
+                        logger.error(f"Polygon API error: {response.status}")
+                        return []
+                    
+                    data = await response.json()
+                    
+                    if data.get("status") != "OK":
+                        logger.error(f"Polygon error: {data.get('error', 'Unknown error')}")
+                        return []
+                    
+                    return [
+                        PriceData(
+                            ticker=ticker,
+                            # Bar timestamps are the session start in ms since the epoch (UTC)
+                            date=datetime.fromtimestamp(bar['t'] / 1000, tz=timezone.utc).date(),
+                            open_price=Decimal(str(bar['o'])),
+                            high_price=Decimal(str(bar['h'])),
+                            low_price=Decimal(str(bar['l'])),
+                            close_price=Decimal(str(bar['c'])),
+                            volume=int(bar['v']),
+                            source=self.name,
+                            data_quality="good"
+                        )
+                        for bar in data.get("results", [])
+                    ]
+        
+        except Exception as e:
+            logger.error(f"Polygon error for {ticker}: {e}")
+            return []
+    
     async def fetch_daily_price(self, ticker: str, target_date: date) -> Optional[PriceData]:
         """Fetch daily price data from Polygon."""
-        if not self.api_key or not self.rate_limiter.can_proceed():
+        if not self.api_key or not await self.rate_limiter.acquire(RATE_LIMIT_MAX_WAIT):
             return None
         
         try:
@@ -257,17 +551,32 @@ class PolygonSource:
 class PriceDataFetcher:
     """Multi-source price data fetcher with fallback logic."""
     
-    def __init__(self):
+    def __init__(self, provider_concurrency: Optional[Dict[DataSource, int]] = None,
+                 rate_limit_backend=None):
+        # Request budgets are shared through Redis across workers when configured;
+        # the backend is created once per process, not per fetcher
+        rate_limit_backend = rate_limit_backend or get_gcra_backend()
         self.sources = {
-            DataSource.YFINANCE: YFinanceSource(),
-            DataSource.ALPHA_VANTAGE: AlphaVantageSource(),
-            DataSource.POLYGON: PolygonSource()
+            DataSource.YFINANCE: YFinanceSource(rate_limit_backend),
+            DataSource.ALPHA_VANTAGE: AlphaVantageSource(rate_limit_backend),
+            DataSource.POLYGON: PolygonSource(rate_limit_backend)
         }
         self.source_priority = [
             DataSource.YFINANCE,
             DataSource.ALPHA_VANTAGE,
             DataSource.POLYGON
         ]
+        # Per-provider bound on requests in flight, shared by every caller of this fetcher
+        self.provider_concurrency = {**DEFAULT_PROVIDER_CONCURRENCY, **(provider_concurrency or {})}
+        self.source_slots = {
+            source_enum: asyncio.Semaphore(limit)
+            for source_enum, limit in self.provider_concurrency.items()
+        }
+    
+    @property
+    def total_concurrency(self) -> int:
+        """Requests that can be in flight across all providers."""
+        return sum(self.provider_concurrency.values())
     
     def _validate_price_data(self, price_data: PriceData) -> bool:
         """Validate price data quality."""
@@ -304,7 +613,8 @@ class PriceDataFetcher:
             source = self.sources[source_enum]
             
             try:
-                price_data = await source.fetch_daily_price(ticker, target_date)
+                async with self.source_slots[source_enum]:
+                    price_data = await source.fetch_daily_price(ticker, target_date)
                 
                 if price_data and self._validate_price_data(price_data):
                     logger.info(f"Successfully fetched {ticker} data from {source.name} for {target_date}")
@@ -319,9 +629,64 @@ class PriceDataFetcher:
         logger.error(f"All sources failed for {ticker} on {target_date}")
         return None
     
+    async def fetch_price_range(self, ticker: str, start_date: date, end_date: date,
+                                sources: Optional[List[DataSource]] = None) -> List[PriceData]:
+        """
+        Fetch daily prices of a ticker over [start_date, end_date] with one
+        request per source, falling back to the next source when a source
+        returns nothing valid. sources restricts (and orders) the sources
+        tried; default is every source in priority order.
+        """
+        for source_enum in sources or self.source_priority:
+            source = self.sources[source_enum]
+            
+            try:
+                async with self.source_slots[source_enum]:
+                    prices = await source.fetch_price_range(ticker, start_date, end_date)
+                valid = [
+                    price_data for price_data in prices
+                    if start_date <= price_data.date <= end_date and self._validate_price_data(price_data)
+                ]
+                if len(valid) < len(prices):
+                    logger.warning(f"Dropped {len(prices) - len(valid)} invalid prices for {ticker} from {source.name}")
+                if valid:
+                    logger.info(f"Fetched {len(valid)} {ticker} prices from {source.name} for {start_date}..{end_date}")
+                    return valid
+                
+            except Exception as e:
+                logger.warning(f"Source {source.name} failed for {ticker}: {e}")
+                continue
+        
+        logger.error(f"All sources failed for {ticker} from {start_date} to {end_date}")
+        return []
+    
     async def fetch_batch_prices(self, tickers: List[str], target_date: date, 
                                 max_concurrent: int = 10) -> Dict[str, PriceData]:
-        """Fetch price data for multiple tickers concurrently."""
+        """
+        Fetch price data for multiple tickers.
+        
+        All tickers are first fetched with grouped YFinance requests; only the
+        tickers missing from those results (or failing validation) go through
+        the per-ticker source fallback, concurrently.
+        """
+        price_data_dict = {}
+        yfinance = self.sources[DataSource.YFINANCE]
+        async with self.source_slots[DataSource.YFINANCE]:
+            history = await yfinance.fetch_batch_history(
+                tickers,
+                target_date - timedelta(days=PRICE_WINDOW_DAYS),
+                target_date + timedelta(days=PRICE_WINDOW_DAYS)
+            )
+        for ticker, prices in history.items():
+            price_data = closest_price(prices, target_date)
+            if price_data and self._validate_price_data(price_data):
+                price_data_dict[ticker] = price_data
+        
+        remaining = [ticker for ticker in tickers if ticker not in price_data_dict]
+        if not remaining:
+            return price_data_dict
+        logger.info(f"Falling back to per-ticker fetches for {len(remaining)}/{len(tickers)} tickers")
+        
         semaphore = asyncio.Semaphore(max_concurrent)
         
         async def fetch_single(ticker: str) -> Tuple[str, Optional[PriceData]]:
@@ -329,10 +694,9 @@ class PriceDataFetcher:
                 price_data = await self.fetch_price_data(ticker, target_date)
                 return ticker, price_data
         
-        tasks = [fetch_single(ticker) for ticker in tickers]
+        tasks = [fetch_single(ticker) for ticker in remaining]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        price_data_dict = {}
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"Batch fetch error: {result}")
@@ -342,24 +706,161 @@ class PriceDataFetcher:
         return price_data_dict
 
 
+@dataclass
+class BackfillProgress:
+    """Progress counters of a backfill run, with throughput-based ETA."""
+    total: int
+    completed: int = 0
+    records_created: int = 0
+    errors: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    last_logged_at: float = field(default_factory=time.monotonic)
+    
+    def record(self, records_created: int = 0, failed: bool = False):
+        self.completed += 1
+        self.records_created += records_created
+        self.errors += failed
+    
+    def eta_seconds(self) -> Optional[float]:
+        elapsed = time.monotonic() - self.started_at
+        if not self.completed or not elapsed:
+            return None
+        return (self.total - self.completed) / (self.completed / elapsed)
+    
+    def log(self, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self.last_logged_at < BACKFILL_PROGRESS_INTERVAL:
+            return
+        self.last_logged_at = now
+        eta = self.eta_seconds()
+        eta_text = str(timedelta(seconds=int(eta))) if eta is not None else "unknown"
+        logger.info(f"Backfill progress: {self.completed}/{self.total} securities, "
+                   f"{self.records_created} records, {self.errors} errors, ETA {eta_text}")
+
+
 class HistoricalDataBackfiller:
     """Historical data backfill system."""
     
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, fetcher: Optional[PriceDataFetcher] = None,
+                 session_factory: Optional[async_sessionmaker] = None):
         self.session = session
-        self.fetcher = PriceDataFetcher()
+        self.fetcher = fetcher or PriceDataFetcher()
+        # Concurrent backfills each use their own session from the engine's pool;
+        # an AsyncSession must not be shared between tasks
+        self.session_factory = session_factory
     
     def _is_trading_day(self, check_date: date) -> bool:
-        """Check if date is a trading day (weekday)."""
-        return check_date.weekday() < 5  # Monday = 0, Friday = 4
+        """Check if date is a trading day (NYSE open)."""
+        return is_trading_day(check_date)
+    
+    def _adjacent_trading_day(self, check_date: date, step: int) -> date:
+        """Closest trading day before (step=-1) or after (step=1) a date."""
+        check_date += timedelta(days=step)
+        while not self._is_trading_day(check_date):
+            check_date += timedelta(days=step)
+        return check_date
+    
+    def _is_short_gap(self, range_start: date, range_end: date, existing_dates: Set[date]) -> bool:
+        """
+        Whether a missing range holds at most BACKFILL_SHORT_GAP_DAYS trading
+        days and the trading days on both sides of it are stored. Such gaps are
+        usually closures the calendar does not know about, not missing data.
+        """
+        missing = 0
+        current_date = range_start
+        while current_date <= range_end:
+            if self._is_trading_day(current_date) and current_date not in existing_dates:
+                missing += 1
+                if missing > BACKFILL_SHORT_GAP_DAYS:
+                    return False
+            current_date += timedelta(days=1)
+        return (
+            self._adjacent_trading_day(range_start, -1) in existing_dates
+            and self._adjacent_trading_day(range_end, 1) in existing_dates
+        )
+    
+    def _missing_ranges(self, start_date: date, end_date: date,
+                        existing_dates: Set[date]) -> List[Tuple[date, date]]:
+        """
+        Contiguous runs of trading days in [start_date, end_date] without stored
+        prices. Runs separated by at most BACKFILL_GAP_MERGE_DAYS stored trading
+        days are merged, trading a few re-fetched days for a request.
+        """
+        ranges: List[List] = []
+        stored_since_gap = 0
+        current_date = start_date
+        while current_date <= end_date:
+            if self._is_trading_day(current_date):
+                if current_date in existing_dates:
+                    stored_since_gap += 1
+                elif ranges and stored_since_gap <= BACKFILL_GAP_MERGE_DAYS:
+                    ranges[-1][1] = current_date
+                    stored_since_gap = 0
+                else:
+                    ranges.append([current_date, current_date])
+                    stored_since_gap = 0
+            current_date += timedelta(days=1)
+        return [(range_start, range_end) for range_start, range_end in ranges]
+    
+    @staticmethod
+    def _price_to_row(security_id, price_data: PriceData, now: datetime) -> Dict:
+        """DailyPrice column values of a fetched price (prices in cents)."""
+        return {
+            'id': uuid.uuid4(),
+            'security_id': security_id,
+            'price_date': price_data.date,
+            'open_price': int(price_data.open_price * 100),
+            'high_price': int(price_data.high_price * 100),
+            'low_price': int(price_data.low_price * 100),
+            'close_price': int(price_data.close_price * 100),
+            'volume': price_data.volume,
+            'adjusted_close': int(price_data.adjusted_close * 100) if price_data.adjusted_close else None,
+            'created_at': now,
+            'updated_at': now,
+        }
+    
+    async def _upsert_prices(self, session: AsyncSession, security_id, prices: List[PriceData]) -> int:
+        """Write prices with multi-row INSERT ... ON CONFLICT (security_id, price_date) DO UPDATE."""
+        from domains.securities.models import DailyPrice
+        
+        now = datetime.now(timezone.utc)
+        for start in range(0, len(prices), PRICE_UPSERT_CHUNK_SIZE):
+            rows = [
+                self._price_to_row(security_id, price_data, now)
+                for price_data in prices[start:start + PRICE_UPSERT_CHUNK_SIZE]
+            ]
+            stmt = pg_insert(DailyPrice).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['security_id', 'price_date'],
+                set_={
+                    name: stmt.excluded[name]
+                    for name in (
+                        'open_price', 'high_price', 'low_price', 'close_price',
+                        'volume', 'adjusted_close', 'updated_at'
+                    )
+                }
+            )
+            await session.execute(stmt)
+        return len(prices)
     
     async def backfill_security(self, security_id: str, start_date: date, 
                                end_date: date) -> int:
-        """Backfill historical data for a single security."""
+        """
+        Backfill historical data for a single security.
+        
+        Stored dates are loaded with one query; each missing range of trading
+        days is fetched with one provider request and the prices it returns
+        for unstored dates are bulk-upserted. Short gaps between stored days
+        are only asked of YFinance (see BACKFILL_SHORT_GAP_DAYS).
+        """
+        return await self._backfill_security(self.session, security_id, start_date, end_date)
+    
+    async def _backfill_security(self, session: AsyncSession, security_id: str,
+                                 start_date: date, end_date: date) -> int:
         from domains.securities.models import Security, DailyPrice
         
         # Get security
-        result = await self.session.execute(
+        result = await session.execute(
             select(Security).where(Security.id == security_id)
         )
         security = result.scalar_one_or_none()
@@ -368,87 +869,125 @@ class HistoricalDataBackfiller:
             logger.error(f"Security not found: {security_id}")
             return 0
         
-        records_created = 0
-        current_date = start_date
+        result = await session.execute(
+            select(DailyPrice.price_date).where(
+                DailyPrice.security_id == security.id,
+                DailyPrice.price_date.between(start_date, end_date)
+            )
+        )
+        existing_dates = set(result.scalars().all())
         
-        while current_date <= end_date:
-            if self._is_trading_day(current_date):
-                # Check if price data already exists
-                existing_result = await self.session.execute(
-                    select(DailyPrice).where(
-                        DailyPrice.security_id == security_id,
-                        DailyPrice.price_date == current_date
-                    )
-                )
-                existing_price = existing_result.scalar_one_or_none()
-                
-                if not existing_price:
-                    price_data = await self.fetcher.fetch_price_data(security.ticker, current_date)
-                    
-                    if price_data:
-                        daily_price = DailyPrice(
-                            security_id=security_id,
-                            price_date=current_date,
-                            open_price=int(price_data.open_price * 100),  # Convert to cents
-                            high_price=int(price_data.high_price * 100),
-                            low_price=int(price_data.low_price * 100),
-                            close_price=int(price_data.close_price * 100),
-                            volume=price_data.volume,
-                            adjusted_close=int(price_data.adjusted_close * 100) if price_data.adjusted_close else None
-                        )
-                        
-                        self.session.add(daily_price)
-                        records_created += 1
-                        
-                        if records_created % 100 == 0:
-                            await self.session.commit()
-                            logger.info(f"Backfilled {records_created} records for {security.ticker}")
-            
-            current_date += timedelta(days=1)
+        missing_ranges = self._missing_ranges(start_date, end_date, existing_dates)
+        logger.info(f"Backfilling {security.ticker}: {len(existing_dates)} stored days, "
+                   f"{len(missing_ranges)} missing ranges")
+        
+        records_created = 0
+        for range_start, range_end in missing_ranges:
+            sources = None
+            if self._is_short_gap(range_start, range_end, existing_dates):
+                sources = [DataSource.YFINANCE]
+            prices = await self.fetcher.fetch_price_range(security.ticker, range_start, range_end, sources)
+            # Merged ranges re-fetch a few stored days; providers may also return duplicates
+            new_prices = {}
+            for price_data in prices:
+                if price_data.date not in existing_dates:
+                    new_prices.setdefault(price_data.date, price_data)
+            if new_prices:
+                records_created += await self._upsert_prices(session, security.id, list(new_prices.values()))
+                existing_dates.update(new_prices)
+                await session.commit()
         
-        await self.session.commit()
         logger.info(f"Completed backfill for {security.ticker}: {records_created} records")
         return records_created
     
     async def backfill_all_securities(self, start_date: date, end_date: date, 
-                                     batch_size: int = 50) -> Dict[str, int]:
-        """Backfill historical data for all securities."""
+                                     batch_size: int = 50, max_concurrent: Optional[int] = None,
+                                     max_retries: int = BACKFILL_MAX_RETRIES) -> Dict[str, int]:
+        """
+        Backfill historical data for all securities concurrently.
+        
+        Up to max_concurrent securities (default: the fetcher's total provider
+        concurrency) are backfilled at once, each on its own session; provider
+        requests are further bounded per source by the fetcher. Securities whose
+        backfill raised are retried in up to max_retries later rounds. Progress
+        and ETA are logged every batch_size securities and every
+        BACKFILL_PROGRESS_INTERVAL seconds.
+        """
         from domains.securities.models import Security
         
         # Get all active securities
         result = await self.session.execute(
-            select(Security).where(Security.is_active == True)
+            select(Security.id, Security.ticker).where(Security.is_active == True)
         )
-        securities = result.scalars().all()
+        securities = result.all()
         
+        session_factory = self.session_factory or async_sessionmaker(
+            self.session.bind, class_=AsyncSession, expire_on_commit=False
+        )
+        workers = max(1, min(max_concurrent or self.fetcher.total_concurrency, len(securities)))
+        progress = BackfillProgress(total=len(securities))
+        logger.info(f"Backfilling {len(securities)} securities from {start_date} to {end_date} "
+                   f"with {workers} concurrent workers")
+        
+        pending = list(securities)
+        retried = 0
+        for attempt in range(max_retries + 1):
+            if attempt:
+                delay = BACKFILL_RETRY_DELAY * attempt
+                logger.info(f"Retrying {len(pending)} failed securities in {delay:.0f}s "
+                           f"(round {attempt}/{max_retries})")
+                await asyncio.sleep(delay)
+                retried += len(pending)
+                # Retried securities are counted again when they finish
+                progress.total += len(pending)
+            pending = await self._backfill_pass(
+                pending, start_date, end_date, session_factory, workers, progress, batch_size
+            )
+            if not pending:
+                break
+        
+        progress.log(force=True)
         results = {
             'total_securities': len(securities),
-            'records_created': 0,
-            'errors': 0,
-            'securities_processed': 0
+            'records_created': progress.records_created,
+            'errors': len(pending),
+            'securities_processed': len(securities) - len(pending),
+            'retried': retried,
+            'failed_securities': [ticker for _, ticker in pending],
         }
+        logger.info(f"Backfill completed: {results['records_created']} records created, "
+                   f"{results['errors']} errors")
+        return results
+    
+    async def _backfill_pass(self, securities: List, start_date: date, end_date: date,
+                             session_factory: async_sessionmaker, workers: int,
+                             progress: BackfillProgress, report_every: int) -> List:
+        """Backfill securities with a pool of worker tasks; returns the ones that failed."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for security in securities:
+            queue.put_nowait(security)
+        failed = []
         
-        for i in range(0, len(securities), batch_size):
-            batch = securities[i:i + batch_size]
-            
-            for security in batch:
+        async def worker():
+            while True:
                 try:
-                    records_created = await self.backfill_security(
-                        str(security.id), start_date, end_date
-                    )
-                    results['records_created'] += records_created
-                    results['securities_processed'] += 1
-                    
+                    security_id, ticker = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    async with session_factory() as session:
+                        records_created = await self._backfill_security(
+                            session, str(security_id), start_date, end_date
+                        )
+                    progress.record(records_created)
                 except Exception as e:
-                    results['errors'] += 1
-                    logger.error(f"Backfill error for {security.ticker}: {e}")
-            
-            logger.info(f"Processed batch {i//batch_size + 1}: "
-                       f"{results['securities_processed']}/{results['total_securities']} securities")
+                    failed.append((security_id, ticker))
+                    progress.record(failed=True)
+                    logger.error(f"Backfill error for {ticker}: {e}")
+                progress.log(force=report_every > 0 and progress.completed % report_every == 0)
         
-        logger.info(f"Backfill completed: {results['records_created']} records created, "
-                   f"{results['errors']} errors")
-        return results
+        await asyncio.gather(*(worker() for _ in range(min(workers, len(securities)))))
+        return failed
 
 
 # Example usage
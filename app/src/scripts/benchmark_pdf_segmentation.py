@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for trade entry segmentation in CongressionalPDFParser.
+
+Feeds a corpus of PTR text through parse_pdf_improved (with an in-memory
+stand-in for pdfplumber, so only text handling is measured) at increasing
+document sizes and reports the time per line. Per-line time should stay flat
+as documents grow; the run fails if it grows by more than --max-growth.
+
+The corpus is a directory of PTR text dumps (*.txt, one PDF's extracted text
+per file, form feeds between pages). The default, app/data/congress/ptr_text,
+holds the largest House PTRs in the FD CSVs (370-520 transactions each),
+rendered in the layout pdfplumber extracts from the House PTR PDFs: page and
+table headers, wrapped asset names and amounts, F S / S O / D detail lines.
+--csv-directory renders the largest filings of another set of CSVs, and
+--write-text-dumps saves a rendered corpus as text dumps.
+
+Parsers that copy or rescan the remaining lines for every trade entry only
+fall behind on documents of tens of thousands of lines, so the default scales
+grow the real filings to about 70,000 lines. With --baseline, the same
+documents are also parsed with pdf_parser.py as of another git revision and
+the results compared.
+
+Usage:
+    python scripts/benchmark_pdf_segmentation.py --baseline 5b296c4
+    python scripts/benchmark_pdf_segmentation.py --text-directory /data/ptr_text --scales 1,2,4
+    python scripts/benchmark_pdf_segmentation.py --csv-directory ../data/congress/csv --documents 10 \\
+        --write-text-dumps /tmp/ptr_text
+"""
+
+import argparse
+import csv
+import dataclasses
+import re
+import subprocess
+import sys
+import time
+import types
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+# Add the app directory to Python path
+app_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(app_dir))
+
+from domains.congressional import pdf_parser
+
+PDF_PARSER_PATH = 'app/src/domains/congressional/pdf_parser.py'
+DATA_DIR = app_dir.parent / 'data' / 'congress'
+SCALES = (1, 4, 16, 32)
+
+# Text lines per rendered PDF page, and width of the asset column before it wraps
+PAGE_LINES = 48
+ASSET_COLUMN_WIDTH = 34
+
+# Disclosure amount bands, by lower bound: wrapped amounts are cut after the " - "
+AMOUNT_BANDS = {
+    band.split(' - ')[0]: band for band in (
+        '$1 - $1,000', '$1,001 - $15,000', '$15,001 - $50,000', '$50,001 - $100,000',
+        '$100,001 - $250,000', '$250,001 - $500,000', '$500,001 - $1,000,000',
+        '$1,000,001 - $5,000,000', '$5,000,001 - $25,000,000', '$25,000,001 - $50,000,000',
+    )
+}
+UNWRAPPED_AMOUNTS = ('$1 - $1,000', '$1,001 - $15,000')
+
+# CSV rows carried over from earlier, misaligned extractions are not rendered
+DATE_PATTERN = re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$')
+TRANSACTION_TYPES = ('P', 'S', 'E', 'S (partial)')
+
+TABLE_HEADER = ["ID Owner Asset Transaction Date Notification Amount Cap.", "Type Date Gains >", "$200?"]
+
+# "<owner> <company> (<ticker>) [ST] ..." on a trade line
+ASSET_TICKER_PATTERN = re.compile(r'^(?:(?:SP|DC|JT) )?(.+?) \(([A-Z][A-Z.\-]{0,5})\) \[ST\]', re.MULTILINE)
+
+
+class TextPage:
+    """pdfplumber page stand-in holding already extracted text."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def extract_text(self) -> str:
+        return self.text
+
+    def close(self):
+        pass
+
+
+class TextPDF:
+    """pdfplumber PDF stand-in: one page per text chunk."""
+
+    def __init__(self, pages: List[str]):
+        self.pages = [TextPage(text) for text in pages]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def text_pdfplumber(documents: Dict[str, List[str]]) -> types.ModuleType:
+    """pdfplumber replacement whose open(path) returns the pages registered under path."""
+    module = types.ModuleType('text_pdfplumber')
+    module.open = lambda path: TextPDF(documents[path])
+    return module
+
+
+def load_text_dumps(text_directory: Path, limit: int) -> List[str]:
+    """PTR text dumps, one document per file (form feeds separate pages)."""
+    return [path.read_text(encoding='utf-8') for path in sorted(text_directory.glob('*.txt'))[:limit]]
+
+
+def _wrap(text: str, width: int) -> List[str]:
+    """Split text at spaces into lines of at most width characters (longer words are kept whole)."""
+    lines, current = [], ""
+    for word in text.split():
+        if current and len(current) + 1 + len(word) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    return lines + [current] if current else lines
+
+
+def is_well_formed(row: Dict[str, str]) -> bool:
+    """Whether a FD CSV row has its fields in the right columns."""
+    return bool(
+        DATE_PATTERN.match(row.get('Transaction Date', ''))
+        and DATE_PATTERN.match(row.get('Notification Date', ''))
+        and row.get('Transaction Type') in TRANSACTION_TYPES
+        and row.get('Amount', '').startswith('$')
+        and row.get('Asset')
+    )
+
+
+def render_transaction(row: Dict[str, str]) -> List[str]:
+    """Text lines pdfplumber extracts for one PTR table row."""
+    owner = row.get('Owner', '') if row.get('Owner') in ('SP', 'DC', 'JT') else ''
+    ticker = f" ({row['Ticker']})" if row.get('Ticker') else ""
+    asset = f"{row.get('Asset', '').strip()}{ticker} {'[ST]' if ticker else '[OT]'}"
+    amount = row.get('Amount', '').strip()
+    amount = AMOUNT_BANDS.get(amount.rstrip(' -'), amount if ' - ' in amount else '$1,001 - $15,000')
+
+    # Long asset names and amounts wrap inside their cells onto the next text line
+    asset_lines = _wrap(asset, ASSET_COLUMN_WIDTH)
+    amount_lines = [amount] if amount in UNWRAPPED_AMOUNTS else [amount.split(' - ')[0] + ' -', amount.split(' - ')[1]]
+    main = [owner, asset_lines[0], row.get('Transaction Type', ''), row.get('Transaction Date', ''),
+            row.get('Notification Date', ''), amount_lines[0]]
+    lines = [" ".join(part for part in main if part)]
+    wrapped = [" ".join(asset_lines[1:]), " ".join(amount_lines[1:])]
+    if any(wrapped):
+        lines.append(" ".join(part for part in wrapped if part))
+
+    lines.append(f"F S : {row.get('Filing Status') or 'New'}")
+    description = (row.get('Description') or '').strip()
+    if description.startswith('Subholding of:'):
+        lines.append(f"S O : {description.split(':', 1)[1].strip()}")
+    elif description:
+        lines.extend(_wrap(f"D : {description}", 100))
+    return lines
+
+
+def render_ptr_text(doc_id: str, filer: str, state_district: str, rows: List[Dict[str, str]]) -> str:
+    """A House PTR's extracted text: filer header, paginated transaction table, certification."""
+    body = []
+    for row in rows:
+        body.extend(render_transaction(row))
+    signed = max((datetime.strptime(row['Notification Date'], '%m/%d/%Y') for row in rows), default=None)
+    signed = signed.strftime('%m/%d/%Y') if signed else ''
+
+    pages = []
+    header = [
+        "Clerk of the House of Representatives \u2022 Legislative Resource Center \u2022 B81 Cannon Building \u2022 Washington, DC 20515",
+        "F I", f"Name: {filer}", "Status: Member", f"State/District: {state_district}", "T",
+    ]
+    while body or not pages:
+        page = (header if not pages else []) + TABLE_HEADER
+        taken = PAGE_LINES - len(page)
+        page += body[:taken]
+        body = body[taken:]
+        if not body:
+            page += [
+                "* For the complete list of asset type abbreviations, please visit https://fd.house.gov/reference/asset-type-codes.aspx.",
+                "I P O", "Yes No", "C S",
+                "I CERTIFY that the statements I have made on this form are true, complete and correct to the best of my knowledge and belief.",
+                f"Digitally Signed: {filer} , {signed}",
+            ]
+        page.append(f"Filing ID #{doc_id}")
+        pages.append("\n".join(page) + "\n")
+    return "\f".join(pages)
+
+
+def rebuild_from_csv(csv_directory: Path, limit: int) -> Dict[str, str]:
+    """
+    Extracted-text layout of the `limit` filings with the most well-formed
+    transaction rows in the yearly FD CSVs, by DocID.
+    """
+    filings: Dict[str, List[Dict[str, str]]] = OrderedDict()
+    districts: Dict[str, str] = {}
+    for csv_file in sorted(csv_directory.glob("[0-9][0-9][0-9][0-9]FD.csv")):
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row.get('DocID') and is_well_formed(row):
+                    filings.setdefault(row['DocID'], []).append(row)
+        index_file = csv_directory / f"{csv_file.stem}_docIDlist.csv"
+        if index_file.exists():
+            with open(index_file, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    districts[row.get('DocID', '')] = row.get('StateDst', '')
+
+    largest = sorted(filings.items(), key=lambda item: len(item[1]), reverse=True)[:limit]
+    documents = {}
+    for doc_id, rows in largest:
+        first = rows[0]
+        filer = " ".join(part for part in (first.get('Prefix'), first.get('FirstName'), first.get('LastName')) if part)
+        documents[doc_id] = render_ptr_text(doc_id, filer, districts.get(doc_id, ''), rows)
+    return documents
+
+
+def transaction_section(text: str) -> str:
+    """Text up to the certification block, so repeated copies stay in the transaction table."""
+    kept = []
+    for line in text.splitlines():
+        if line.strip().upper().startswith(pdf_parser.TRANSACTION_SECTION_END_MARKERS):
+            break
+        kept.append(line)
+    return "\n".join(kept) + "\n"
+
+
+def load_baseline_module(revision: str) -> types.ModuleType:
+    """Import pdf_parser.py as it was at a git revision."""
+    repo_root = app_dir.parent.parent
+    source = subprocess.check_output(
+        ['git', '-C', str(repo_root), 'show', f'{revision}:{PDF_PARSER_PATH}']
+    ).decode('utf-8')
+    module = types.ModuleType(f'pdf_parser_{revision}')
+    exec(compile(source, f'{revision}:{PDF_PARSER_PATH}', 'exec'), module.__dict__)
+    return module
+
+
+def make_parser(module: types.ModuleType, documents: List[str]):
+    """Parser seeded with the tickers and company names appearing in the corpus."""
+    tickers_company = {}
+    for text in documents:
+        for name, ticker in ASSET_TICKER_PATTERN.findall(text):
+            tickers_company.setdefault(ticker, name)
+    return module.CongressionalPDFParser(set(tickers_company), {'ST': 'Stocks'}, tickers_company)
+
+
+def run_scale(module: types.ModuleType, parser, document: str, scale: int, repeat: int):
+    """Best-of-`repeat` seconds to parse `scale` copies of the document's table, plus the records."""
+    body = transaction_section(document)
+    text = body * scale + document[len(body):]
+    pages = text.split('\f')
+    module.pdfplumber = text_pdfplumber({'benchmark.pdf': pages})
+
+    best = None
+    records = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = parser.parse_pdf_improved('benchmark.pdf', 'BENCH', 'Member')
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, text.count('\n') + 1, records
+
+
+def benchmark(module: types.ModuleType, documents: List[str], scales, repeat: int):
+    """Per-scale totals over the corpus: {scale: (seconds, lines, records)}."""
+    parser = make_parser(module, documents)
+    results = {}
+    for scale in scales:
+        seconds = lines = 0
+        records = []
+        for document in documents:
+            elapsed, line_count, document_records = run_scale(module, parser, document, scale, repeat)
+            seconds += elapsed
+            lines += line_count
+            records.extend(dataclasses.asdict(record) for record in document_records)
+        results[scale] = (seconds, lines, records)
+    return results
+
+
+def report(label: str, results) -> float:
+    """Print per-line timings by scale; returns the growth of per-line time from the smallest scale."""
+    print(f"{label}:")
+    base_per_line = None
+    growth = 1.0
+    for scale, (seconds, lines, records) in results.items():
+        per_line = seconds / max(lines, 1) * 1e6
+        base_per_line = base_per_line or per_line
+        growth = max(growth, per_line / base_per_line)
+        print(f"  x{scale:<3} {lines:>9,} lines  {seconds:8.3f}s  {per_line:7.2f} us/line  {len(records):>7,} records")
+    print(f"  per-line time growth: {growth:.2f}x")
+    return growth
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CongressionalPDFParser trade entry segmentation')
+    parser.add_argument('--text-directory', type=str, default=str(DATA_DIR / 'ptr_text'),
+                        help='Directory of PTR text dumps (*.txt)')
+    parser.add_argument('--csv-directory', type=str,
+                        help='Render the largest filings of the YYYYFD.csv files here instead of using text dumps')
+    parser.add_argument('--write-text-dumps', type=str, help='Write the rendered corpus to this directory and exit')
+    parser.add_argument('--documents', type=int, default=100, help='Number of documents in the corpus')
+    parser.add_argument('--scales', type=str, default=",".join(map(str, SCALES)),
+                        help='Comma-separated document size multiples')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per document and scale (best is reported)')
+    parser.add_argument('--max-growth', type=float, default=1.5,
+                        help='Fail if per-line time at the largest scale exceeds this multiple of the smallest')
+    parser.add_argument('--baseline', help='Git revision of pdf_parser.py to compare against')
+    args = parser.parse_args()
+
+    scales = tuple(int(scale) for scale in args.scales.split(','))
+    if args.csv_directory:
+        rendered = rebuild_from_csv(Path(args.csv_directory), args.documents)
+        documents = list(rendered.values())
+        source = f"{args.csv_directory} (rendered from FD CSV rows)"
+        if args.write_text_dumps:
+            output_directory = Path(args.write_text_dumps)
+            output_directory.mkdir(parents=True, exist_ok=True)
+            for doc_id, text in rendered.items():
+                (output_directory / f"{doc_id}.txt").write_text(text, encoding='utf-8')
+            print(f"Wrote {len(rendered)} text dumps to {output_directory}")
+            return 0
+    else:
+        documents = load_text_dumps(Path(args.text_directory), args.documents)
+        source = args.text_directory
+    if not documents:
+        print(f"No documents found in {source}")
+        return 1
+
+    print("PDF Trade Segmentation Benchmark")
+    print("=" * 50)
+    print(f"Corpus: {len(documents)} documents from {source}, scales={scales}, repeat={args.repeat}")
+
+    current = benchmark(pdf_parser, documents, scales, args.repeat)
+    growth = report("current", current)
+
+    if args.baseline:
+        baseline = benchmark(load_baseline_module(args.baseline), documents, scales, args.repeat)
+        report(args.baseline, baseline)
+        largest = scales[-1]
+        mismatches = sum(
+            1 for scale in scales if baseline[scale][2] != current[scale][2]
+        )
+        print(f"Speedup at x{largest}: {baseline[largest][0] / current[largest][0]:.2f}x, "
+              f"scales with differing records: {mismatches}")
+
+    if growth > args.max_growth:
+        print(f"FAIL: per-line time grew {growth:.2f}x (limit {args.max_growth:.2f}x)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
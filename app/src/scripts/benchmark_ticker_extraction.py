@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for ticker extraction in DataQualityEnhancer.
+
+Runs extract_ticker over a fixed corpus of real asset descriptions (the Asset
+column of the yearly House FD CSVs, in file order) and reports rows/sec with
+the extraction cache disabled. With --baseline, the same corpus is also run
+through data_quality.py as of another git revision and the results compared.
+
+Usage:
+    python scripts/benchmark_ticker_extraction.py
+    python scripts/benchmark_ticker_extraction.py --rows 20000 --baseline HEAD~1
+"""
+
+import argparse
+import csv
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+from typing import List
+
+# Add the app directory to Python path
+app_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(app_dir))
+
+from domains.congressional import data_quality
+
+DATA_QUALITY_PATH = 'app/src/domains/congressional/data_quality.py'
+
+
+def load_corpus(csv_directory: Path, rows: int) -> List[str]:
+    """First `rows` asset descriptions across the yearly FD CSVs."""
+    descriptions = []
+    for csv_file in sorted(csv_directory.glob("[0-9][0-9][0-9][0-9]FD.csv")):
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                descriptions.append(row.get('Asset', ''))
+                if len(descriptions) >= rows:
+                    return descriptions
+    return descriptions
+
+
+def load_baseline_module(revision: str) -> types.ModuleType:
+    """Import data_quality.py as it was at a git revision."""
+    repo_root = app_dir.parent.parent
+    source = subprocess.check_output(
+        ['git', '-C', str(repo_root), 'show', f'{revision}:{DATA_QUALITY_PATH}']
+    ).decode('utf-8')
+    module = types.ModuleType(f'data_quality_{revision}')
+    exec(compile(source, f'{revision}:{DATA_QUALITY_PATH}', 'exec'), module.__dict__)
+    return module
+
+
+def make_enhancer(module: types.ModuleType):
+    """Enhancer with result caching disabled (older revisions have no cache)."""
+    try:
+        return module.DataQualityEnhancer(cache_size=0)
+    except TypeError:
+        return module.DataQualityEnhancer()
+
+
+def benchmark(module: types.ModuleType, descriptions: List[str], repeat: int):
+    """Best-of-`repeat` rows/sec, plus the results of the last run."""
+    enhancer = make_enhancer(module)
+    best = None
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [enhancer.extract_ticker(description) for description in descriptions]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(descriptions) / best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DataQualityEnhancer.extract_ticker')
+    parser.add_argument('--csv-directory', type=str, default=str(app_dir.parent / 'data' / 'congress' / 'csv'),
+                        help='Directory containing the YYYYFD.csv files')
+    parser.add_argument('--rows', type=int, default=10000, help='Number of descriptions in the corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation (best is reported)')
+    parser.add_argument('--baseline', help='Git revision of data_quality.py to compare against')
+    args = parser.parse_args()
+
+    descriptions = load_corpus(Path(args.csv_directory), args.rows)
+    if not descriptions:
+        print(f"No descriptions found in {args.csv_directory}")
+        return 1
+
+    print("Ticker Extraction Benchmark")
+    print("=" * 50)
+    print(f"Corpus: {len(descriptions)} descriptions ({len(set(descriptions))} unique), repeat={args.repeat}")
+
+    current_rate, current_results = benchmark(data_quality, descriptions, args.repeat)
+    print(f"current:  {current_rate:,.0f} rows/sec")
+
+    if args.baseline:
+        baseline_rate, baseline_results = benchmark(load_baseline_module(args.baseline), descriptions, args.repeat)
+        mismatches = sum(
+            1 for old, new in zip(baseline_results, current_results) if tuple(old) != tuple(new)
+        )
+        print(f"{args.baseline}:  {baseline_rate:,.0f} rows/sec")
+        print(f"Speedup: {current_rate / baseline_rate:.2f}x, result mismatches: {mismatches}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,8 @@ Usage:
     
     
     docker exec -it capitolscope-dev python /app/src/scripts/import_congressional_data.py --csvs
+    docker exec -it capitolscope-dev python /app/src/scripts/import_congressional_data.py --csvs --workers 4
+    docker exec -it capitolscope-dev python /app/src/scripts/import_congressional_data.py --csvs --resume
     docker exec -it capitolscope-dev python /app/src/scripts/import_congressional_data.py --hybrid
     docker exec -it capitolscope-dev python /app/src/scripts/import_congressional_data.py --live
     docker exec -it capitolscope-dev python /app/src/scripts/import_congressional_data.py --live --years 2025
@@ -63,7 +65,7 @@ def resolve_data_path(input_path: str) -> Path:
     return (Path(__file__).parent / p).resolve()
 
 
-def import_from_csvs(csv_directory: str) -> Dict[str, Any]:
+def import_from_csvs(csv_directory: str, workers: int = 1, resumable: bool = False) -> Dict[str, Any]:
     """Import congressional data from existing CSV files."""
     logger.info("🗂️  Importing congressional data from CSV files...")
     
@@ -74,7 +76,9 @@ def import_from_csvs(csv_directory: str) -> Dict[str, Any]:
     with get_sync_db_session() as session:
         try:
             ingester = CongressionalDataIngestion(session=session)
-            results = ingester.import_congressional_data_from_csvs_sync(csv_directory)
+            results = ingester.import_congressional_data_from_csvs_sync(
+                csv_directory, workers=workers, resumable=resumable
+            )
             logger.info(f"✅ CSV import completed: {results}")
             
             # Print error summary to console and log
@@ -225,6 +229,17 @@ async def main():
         type=int,
         help='Specific years to fetch (for --live mode)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for CSV import (default: 1, sequential)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Checkpoint CSV import after each batch and resume interrupted files (sequential only)'
+    )
     parser.add_argument(
         '--skip-enrichment',
         action='store_true',
@@ -283,7 +298,7 @@ async def main():
         
         # Execute based on mode
         if args.csvs:
-            results = import_from_csvs(csv_dir)
+            results = import_from_csvs(csv_dir, workers=args.workers, resumable=args.resume)
             mode = "CSV Import"
             
         elif args.live:
@@ -293,7 +308,7 @@ async def main():
         elif args.hybrid:
             # First import existing CSVs
             logger.info("📁 Step 1: Importing existing CSV files...")
-            csv_results = import_from_csvs(csv_dir)
+            csv_results = import_from_csvs(csv_dir, workers=args.workers, resumable=args.resume)
             
             # Then fetch latest data (just 2025)
             logger.info("🔄 Step 2: Fetching latest live data...")
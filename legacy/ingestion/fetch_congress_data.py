@@ -23,7 +23,6 @@ import re
 import os
 import io
 import sys
-import time
 import datetime
 import asyncio
 import aiohttp
@@ -31,8 +30,9 @@ import nest_asyncio
 import logging
 from pathlib import Path
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from sqlalchemy import create_engine
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 # Configure logging
 def setup_logging(level=logging.INFO, log_file=None):
@@ -88,40 +88,105 @@ disk_engine = create_engine(f'sqlite:///{db_path}/congress_trades.db', echo=Fals
 # Import the get_tickers function
 from fetch_stock_data import get_tickers, get_tickers_company_dict
 from pdf_parsing_improvements import ImprovedPDFParser
+from pdf_cache import PDFContentStore, ParsedRecordCache, parser_version, mapping_fingerprint
+from rate_limiter import AIMDConfig, AdaptiveRateLimiter, THROTTLE_STATUS_CODES, host_of, parse_retry_after
 
 # Rate limiting configuration
-REQUEST_DELAY = 2.0  # 2 seconds between requests
+REQUEST_DELAY = 2.0  # Starting delay between requests; the adaptive limiter tunes it from there
+MAX_REQUEST_RATE = 5.0  # Upper bound on requests per second to the clerk site
+RATE_LIMIT_REDIS_URL = None  # Redis URL to share rate limit state across processes
 MAX_CONCURRENT_DOWNLOADS = 3  # Limit concurrent downloads
 MAX_RETRIES = 3  # Retry failed downloads
-RETRY_DELAY = 5.0  # 5 seconds between retries
+RETRY_DELAY = 5.0  # 5 seconds between retries of non-throttling failures
 
-def configure_rate_limiting(request_delay=2.0, max_concurrent=3, max_retries=3, retry_delay=5.0):
+def configure_rate_limiting(request_delay=2.0, max_concurrent=3, max_retries=3, retry_delay=5.0,
+                            max_rate=5.0, redis_url=None):
     """
     Configure rate limiting parameters for congressional data downloads.
     
     Parameters:
     -----------
     request_delay : float
-        Minimum seconds between requests (default: 2.0)
+        Initial seconds between requests; adapted up or down by server responses (default: 2.0)
     max_concurrent : int
         Maximum concurrent downloads (default: 3)
     max_retries : int
         Maximum retry attempts for failed downloads (default: 3)
     retry_delay : float
-        Seconds to wait between retry attempts (default: 5.0)
+        Seconds to wait between retry attempts after non-throttling errors (default: 5.0)
+    max_rate : float
+        Maximum requests per second the limiter may ramp up to (default: 5.0)
+    redis_url : str
+        Redis URL for rate limit state shared across processes (default: per process)
     """
-    global REQUEST_DELAY, MAX_CONCURRENT_DOWNLOADS, MAX_RETRIES, RETRY_DELAY
+    global REQUEST_DELAY, MAX_CONCURRENT_DOWNLOADS, MAX_RETRIES, RETRY_DELAY, MAX_REQUEST_RATE, RATE_LIMIT_REDIS_URL
     REQUEST_DELAY = request_delay
     MAX_CONCURRENT_DOWNLOADS = max_concurrent
     MAX_RETRIES = max_retries
     RETRY_DELAY = retry_delay
+    MAX_REQUEST_RATE = max_rate
+    RATE_LIMIT_REDIS_URL = redis_url
     
     logger.info("Rate limiting configured:")
-    logger.info(f"  Request delay: {REQUEST_DELAY}s")
+    logger.info(f"  Initial request delay: {REQUEST_DELAY}s")
+    logger.info(f"  Max request rate: {MAX_REQUEST_RATE}/s")
+    logger.info(f"  Shared state: {'Redis' if RATE_LIMIT_REDIS_URL else 'per process'}")
     logger.info(f"  Max concurrent: {MAX_CONCURRENT_DOWNLOADS}")
     logger.info(f"  Max retries: {MAX_RETRIES}")
     logger.info(f"  Retry delay: {RETRY_DELAY}s")
 
+# PDF parsing pool configuration
+PARSE_WORKERS = os.cpu_count() or 1  # Processes running pdfplumber off the event loop
+PARSE_QUEUE_SIZE = 20  # Downloaded PDFs waiting to be parsed before fetchers block
+USE_PARSE_CACHE = True  # Reuse cached parse results keyed on PDF hash and parser version
+
+def configure_parsing(parse_workers=None, queue_size=20, use_parse_cache=True):
+    """
+    Configure the PDF parsing process pool.
+    
+    Parameters:
+    -----------
+    parse_workers : int, optional
+        Number of parser processes (default: CPU count). 0 parses inline on the event loop.
+    queue_size : int
+        Maximum downloaded PDFs waiting to be parsed; fetchers pause while the queue is full (default: 20)
+    use_parse_cache : bool
+        Reuse cached parse results for unchanged PDFs (default: True)
+    """
+    global PARSE_WORKERS, PARSE_QUEUE_SIZE, USE_PARSE_CACHE
+    PARSE_WORKERS = (os.cpu_count() or 1) if parse_workers is None else parse_workers
+    PARSE_QUEUE_SIZE = max(1, queue_size)
+    USE_PARSE_CACHE = use_parse_cache
+    
+    logger.info("PDF parsing configured:")
+    logger.info(f"  Parse workers: {PARSE_WORKERS}")
+    logger.info(f"  Parse queue size: {PARSE_QUEUE_SIZE}")
+    logger.info(f"  Parse cache: {'enabled' if USE_PARSE_CACHE else 'disabled'}")
+
+# Per-process parser and parse cache used by the parsing pool (built once by _init_parse_worker)
+_worker_parser = None
+_worker_cache = None
+
+def _init_parse_worker(tickers: set, asset_dict: dict, tickers_company: dict, parse_cache=None):
+    """Process pool initializer: build the ImprovedPDFParser once per worker process."""
+    global _worker_parser, _worker_cache
+    _worker_parser = ImprovedPDFParser(
+        tickers=tickers,
+        asset_dict=asset_dict,
+        tickers_company=tickers_company
+    )
+    _worker_cache = parse_cache
+
+def _parse_pdf_cached(parser, parse_cache, pdf_path: str, pdf_hash: str, doc_id: str, member: str) -> Tuple[list, str]:
+    """Parse one PDF through the parse cache when available; returns (records, cache status)."""
+    if parse_cache is not None and pdf_hash:
+        return parse_cache.parse(parser, pdf_path, pdf_hash, doc_id, member)
+    return parser.parse_pdf_improved(pdf_path=pdf_path, doc_id=doc_id, member=member), 'parsed'
+
+def _parse_pdf_worker(pdf_path: str, pdf_hash: str, doc_id: str, member: str) -> Tuple[list, str]:
+    """Parse one PDF inside a pool worker and return its TradeRecords and cache status."""
+    return _parse_pdf_cached(_worker_parser, _worker_cache, pdf_path, pdf_hash, doc_id, member)
+
 # Define the CongressTrades class
 class CongressTrades:
     """
@@ -161,8 +226,8 @@ class CongressTrades:
         A DataFrame of congressional trading data.
     download_semaphore : asyncio.Semaphore
         A semaphore to limit the number of concurrent downloads.
-    last_request_time : float
-        The time of the last request.
+    rate_limiter : AdaptiveRateLimiter
+        AIMD token-bucket limiter pacing requests per host.
     root_path : Path
         The root path of the project.
     disk_engine : sqlalchemy.engine.Engine
@@ -175,10 +240,14 @@ class CongressTrades:
         Download and parse a PDF with retry logic for rate limiting.
     download_and_parse_pdf(self, session, doc_id, member) -> pd.DataFrame:
         Download and parse a PDF.
+    download_pdf_with_retry(self, session, doc_id) -> str:
+        Download a PDF to disk with retry logic for rate limiting.
+    parse_pdf(self, pdf_file_path, doc_id, member, clean=True) -> pd.DataFrame:
+        Parse a PDF on disk, in the parsing process pool when one is active.
     get_trades_by_member(self, member_list = None) -> pd.DataFrame:
         Get the congressional trading data for the year.
-    rate_limit_delay(self) -> None:
-        Ensure minimum delay between requests.
+    rate_limit_delay(self, url) -> None:
+        Wait for the rate limiter before a request to url.
     get_asset_type_dict(self) -> dict:
         Get a dictionary of asset types and their corresponding descriptions.
     get_congress_trading_data(self) -> pd.DataFrame:
@@ -229,7 +298,11 @@ class CongressTrades:
     
         # Rate limiting semaphore
         self.download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
-        self.last_request_time = 0
+        initial_rate = 1.0 / REQUEST_DELAY if REQUEST_DELAY > 0 else MAX_REQUEST_RATE
+        self.rate_limiter = AdaptiveRateLimiter(
+            AIMDConfig(initial_rate=min(initial_rate, MAX_REQUEST_RATE), max_rate=MAX_REQUEST_RATE),
+            redis_url=RATE_LIMIT_REDIS_URL
+        )
         
         logger.info("Loading stock tickers and asset data...")
         self.tickers = get_tickers()
@@ -252,6 +325,22 @@ class CongressTrades:
             tickers_company=self.tickers_company
         )
 
+        # Content-addressed PDF store (sha256 -> PDF) and parse result cache
+        self.pdf_store = PDFContentStore(self.pdf_path)
+        self.parse_cache = None
+        if USE_PARSE_CACHE:
+            self.parse_cache = ParsedRecordCache(
+                cache_dir=str(self.root_path / 'data' / 'congress' / 'pdf_cache'),
+                parser_version=parser_version(),
+                mapping_fingerprint=mapping_fingerprint(set(self.tickers), self.asset_dict, self.tickers_company)
+            )
+            logger.info(f"Parse cache: parser version {self.parse_cache.parser_version}, "
+                        f"mapping fingerprint {self.parse_cache.mapping_fingerprint}")
+        self.parse_cache_stats = {'hit': 0, 'revalidated': 0, 'parsed': 0}
+
+        # Process pool for PDF parsing, created for the duration of get_trades_by_member
+        self.parse_executor = None
+
         # Apply nest_asyncio to allow nested use of asyncio.run()
         nest_asyncio.apply()
         logger.info("Starting trade data processing...")
@@ -308,22 +397,18 @@ class CongressTrades:
         return member_names
 
         
-    async def rate_limit_delay(self):
-        """Ensure minimum delay between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < REQUEST_DELAY:
-            await asyncio.sleep(REQUEST_DELAY - time_since_last)
-        self.last_request_time = time.time()
+    async def rate_limit_delay(self, url):
+        """Wait until the adaptive rate limiter allows a request to url's host"""
+        await self.rate_limiter.acquire(host_of(url))
 
         
     async def get_trades_by_member(self, member_list = None) -> pd.DataFrame:
         current_fd = str(self.year) + "FD"
         congress_data = self.get_congress_trading_data()
-        trades_by_member_df = pd.DataFrame()
         
-        # Prepare list of valid document IDs to download
+        # Prepare list of valid document IDs to download, and PDFs already on disk to parse
         doc_ids_to_download = []
+        existing_pdfs = []
         total_members = len(congress_data)
         valid_members = 0
         
@@ -339,51 +424,12 @@ class CongressTrades:
                 self.members.append(member)
                 
                 if doc_id.startswith("2"):
-                    # Check if PDF already exists to enable resume functionality
-                    pdf_file_path = self.pdf_path + doc_id + ".pdf"
-                    if Path(pdf_file_path).exists():
-                        logger.debug(f"PDF already exists for {doc_id}, skipping download")
-                        # Still try to parse the existing PDF
-                        try:
-                            existing_records = self.improved_parser.parse_pdf_improved(
-                                pdf_path=pdf_file_path,
-                                doc_id=doc_id,
-                                member=member
-                            )
-                            if existing_records:
-                                logger.debug(f"Parsed existing PDF {doc_id} with {len(existing_records)} records")
-                                
-                                # Get accurate names from docIDlist
-                                accurate_names = self.member_names.get(doc_id, {})
-                                prefix = accurate_names.get('prefix', '')
-                                first_name = accurate_names.get('first_name', '')
-                                last_name = accurate_names.get('last_name', member)  # Fallback to member if not found
-                                
-                                # Convert to DataFrame and add to results
-                                trade_dict = {
-                                    "Member": [], "Prefix": [], "FirstName": [], "LastName": [], "DocID": [], "Owner": [], "Asset": [], "Ticker": [],
-                                    "Transaction Type": [], "Transaction Date": [], "Notification Date": [],
-                                    "Amount": [], "Filing Status": [], "Description": []
-                                }
-                                for record in existing_records:
-                                    trade_dict["Member"].append(member)  # Use member key for consistency
-                                    trade_dict["Prefix"].append(prefix)
-                                    trade_dict["FirstName"].append(first_name)  # Use accurate first name
-                                    trade_dict["LastName"].append(last_name)    # Use accurate last name
-                                    trade_dict["DocID"].append(record.doc_id)
-                                    trade_dict["Owner"].append(record.owner)
-                                    trade_dict["Asset"].append(record.asset)
-                                    trade_dict["Ticker"].append(record.ticker)
-                                    trade_dict["Transaction Type"].append(record.transaction_type)
-                                    trade_dict["Transaction Date"].append(record.transaction_date)
-                                    trade_dict["Notification Date"].append(record.notification_date)
-                                    trade_dict["Amount"].append(record.amount)
-                                    trade_dict["Filing Status"].append(record.filing_status)
-                                    trade_dict["Description"].append(record.description)
-                                existing_df = pd.DataFrame(trade_dict)
-                                trades_by_member_df = pd.concat([existing_df, trades_by_member_df], ignore_index=True)
-                        except Exception as e:
-                            logger.error(f"Error parsing existing PDF {doc_id}: {e}")
+                    # Check if the PDF is already in the local store to enable resume functionality
+                    pdf_file_path = self.pdf_store.path_for(doc_id)
+                    if pdf_file_path is not None:
+                        logger.debug(f"PDF already stored for {doc_id}, skipping download")
+                        # Still parse the existing PDF (through the parse queue)
+                        existing_pdfs.append((doc_id, member, pdf_file_path))
                     else:
                         logger.debug(f"DocID download: {doc_id}")
                         doc_ids_to_download.append((doc_id, member))
@@ -408,14 +454,50 @@ class CongressTrades:
         else:
             logger.info("No new PDFs to download")
         
+        # Download/parse pipeline: fetchers put (doc_id, member, pdf_path, clean) on a bounded
+        # queue, parse consumers hand each PDF to the process pool. A full queue blocks the
+        # fetchers, so downloads never run more than PARSE_QUEUE_SIZE documents ahead of parsing.
+        parse_queue = asyncio.Queue(maxsize=PARSE_QUEUE_SIZE)
+        parsed_frames = []
+        consumer_count = max(1, PARSE_WORKERS)
+        
+        async def parse_consumer():
+            while True:
+                item = await parse_queue.get()
+                try:
+                    if item is None:
+                        return
+                    doc_id, member, pdf_file_path, clean = item
+                    parsed_df = await self.parse_pdf(pdf_file_path, doc_id, member, clean=clean)
+                    if parsed_df is not None and not parsed_df.empty:
+                        parsed_frames.append(parsed_df)
+                except Exception as e:
+                    logger.error(f"Parse consumer failed for {item[0]}: {e}")
+                finally:
+                    parse_queue.task_done()
+        
+        async def enqueue_existing_pdfs():
+            for doc_id, member, pdf_file_path in existing_pdfs:
+                await parse_queue.put((doc_id, member, pdf_file_path, False))
+        
         connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_DOWNLOADS, limit_per_host=MAX_CONCURRENT_DOWNLOADS)
         timeout = aiohttp.ClientTimeout(total=60)  # 60 second timeout
         
+        self.parse_executor = self._create_parse_executor()
+        consumers = [asyncio.create_task(parse_consumer()) for _ in range(consumer_count)]
+        existing_producer = asyncio.create_task(enqueue_existing_pdfs())
+        
         async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
             try:
                 successful_downloads = 0
                 failed_downloads = 0
                 
+                async def fetch_and_enqueue(doc_id, member):
+                    pdf_file_path = await self.download_pdf_with_retry(session, doc_id)
+                    if pdf_file_path is not None:
+                        await parse_queue.put((doc_id, member, pdf_file_path, True))
+                    return pdf_file_path
+                
                 # Process in batches
                 for i in range(0, total_docs, BATCH_SIZE):
                     batch = doc_ids_to_download[i:i + BATCH_SIZE]
@@ -427,9 +509,9 @@ class CongressTrades:
                     # Create tasks for this batch
                     batch_tasks = []
                     for doc_id, member in batch:
-                        batch_tasks.append(self.download_and_parse_pdf_with_retry(session, doc_id, member))
+                        batch_tasks.append(fetch_and_enqueue(doc_id, member))
                     
-                    # Execute batch with rate limiting
+                    # Execute batch with rate limiting; parsing of earlier PDFs continues meanwhile
                     batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
                     
                     # Process batch results
@@ -439,19 +521,14 @@ class CongressTrades:
                         if isinstance(result, Exception):
                             logger.error(f"Download task failed for {doc_id}: {result}")
                             failed_downloads += 1
-                        elif result is not None and not result.empty:
-                            trades_by_member_df = pd.concat([result, trades_by_member_df], ignore_index=True)
+                        elif result is not None:
                             successful_downloads += 1
                             batch_successful += 1
                         else:
                             failed_downloads += 1
                     
-                    logger.info(f"Batch {batch_num} completed: {batch_successful}/{len(batch)} successful")
-                    
-                    # Add a longer delay between batches to be respectful
-                    if i + BATCH_SIZE < total_docs:
-                        logger.debug(f"Waiting {RETRY_DELAY} seconds before next batch...")
-                        await asyncio.sleep(RETRY_DELAY)
+                    logger.info(f"Batch {batch_num} completed: {batch_successful}/{len(batch)} downloaded")
+                    self.pdf_store.save()
                 
                 if total_docs > 0:
                     success_rate = (successful_downloads / total_docs) * 100
@@ -460,8 +537,25 @@ class CongressTrades:
                         logger.warning(f"Failed downloads: {failed_downloads}")
               
             except Exception as e:
-                logger.error("get_trades_by_member:", e)
+                logger.error(f"get_trades_by_member: {e}")
+            finally:
+                # Drain the parse queue, then stop the consumers and the pool
+                await existing_producer
+                for _ in consumers:
+                    await parse_queue.put(None)
+                await asyncio.gather(*consumers, return_exceptions=True)
+                if self.parse_executor is not None:
+                    self.parse_executor.shutdown(wait=True)
+                    self.parse_executor = None
+                self.pdf_store.save()
         
+        logger.info(f"Parsed {len(parsed_frames)} PDFs with trade records")
+        logger.info(f"Parse cache: {self.parse_cache_stats['hit']} hits, "
+                    f"{self.parse_cache_stats['revalidated']} revalidated after mapping change, "
+                    f"{self.parse_cache_stats['parsed']} parsed")
+        trades_by_member_df = pd.concat(parsed_frames, ignore_index=True) if parsed_frames else pd.DataFrame(
+            columns=list(self._empty_trade_dict().keys())
+        )
         
         # Sort the DataFrame by Member and Transaction Date
         trades_by_member_df = trades_by_member_df.sort_values(by=['Member', 'Transaction Date'], ascending=[True, False])
@@ -803,39 +897,30 @@ class CongressTrades:
         
         return False
 
-    async def download_and_parse_pdf_with_retry(self, session, doc_id, member) -> pd.DataFrame:
+    def _create_parse_executor(self) -> Optional[ProcessPoolExecutor]:
         """
-        Download and parse PDF with retry logic for rate limiting
+        Create the process pool that runs parse_pdf_improved off the event loop.
+        Each worker builds its own ImprovedPDFParser once, from the loaded ticker and asset data.
+        Returns None (inline parsing) when PARSE_WORKERS is 0 or the pool cannot be started.
         """
-        async with self.download_semaphore:  # Limit concurrent downloads
-            for attempt in range(MAX_RETRIES):
-                try:
-                    # Rate limiting delay
-                    await self.rate_limit_delay()
-                    
-                    result = await self.download_and_parse_pdf(session, doc_id, member)
-                    if result is not None:
-                        return result
-                    else:
-                        logger.warning(f"No data returned for {doc_id}, attempt {attempt + 1}")
-                        
-                except Exception as e:
-                    logger.error(f"Attempt {attempt + 1} failed for {doc_id}: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        logger.info(f"Retrying {doc_id} in {RETRY_DELAY} seconds...")
-                        await asyncio.sleep(RETRY_DELAY)
-                    else:
-                        logger.error(f"All retry attempts failed for {doc_id}")
-                        
-            return pd.DataFrame()  # Return empty DataFrame if all attempts fail
+        if PARSE_WORKERS <= 0:
+            logger.info("Parsing PDFs inline on the event loop")
+            return None
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                initializer=_init_parse_worker,
+                initargs=(set(self.tickers), self.asset_dict, self.tickers_company, self.parse_cache)
+            )
+            logger.info(f"Started PDF parsing pool with {PARSE_WORKERS} workers")
+            return executor
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not start PDF parsing pool, parsing inline: {e}")
+            return None
 
-    async def download_and_parse_pdf(self, session, doc_id, member) -> pd.DataFrame:
-        """
-        Download and parse a financial disclosure PDF to extract structured trade data.
-        Handles multi-line trade entries robustly.
-        """
-        
-        trade_dict = {
+    @staticmethod
+    def _empty_trade_dict() -> Dict[str, list]:
+        return {
             "Member": [],
             "Prefix": [],
             "FirstName": [],
@@ -851,99 +936,181 @@ class CongressTrades:
             "Filing Status": [],
             "Description": []
         }
-            
-        pdf_file_name = doc_id + ".pdf"
 
-        # Define the URL of the zip file
-        url = "https://disclosures-clerk.house.gov/public_disc/ptr-pdfs/" + str(self.year) + '/' + pdf_file_name
-        
+    def _records_to_dataframe(self, records: list, doc_id: str, member: str, clean: bool = True) -> pd.DataFrame:
+        """
+        Convert parsed TradeRecords to the output DataFrame format.
+        With clean=True malformed rows are skipped and fields validated (freshly downloaded PDFs);
+        otherwise records are copied as parsed (PDFs already on disk).
+        """
         # Get accurate names from docIDlist
         accurate_names = self.member_names.get(doc_id, {})
         prefix = accurate_names.get('prefix', '')
         first_name = accurate_names.get('first_name', '')
         last_name = accurate_names.get('last_name', member)  # Fallback to member if not found
-        full_name = accurate_names.get('full_name', member)
         
-        # Send a GET request to download the zip file
+        trade_dict = self._empty_trade_dict()
+        for record in records:
+            if clean:
+                # Skip malformed rows entirely
+                if self._is_malformed_row(record):
+                    logger.debug(f"Skipping malformed record for {doc_id}: {record.asset}")
+                    continue
+                
+                # Validate and clean the record
+                cleaned_record = self._validate_and_clean_trade_record(
+                    record, member, prefix, first_name, last_name
+                )
+                for key, value in cleaned_record.items():
+                    trade_dict[key].append(value)
+            else:
+                trade_dict["Member"].append(member)  # Use member key for consistency
+                trade_dict["Prefix"].append(prefix)
+                trade_dict["FirstName"].append(first_name)  # Use accurate first name
+                trade_dict["LastName"].append(last_name)    # Use accurate last name
+                trade_dict["DocID"].append(record.doc_id)
+                trade_dict["Owner"].append(record.owner)
+                trade_dict["Asset"].append(record.asset)
+                trade_dict["Ticker"].append(record.ticker)
+                trade_dict["Transaction Type"].append(record.transaction_type)
+                trade_dict["Transaction Date"].append(record.transaction_date)
+                trade_dict["Notification Date"].append(record.notification_date)
+                trade_dict["Amount"].append(record.amount)
+                trade_dict["Filing Status"].append(record.filing_status)
+                trade_dict["Description"].append(record.description)
+        
+        pdf_df = pd.DataFrame(trade_dict)
+        if clean:
+            pdf_df = pdf_df.sort_values(by=['Member', 'Transaction Date'], ascending=[True, False])
+            pdf_df.reset_index(drop=True, inplace=True)
+        return pdf_df
+
+    async def parse_pdf(self, pdf_file_path: str, doc_id: str, member: str, clean: bool = True) -> pd.DataFrame:
+        """
+        Parse a PDF on disk with the improved parser and return its trades as a DataFrame.
+        Parsing runs in the process pool when one is active so the event loop keeps downloading.
+        """
+        pdf_hash = self.pdf_store.hash_for(doc_id)
+        try:
+            logger.info(f"Parsing {doc_id} with improved parser...")
+            if self.parse_executor is not None:
+                loop = asyncio.get_running_loop()
+                improved_records, cache_status = await loop.run_in_executor(
+                    self.parse_executor, _parse_pdf_worker, pdf_file_path, pdf_hash, doc_id, member
+                )
+            else:
+                improved_records, cache_status = _parse_pdf_cached(
+                    self.improved_parser, self.parse_cache, pdf_file_path, pdf_hash, doc_id, member
+                )
+        except Exception as e:
+            logger.error(f"Improved parser failed for {doc_id}: {e}")
+            return pd.DataFrame()
+        self.parse_cache_stats[cache_status] += 1
+        if cache_status != 'parsed':
+            logger.debug(f"Parse cache {cache_status} for {doc_id}")
+        
+        if not improved_records:
+            logger.warning(f"No records found for {doc_id} with improved parser")
+            return pd.DataFrame()
+        
+        logger.info(f"Improved parser found {len(improved_records)} records for {doc_id}")
+        return self._records_to_dataframe(improved_records, doc_id, member, clean=clean)
+
+    async def download_pdf_with_retry(self, session, doc_id) -> Optional[str]:
+        """
+        Download a PDF with retry logic for rate limiting.
+        Returns the local PDF path, or None if all attempts fail.
+        """
+        async with self.download_semaphore:  # Limit concurrent downloads
+            for attempt in range(MAX_RETRIES):
+                try:
+                    pdf_file_path = await self.download_pdf(session, doc_id)
+                    if pdf_file_path is not None:
+                        return pdf_file_path
+                    else:
+                        logger.warning(f"No data returned for {doc_id}, attempt {attempt + 1}")
+                        
+                except aiohttp.ClientResponseError as e:
+                    # Throttled: the rate limiter has already backed off, so retry at its pace
+                    logger.warning(f"Attempt {attempt + 1} throttled for {doc_id} (HTTP {e.status})")
+                    if attempt == MAX_RETRIES - 1:
+                        logger.error(f"All retry attempts failed for {doc_id}")
+                except Exception as e:
+                    logger.error(f"Attempt {attempt + 1} failed for {doc_id}: {e}")
+                    if attempt < MAX_RETRIES - 1:
+                        logger.info(f"Retrying {doc_id} in {RETRY_DELAY} seconds...")
+                        await asyncio.sleep(RETRY_DELAY)
+                    else:
+                        logger.error(f"All retry attempts failed for {doc_id}")
+                        
+            return None
+
+    async def download_pdf(self, session, doc_id) -> Optional[str]:
+        """
+        Download a financial disclosure PDF into the content-addressed PDF store.
+        Returns the local PDF path, or None on a non-retryable HTTP error.
+        Raises aiohttp.ClientResponseError on HTTP 403/429 so the retry logic can back off.
+        """
+        pdf_file_name = doc_id + ".pdf"
+
+        # Define the URL of the PDF
+        url = "https://disclosures-clerk.house.gov/public_disc/ptr-pdfs/" + str(self.year) + '/' + pdf_file_name
+        
         try:
+            await self.rate_limit_delay(url)
             logger.info(f"Downloading: {doc_id} from URL: {url}")
             async with session.get(url) as response:
+                await self.rate_limiter.record_response(
+                    host_of(url), response.status, parse_retry_after(response.headers.get('Retry-After'))
+                )
                 # Check if the request was successful
-                if response.status == 403:
-                    logger.warning(f"Rate limited (HTTP 403) for {doc_id}")
+                if response.status in THROTTLE_STATUS_CODES:
+                    logger.warning(f"Rate limited (HTTP {response.status}) for {doc_id}")
                     raise aiohttp.ClientResponseError(
                         request_info=response.request_info,
                         history=response.history,
-                        status=403,
+                        status=response.status,
                         message="Rate limited"
                     )
                 elif response.status != 200:
                     logger.error(f"Failed to download {doc_id}: HTTP {response.status}")
                     return None
 
-                # Use the pdfplumber library to extract text from the PDF
                 content = await response.read()
-                with open(self.pdf_path + pdf_file_name, 'wb') as pdf_file:
-                    pdf_file.write(content)
+                pdf_hash, pdf_file_path = self.pdf_store.put(doc_id, content)
                 
-                logger.info(f"Downloaded: {doc_id} ({len(content)} bytes)")
-
-                # Use the improved parser to parse the PDF
-                try:
-                    logger.info(f"Parsing {doc_id} with improved parser...")
-                    improved_records = self.improved_parser.parse_pdf_improved(
-                        pdf_path=self.pdf_path + pdf_file_name,
-                        doc_id=doc_id,
-                        member=member
-                    )
-                    
-                    # Convert TradeRecord list to DataFrame
-                    if improved_records:
-                        logger.info(f"Improved parser found {len(improved_records)} records for {doc_id}")
-                        
-                        # Convert records to DataFrame format with validation and cleaning
-                        for record in improved_records:
-                            # Skip malformed rows entirely
-                            if self._is_malformed_row(record):
-                                logger.debug(f"Skipping malformed record for {doc_id}: {record.asset}")
-                                continue
-                            
-                            # Validate and clean the record
-                            cleaned_record = self._validate_and_clean_trade_record(
-                                record, member, prefix, first_name, last_name
-                            )
-                            
-                            # Add to trade dictionary
-                            for key, value in cleaned_record.items():
-                                trade_dict[key].append(value)
-                        
-                        pdf_df = pd.DataFrame(trade_dict)
-                        
-                        if pdf_df is not None:
-                            pdf_df = pdf_df.sort_values(by=['Member', 'Transaction Date'], ascending=[True, False])
-                            pdf_df.reset_index(drop=True, inplace=True)
-                        else:
-                            logger.warning(f"PDF DataFrame is empty: {doc_id}")
-                            pdf_df = pd.DataFrame()
-                        return pdf_df
-                    else:
-                        logger.warning(f"No records found for {doc_id} with improved parser")
-                        return pd.DataFrame()
-                        
-                except Exception as e:
-                    logger.error(f"Improved parser failed for {doc_id}: {e}")
-                    return pd.DataFrame()
+                logger.info(f"Downloaded: {doc_id} ({len(content)} bytes, sha256 {pdf_hash[:12]})")
+                return pdf_file_path
             
         except aiohttp.ClientResponseError as e:
-            if e.status == 403:
-                # Re-raise 403 errors for retry logic
+            if e.status in THROTTLE_STATUS_CODES:
+                # Re-raise throttling errors for retry logic
                 raise e
             else:
                 logger.error(f"HTTP error for {doc_id}: {e}")
                 return None
         except Exception as e:
-            logger.error("download_and_parse_pdf, try: ", e)
+            logger.error(f"download_pdf: {e}")
             return None
+
+    async def download_and_parse_pdf_with_retry(self, session, doc_id, member) -> pd.DataFrame:
+        """
+        Download and parse PDF with retry logic for rate limiting
+        """
+        pdf_file_path = await self.download_pdf_with_retry(session, doc_id)
+        if pdf_file_path is None:
+            return pd.DataFrame()  # Return empty DataFrame if all attempts fail
+        return await self.parse_pdf(pdf_file_path, doc_id, member)
+
+    async def download_and_parse_pdf(self, session, doc_id, member) -> pd.DataFrame:
+        """
+        Download and parse a financial disclosure PDF to extract structured trade data.
+        Handles multi-line trade entries robustly.
+        """
+        pdf_file_path = await self.download_pdf(session, doc_id)
+        if pdf_file_path is None:
+            return None
+        return await self.parse_pdf(pdf_file_path, doc_id, member)
     
     def get_doc_ids(self, trade_list) -> str:
         """
@@ -1034,13 +1201,23 @@ def main():
     parser.add_argument('year', type=int, nargs='?', default=None, 
                        help='Year to process (default: current year)')
     parser.add_argument('--delay', type=float, default=2.0,
-                       help='Delay between requests in seconds (default: 2.0)')
+                       help='Initial delay between requests in seconds, adapted to server responses (default: 2.0)')
+    parser.add_argument('--max-rate', type=float, default=5.0,
+                       help='Maximum requests per second the adaptive rate limiter may reach (default: 5.0)')
+    parser.add_argument('--redis-url', type=str, default=None,
+                       help='Redis URL to share rate limit state with other downloader processes')
     parser.add_argument('--concurrent', type=int, default=3,
                        help='Maximum concurrent downloads (default: 3)')
     parser.add_argument('--retries', type=int, default=3,
                        help='Maximum retry attempts (default: 3)')
     parser.add_argument('--retry-delay', type=float, default=5.0,
                        help='Delay between retries in seconds (default: 5.0)')
+    parser.add_argument('--parse-workers', type=int, default=None,
+                       help='PDF parser processes (default: CPU count, 0 = parse inline)')
+    parser.add_argument('--parse-queue', type=int, default=20,
+                       help='Downloaded PDFs allowed to wait for parsing before downloads pause (default: 20)')
+    parser.add_argument('--no-parse-cache', action='store_true',
+                       help='Re-parse every PDF instead of reusing cached parse results')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                        default='INFO', help='Set logging level (default: INFO)')
     parser.add_argument('--log-file', type=str, default=None,
@@ -1066,7 +1243,14 @@ def main():
         request_delay=args.delay,
         max_concurrent=args.concurrent,
         max_retries=args.retries,
-        retry_delay=args.retry_delay
+        retry_delay=args.retry_delay,
+        max_rate=args.max_rate,
+        redis_url=args.redis_url
+    )
+    configure_parsing(
+        parse_workers=args.parse_workers,
+        queue_size=args.parse_queue,
+        use_parse_cache=not args.no_parse_cache
     )
     
     year = args.year
@@ -0,0 +1,194 @@
+"""
+Content-addressed PDF store and parsed-record cache for the PTR downloader.
+
+PDFContentStore keeps each downloaded PDF once, under its sha256, with an
+index of DocID -> hash so a re-run never goes back to the network for a
+filing it already has.
+
+ParsedRecordCache memoizes ImprovedPDFParser output per PDF hash and parser
+version (a hash of the parser source). Each entry also records the ticker
+lookups made while parsing, so after a ticker/company mapping change only
+documents whose lookups now resolve differently are parsed again.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import logging
+logger = logging.getLogger('congress_data')
+
+import pdf_parsing_improvements
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write bytes to path via a temp file in the same directory and os.replace."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.' + path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def parser_version() -> str:
+    """Version of the PDF parser: hash of the pdf_parsing_improvements source."""
+    source = Path(pdf_parsing_improvements.__file__).read_bytes()
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def mapping_fingerprint(tickers: set, asset_dict: dict, tickers_company: dict) -> str:
+    """Hash of the ticker, asset type and company name mappings given to the parser."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(sorted(tickers)).encode('utf-8'))
+    digest.update(json.dumps(sorted(asset_dict.items())).encode('utf-8'))
+    digest.update(json.dumps(sorted(tickers_company.items())).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class PDFContentStore:
+    """
+    sha256-addressed PDF storage with a DocID index.
+
+    Layout under root:
+        objects/<hash[:2]>/<hash>.pdf
+        index.json    {doc_id: hash}
+
+    PDFs from the old <doc_id>.pdf layout in root are imported on first access.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.objects_path = self.root / 'objects'
+        self.index_path = self.root / 'index.json'
+        self.index: Dict[str, str] = {}
+        self._dirty = False
+
+        if self.index_path.exists():
+            try:
+                self.index = json.loads(self.index_path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read PDF store index {self.index_path}, rebuilding: {e}")
+        logger.debug(f"PDF store at {self.root}: {len(self.index)} indexed documents")
+
+    def object_path(self, pdf_hash: str) -> Path:
+        return self.objects_path / pdf_hash[:2] / f"{pdf_hash}.pdf"
+
+    def hash_for(self, doc_id: str) -> Optional[str]:
+        """Hash of the stored PDF for a DocID, importing a legacy <doc_id>.pdf if present."""
+        pdf_hash = self.index.get(doc_id)
+        if pdf_hash and self.object_path(pdf_hash).exists():
+            return pdf_hash
+
+        legacy_path = self.root / f"{doc_id}.pdf"
+        if legacy_path.exists():
+            pdf_hash, _ = self.put(doc_id, legacy_path.read_bytes())
+            return pdf_hash
+        return None
+
+    def path_for(self, doc_id: str) -> Optional[str]:
+        """Local path of the stored PDF for a DocID, or None if it has not been fetched."""
+        pdf_hash = self.hash_for(doc_id)
+        return str(self.object_path(pdf_hash)) if pdf_hash else None
+
+    def put(self, doc_id: str, content: bytes) -> Tuple[str, str]:
+        """Store PDF bytes for a DocID; returns (hash, path). Identical content is stored once."""
+        pdf_hash = hashlib.sha256(content).hexdigest()
+        path = self.object_path(pdf_hash)
+        if not path.exists():
+            _atomic_write(path, content)
+        if self.index.get(doc_id) != pdf_hash:
+            self.index[doc_id] = pdf_hash
+            self._dirty = True
+        return pdf_hash, str(path)
+
+    def save(self):
+        """Persist the DocID index if it changed."""
+        if not self._dirty:
+            return
+        _atomic_write(self.index_path, json.dumps(self.index, sort_keys=True).encode('utf-8'))
+        self._dirty = False
+
+
+class ParsedRecordCache:
+    """
+    Sidecar cache of parse_pdf_improved results.
+
+    Entries live at <cache_dir>/<hash[:2]>/<hash>.<parser_version>.pkl and hold the
+    TradeRecord list, the mapping fingerprint it was parsed under, and the asset ->
+    ticker lookups made during the parse. A fingerprint mismatch is revalidated by
+    re-running those lookups (and the record confidence scores, the other
+    mapping-dependent output) instead of re-reading the PDF.
+    """
+
+    def __init__(self, cache_dir: str, parser_version: str, mapping_fingerprint: str):
+        self.cache_dir = Path(cache_dir)
+        self.parser_version = parser_version
+        self.mapping_fingerprint = mapping_fingerprint
+
+    def entry_path(self, pdf_hash: str) -> Path:
+        return self.cache_dir / pdf_hash[:2] / f"{pdf_hash}.{self.parser_version}.pkl"
+
+    def parse(self, parser, pdf_path: str, pdf_hash: str, doc_id: str, member: str) -> Tuple[List, str]:
+        """
+        Parsed records for a PDF, from cache when still valid.
+        Returns (records, status) where status is 'hit', 'revalidated' or 'parsed'.
+        """
+        entry = self._load(pdf_hash)
+        if entry is not None:
+            if entry['mapping_fingerprint'] == self.mapping_fingerprint:
+                return entry['records'], 'hit'
+            if self._still_valid(parser, entry):
+                entry['mapping_fingerprint'] = self.mapping_fingerprint
+                self._store(pdf_hash, entry)
+                return entry['records'], 'revalidated'
+            logger.debug(f"Mapping change affects {doc_id}, re-parsing")
+
+        parser.ticker_lookups = {}
+        try:
+            records = parser.parse_pdf_improved(pdf_path=pdf_path, doc_id=doc_id, member=member)
+            ticker_lookups = parser.ticker_lookups
+        finally:
+            parser.ticker_lookups = None
+
+        self._store(pdf_hash, {
+            'mapping_fingerprint': self.mapping_fingerprint,
+            'ticker_lookups': ticker_lookups,
+            'records': records,
+        })
+        return records, 'parsed'
+
+    def _still_valid(self, parser, entry: dict) -> bool:
+        """Whether the current mappings reproduce every mapping-dependent result of the cached parse."""
+        for asset, ticker in entry['ticker_lookups'].items():
+            if parser._lookup_ticker(asset) != ticker:
+                return False
+        for record in entry['records']:
+            if parser._calculate_confidence_score(record) != record.confidence_score:
+                return False
+        return True
+
+    def _load(self, pdf_hash: str) -> Optional[dict]:
+        path = self.entry_path(pdf_hash)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable parse cache entry {path}: {e}")
+            return None
+
+    def _store(self, pdf_hash: str, entry: dict):
+        try:
+            _atomic_write(self.entry_path(pdf_hash), pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError as e:
+            logger.warning(f"Could not write parse cache entry for {pdf_hash}: {e}")
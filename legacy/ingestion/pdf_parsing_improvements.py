@@ -1,11 +1,18 @@
 import re
 import pandas as pd
 import pdfplumber
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+# Characters str.splitlines() treats as line boundaries
+LINE_BOUNDARIES = frozenset('\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029')
+
+# Lines that start the certification/signature block after the transaction table;
+# extraction stops there, so trailing boilerplate pages are never laid out
+TRANSACTION_SECTION_END_MARKERS = ('I CERTIFY', 'DIGITALLY SIGNED')
+
 @dataclass
 class TradeRecord:
     """Structured representation of a trade record"""
@@ -143,6 +150,10 @@ class ImprovedPDFParser:
         self.tickers_company = tickers_company
         self.validator = PDFParsingValidator()
         
+        # When set to a dict, every asset -> ticker resolution made while parsing is recorded
+        # here (used by the parse cache to tell whether a mapping change affects a document)
+        self.ticker_lookups: Optional[Dict[str, str]] = None
+        
         # Regex patterns for better field extraction
         self.ticker_pattern = r'\(([A-Z]{1,5})\)'
         self.amount_range_mapping = {
@@ -160,32 +171,67 @@ class ImprovedPDFParser:
         }
         
     def parse_pdf_improved(self, pdf_path: str, doc_id: str, member: str) -> List[TradeRecord]:
-        """Improved PDF parsing with better structure detection"""
+        """
+        Improved PDF parsing with better structure detection.
+        Text is streamed page by page and grouped into trade entries as it arrives;
+        extraction stops at the certification section after the transaction table.
+        """
         records = []
         
         with pdfplumber.open(pdf_path) as pdf:
-            pdf_text = "".join(page.extract_text() for page in pdf.pages)
-            
-        if not pdf_text.strip():
-            return records
-            
-        lines = pdf_text.splitlines()
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Look for trade entry starting lines
-            if self._is_trade_line_start(line):
-                record, lines_consumed = self._parse_trade_entry(lines[i:], doc_id, member)
+            for entry_lines in self._iter_trade_entries(self._iter_pdf_lines(pdf)):
+                record, _ = self._parse_trade_entry(entry_lines, doc_id, member)
                 if record:
                     records.append(record)
-                i += lines_consumed
-            else:
-                i += 1
                 
         return records
     
+    def _iter_pdf_lines(self, pdf) -> Iterator[str]:
+        """Yield text lines page by page, releasing each page's layout objects once extracted"""
+        pending = ""
+        for page in pdf.pages:
+            text = pending + (page.extract_text() or "")
+            close = getattr(page, 'close', None) or getattr(page, 'flush_cache', None)
+            if close:
+                close()
+            
+            lines = text.splitlines()
+            # Page texts are concatenated without a separator, so an unterminated
+            # last line continues on the next page
+            pending = lines.pop() if lines and text[-1] not in LINE_BOUNDARIES else ""
+            
+            for line in lines:
+                if line.strip().upper().startswith(TRANSACTION_SECTION_END_MARKERS):
+                    return
+                yield line
+        
+        if pending and not pending.strip().upper().startswith(TRANSACTION_SECTION_END_MARKERS):
+            yield pending
+    
+    def _iter_trade_entries(self, lines: Iterable[str]) -> Iterator[List[str]]:
+        """Group lines into trade entries: a trade start line plus the lines up to the next break"""
+        entry = None
+        for line in lines:
+            stripped = line.strip()
+            if self._is_trade_line_start(stripped):
+                if entry:
+                    yield entry
+                entry = [line]
+            elif entry is not None:
+                if self._is_entry_break(stripped):
+                    yield entry
+                    entry = None
+                else:
+                    entry.append(line)
+        if entry:
+            yield entry
+    
+    def _is_entry_break(self, line: str) -> bool:
+        """Section breaks that end a trade entry's continuation lines"""
+        if line.startswith("* For the") or line.startswith("Initial") or line.startswith("Asset"):
+            return True
+        return any(section in line.upper() for section in ["CERTIFICATION", "DIGITALLY SIGNED", "INITIAL PUBLIC"])
+    
     def _is_trade_line_start(self, line: str) -> bool:
         """Improved detection of trade line starts"""
         line = line.strip()
@@ -229,14 +275,8 @@ class ImprovedPDFParser:
         for i in range(1, len(lines)):  # Look ahead through all remaining lines
             line = lines[i].strip()
             
-            # Stop if we hit a new trade line
-            if self._is_trade_line_start(line):
-                break
-                
-            # Stop if we hit section breaks
-            if line.startswith("* For the") or line.startswith("Initial") or line.startswith("Asset"):
-                break
-            if any(section in line.upper() for section in ["CERTIFICATION", "DIGITALLY SIGNED", "INITIAL PUBLIC"]):
+            # Stop if we hit a new trade line or a section break
+            if self._is_trade_line_start(line) or self._is_entry_break(line):
                 break
                 
             if self._is_continuation_line(line):
@@ -748,6 +788,13 @@ class ImprovedPDFParser:
         return max(0.0, min(1.0, score))
 
     def _extract_ticker(self, asset: str) -> str:
+        """Extract ticker symbol from asset name, recording the lookup when ticker_lookups is set"""
+        ticker = self._lookup_ticker(asset)
+        if self.ticker_lookups is not None:
+            self.ticker_lookups[asset] = ticker
+        return ticker
+
+    def _lookup_ticker(self, asset: str) -> str:
         """Extract ticker symbol from asset name with case-insensitive matching and company name reverse lookup"""
         if not asset:
             return ""
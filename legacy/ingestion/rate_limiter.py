@@ -0,0 +1,134 @@
+"""
+Adaptive (AIMD) token-bucket rate limiter for the PTR downloader.
+
+One bucket per host is shared by every download task: a success raises the
+host's request rate additively, a 403/429 halves it (once per backoff window)
+and empties the bucket, so throughput settles at what the clerk site
+tolerates instead of a fixed delay.
+
+With a Redis URL the bucket state lives in Redis, using the keys and Lua
+scripts of the app's core.rate_limiting (loaded from app/src by path, so
+there is one copy), and concurrent runs of this script and the Celery sync
+workers share one budget per host. Without Redis, the in-process state and
+its AIMD updates are core.rate_limiting.LocalRateLimitBackend.
+"""
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Optional
+
+import logging
+logger = logging.getLogger('congress_data')
+
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+def _load_core_rate_limiting():
+    """
+    Load app/src/core/rate_limiting.py by path (the legacy scripts cannot import
+    the app package). It is the single copy of the Lua scripts, key prefix and
+    AIMD state updates; this module only adds the asyncio Redis client.
+    """
+    name = 'capitolscope_core_rate_limiting'
+    if name in sys.modules:
+        return sys.modules[name]
+    root = Path(__file__).resolve().parents[2]
+    # Repository checkout (legacy/ next to app/src/), or the homelab image (/app/legacy next to /app/src)
+    for candidate in (root / 'app' / 'src' / 'core' / 'rate_limiting.py', root / 'src' / 'core' / 'rate_limiting.py'):
+        if candidate.is_file():
+            spec = importlib.util.spec_from_file_location(name, candidate)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+            return module
+    raise ImportError(f"core/rate_limiting.py not found under {root}; the legacy downloader needs the app source tree")
+
+
+_core = _load_core_rate_limiting()
+
+AIMDConfig = _core.AIMDConfig
+THROTTLE_STATUS_CODES = _core.THROTTLE_STATUS_CODES
+REDIS_KEY_PREFIX = _core.REDIS_KEY_PREFIX
+host_of = _core.host_of
+parse_retry_after = _core.parse_retry_after
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD token bucket per host for asyncio tasks.
+
+    await acquire(host) before each request and call record_response(host,
+    status) after it. If Redis is configured but fails, the limiter keeps
+    going on in-process state.
+    """
+
+    def __init__(self, config: Optional[AIMDConfig] = None, redis_url: Optional[str] = None):
+        self.config = config or AIMDConfig()
+        self._local = _core.LocalRateLimitBackend()
+        self._redis = None
+        if redis_url:
+            if REDIS_AVAILABLE:
+                self._redis = redis_asyncio.Redis.from_url(redis_url, socket_timeout=5)
+                self._acquire_script = self._redis.register_script(_core.REDIS_ACQUIRE_SCRIPT)
+                self._feedback_script = self._redis.register_script(_core.REDIS_FEEDBACK_SCRIPT)
+            else:
+                logger.warning("redis package not installed, rate limits are per process")
+
+    def _disable_redis(self, error: Exception):
+        logger.warning(f"Shared rate limit state unavailable, using per-process limits: {error}")
+        self._redis = None
+
+    async def _take(self, host: str) -> float:
+        """Take a token if available; returns 0 or the seconds to wait before trying again."""
+        if self._redis is not None:
+            try:
+                return float(await self._acquire_script(
+                    keys=[REDIS_KEY_PREFIX + host], args=_core.acquire_script_args(self.config)
+                ))
+            except Exception as e:
+                self._disable_redis(e)
+        return self._local.acquire(host, self.config)
+
+    async def acquire(self, host: str) -> float:
+        """Wait until a request to host may be sent; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            wait = await self._take(host)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    async def record_response(self, host: str, status: int, retry_after: Optional[float] = None) -> float:
+        """Adapt the host's rate to a response status; returns the new rate."""
+        if status not in THROTTLE_STATUS_CODES and status >= 400:
+            return self._local.rate(host, self.config)
+        throttled = status in THROTTLE_STATUS_CODES
+        retry_after = retry_after or 0.0
+
+        rate = None
+        if self._redis is not None:
+            try:
+                rate = float(await self._feedback_script(
+                    keys=[REDIS_KEY_PREFIX + host],
+                    args=_core.feedback_script_args(self.config, throttled, retry_after)
+                ))
+            except Exception as e:
+                self._disable_redis(e)
+        if rate is None:
+            rate = self._local.feedback(host, self.config, throttled, retry_after)
+
+        if throttled:
+            logger.warning(f"{host} throttled request (HTTP {status}), rate now {rate:.3f} req/s")
+        return rate
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.close()
+
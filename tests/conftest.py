@@ -0,0 +1,29 @@
+"""
+Shared pytest setup: the app is imported from app/src, as in the containers
+(PYTHONPATH=/app/src).
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'app' / 'src'))
+
+# core.config needs these to build settings; the unit tests never connect
+for name, value in {
+    'SUPABASE_URL': 'https://test.supabase.co',
+    'SUPABASE_KEY': 'test',
+    'SUPABASE_SERVICE_ROLE_KEY': 'test',
+    'SUPABASE_PASSWORD': 'test',
+    'SUPABASE_JWT_SECRET': 'test',
+}.items():
+    os.environ.setdefault(name, value)
+
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+
+
+@pytest.fixture
+def fixtures_dir() -> Path:
+    return FIXTURES_DIR
@@ -0,0 +1,145 @@
+"""
+Senate eFD parsing on saved report pages and search results
+(tests/fixtures/senate_efd).
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+from domains.congressional.senate_sync import (
+    SENATE_PAPER_PTR_FILING_TYPE,
+    SENATE_PTR_FILING_TYPE,
+    parse_ptr_html,
+    parse_report_search_rows,
+    ptr_page_to_trade_records,
+)
+
+
+class RecordingIngestion:
+    """Stands in for CongressionalDataIngestion: keeps the CSV-shaped rows it is given."""
+
+    def __init__(self):
+        self.rows = []
+
+    def _parse_csv_row(self, row, row_num):
+        self.rows.append((row_num, row))
+        return row
+
+
+@pytest.fixture
+def efd_dir(fixtures_dir):
+    return fixtures_dir / 'senate_efd'
+
+
+@pytest.fixture
+def ptr_page(efd_dir):
+    return parse_ptr_html(str(efd_dir / 'ptr_electronic.html'))
+
+
+def test_parse_ptr_html_header(ptr_page):
+    assert ptr_page.first_name == 'Jane'
+    assert ptr_page.last_name == 'Doe'
+    assert ptr_page.filed_date == date(2024, 1, 10)
+    assert ptr_page.is_amendment is False
+    assert len(ptr_page.rows) == 4
+
+
+def test_parse_ptr_html_maps_cells_by_header(ptr_page):
+    row = ptr_page.rows[1]
+    assert row['#'] == '2'
+    assert row['Transaction Date'] == '12/18/2023'
+    assert row['Owner'] == 'Joint'
+    assert row['Ticker'] == 'GLBX'
+    assert row['Asset Name'] == 'Globex Corporation - Common Stock'
+    assert row['Asset Type'] == 'Stock'
+    assert row['Type'] == 'Sale (Full)'
+    assert row['Amount'] == '$15,001 - $50,000'
+    assert row['Comment'] == '--'
+    assert 'Asset Name Notes' not in row
+
+
+def test_parse_ptr_html_splits_asset_notes(ptr_page):
+    first, option = ptr_page.rows[0], ptr_page.rows[3]
+    assert first['Asset Name'] == 'Acme Widgets Inc'
+    # The &nbsp; before the ticker is normalized like any other whitespace
+    assert first['Asset Name Notes'] == 'Company: Acme Widgets Inc (ACME)'
+    assert option['Asset Name'] == 'Initech Holdings Inc (INIT)'
+    assert option['Asset Name Notes'] == 'Option Type: Call Strike price: $45.00 Expires: 06/21/2024'
+
+
+def test_parse_ptr_html_keeps_empty_cell_placeholder(ptr_page):
+    # '--' is left for ptr_page_to_trade_records to blank out
+    assert ptr_page.rows[2]['Ticker'] == '--'
+    assert ptr_page.rows[0]['Comment'] == '--'
+
+
+def test_parse_ptr_html_reads_file_objects(efd_dir, ptr_page):
+    with open(efd_dir / 'ptr_electronic.html', 'rb') as handle:
+        assert parse_ptr_html(handle).rows == ptr_page.rows
+
+
+def test_parse_ptr_html_amendment(efd_dir):
+    page = parse_ptr_html(str(efd_dir / 'ptr_amendment.html'))
+    assert page.is_amendment is True
+    assert page.filed_date == date(2024, 3, 5)
+    assert (page.first_name, page.last_name) == ('John', 'Roe')
+    assert [row['Ticker'] for row in page.rows] == ['UMBR']
+
+
+def test_ptr_page_to_trade_records(ptr_page):
+    ingestion = RecordingIngestion()
+    records = ptr_page_to_trade_records(ingestion, ptr_page, 'report-1')
+
+    assert [row_num for row_num, _ in ingestion.rows] == [1, 2, 3, 4]
+    assert [record['Transaction Type'] for record in records] == ['S', 'S', 'P', 'E']
+    assert [record['Asset'] for record in records] == [
+        'Acme Widgets Inc (ACME)',
+        'Globex Corporation - Common Stock (GLBX)',
+        'US Treasury Note 4.25% 12/31/2025',
+        'Initech Holdings Inc (INIT)',
+    ]
+
+    first = records[0]
+    assert first['DocID'] == 'report-1'
+    assert (first['Prefix'], first['FirstName'], first['LastName']) == ('Sen.', 'Jane', 'Doe')
+    assert first['Owner'] == 'Spouse'
+    assert first['Transaction Date'] == '12/15/2023'
+    assert first['Notification Date'] == '01/10/2024'
+    assert first['Filing Status'] == 'New'
+    assert first['Description'] == ''
+    assert records[2]['Description'] == 'Bought at auction'
+
+
+def test_ptr_page_to_trade_records_prefers_index_names_and_marks_amendments(efd_dir):
+    page = parse_ptr_html(str(efd_dir / 'ptr_amendment.html'))
+    records = ptr_page_to_trade_records(RecordingIngestion(), page, 'report-2', 'Johnathan A', 'Roe')
+    assert len(records) == 1
+    assert (records[0]['FirstName'], records[0]['LastName']) == ('Johnathan A', 'Roe')
+    assert records[0]['Filing Status'] == 'Amendment'
+    assert records[0]['Asset'] == 'Umbrella Pharmaceuticals Inc (UMBR)'
+
+
+def test_parse_report_search_rows(efd_dir):
+    payload = json.loads((efd_dir / 'search_results.json').read_text())
+    entries = parse_report_search_rows(payload['data'])
+
+    # The row with an unparseable filed date is dropped
+    assert [entry.doc_id for entry in entries] == [
+        '3f2b9c7e-1d4a-4e8b-9a6c-5b0d2e7f8a91',
+        '8c41d0a2-6e7f-4b3c-a2d9-0f1e5c6b7a84',
+        'A1B2C3D4-5E6F-7A8B-9C0D-E1F2A3B4C5D6',
+    ]
+    electronic, amended, paper = entries
+    assert electronic.filing_type == SENATE_PTR_FILING_TYPE and electronic.is_ptr
+    assert amended.filing_type == SENATE_PTR_FILING_TYPE
+    assert paper.filing_type == SENATE_PAPER_PTR_FILING_TYPE and not paper.is_ptr
+    assert paper.report_path == '/search/view/paper/A1B2C3D4-5E6F-7A8B-9C0D-E1F2A3B4C5D6/'
+    assert electronic.filing_date == date(2024, 1, 10)
+    assert electronic.year == 2024
+    assert (electronic.prefix, electronic.first_name, electronic.last_name) == ('Sen.', 'Jane Q', 'Doe')
+
+
+def test_parse_report_search_rows_skips_short_and_unlinked_rows():
+    assert parse_report_search_rows([['Jane', 'Doe'], ['Jane', 'Doe', 'Office', 'no link', '01/10/2024']]) == []